@@ -0,0 +1,120 @@
+import atexit
+import os
+import random
+import threading
+import time
+
+from django.conf import settings
+from django.db import close_old_connections
+
+DEFAULT_API_ACCESS_LOG = {
+    'MODE': 'raw',
+    'WINDOW_SECONDS': 60,
+    'SAMPLE_RATE': 0.0,
+}
+
+
+def get_api_access_log_config():
+    """settings.API_ACCESS_LOG ayarlarını varsayılanlarla birleştir"""
+    config = dict(DEFAULT_API_ACCESS_LOG)
+    config.update(getattr(settings, 'API_ACCESS_LOG', {}))
+    return config
+
+
+class ApiAccessAggregator:
+    """API erişimlerini (kullanıcı, endpoint, metod, zaman penceresi) bazında bellekte sayar.
+
+    Kapanan her pencere için `write` ile tek bir toplu kayıt yazılır. Sayaçlar her
+    çağrıda artırıldığı için ham kayıtlar örneklense bile toplamlar kesindir.
+    """
+
+    def __init__(self, write, window_seconds=60, sample_rate=0.0, clock=time.time):
+        self.write = write
+        self.window_seconds = window_seconds
+        self.sample_rate = sample_rate
+        self.clock = clock
+
+        self._counters = {}
+        self._lock = threading.Lock()
+        self._stop_event = threading.Event()
+        self._thread = None
+        self._pid = None
+
+    def record(self, user, endpoint, method, ip_address):
+        """Erişimi say; ham kaydın örneklenip yazılması gerekiyorsa True döndür"""
+        window_start = self.window_start(self.clock())
+        key = (window_start, user.pk if user else None, endpoint, method)
+        with self._lock:
+            entry = self._counters.get(key)
+            if entry is None:
+                entry = self._counters[key] = {'count': 0, 'user': user, 'ip_address': ip_address}
+            entry['count'] += 1
+            entry['ip_address'] = ip_address
+        self._ensure_worker()
+        return self.sample_rate > 0 and random.random() < self.sample_rate
+
+    def window_start(self, now):
+        return int(now // self.window_seconds * self.window_seconds)
+
+    def flush(self, force=False):
+        """Kapanmış pencereleri (force ile tümünü) yaz; yazılan kayıt sayısını döndür"""
+        current = self.window_start(self.clock())
+        with self._lock:
+            keys = [key for key in self._counters if force or key[0] < current]
+            pending = [(key, self._counters.pop(key)) for key in keys]
+        for (window_start, _, endpoint, method), entry in sorted(pending, key=lambda item: item[0][0]):
+            self.write(
+                entry['user'], endpoint, method, entry['ip_address'],
+                window_start, self.window_seconds, entry['count'],
+            )
+        return len(pending)
+
+    def stop(self):
+        self._stop_event.set()
+        self.flush(force=True)
+
+    def _ensure_worker(self):
+        pid = os.getpid()
+        if self._thread is not None and self._pid == pid and self._thread.is_alive():
+            return
+        with self._lock:
+            if self._thread is not None and self._pid == pid and self._thread.is_alive():
+                return
+            if self._pid is not None and self._pid != pid:
+                # Fork edilen süreç üst sürecin sayaçlarını tekrar yazmamalı
+                self._counters = {}
+            self._pid = pid
+            self._thread = threading.Thread(target=self._run, name='api-access-aggregator', daemon=True)
+            self._thread.start()
+
+    def _run(self):
+        while True:
+            now = self.clock()
+            # Bir sonraki pencere sınırından hemen sonra uyan
+            delay = self.window_start(now) + self.window_seconds - now + 0.05
+            if self._stop_event.wait(delay):
+                return
+            self.flush_in_worker()
+
+    def flush_in_worker(self):
+        """Arka plan iş parçacığından yaz; bu iş parçacığının bağlantısı istek döngüsü
+        dışında kaldığından yazımdan önce ve sonra bayat bağlantılar kapatılır"""
+        close_old_connections()
+        try:
+            self.flush()
+        finally:
+            close_old_connections()
+
+
+def create_api_access_aggregator(write):
+    """Ayarlar 'aggregate' modundaysa bir toplayıcı oluştur, değilse None döndür"""
+    config = get_api_access_log_config()
+    if config['MODE'] != 'aggregate':
+        return None
+    aggregator = ApiAccessAggregator(
+        write,
+        window_seconds=config['WINDOW_SECONDS'],
+        sample_rate=config['SAMPLE_RATE'],
+    )
+    atexit.register(aggregator.stop)
+    return aggregator
@@ -1,9 +1,19 @@
+import re
+from datetime import datetime, timedelta, timezone as dt_timezone
+
 from django.contrib import admin
 from django.contrib.auth.admin import UserAdmin
 from django.contrib.auth.models import User
 from rest_framework_simplejwt.tokens import RefreshToken
 from django.contrib.admin.models import LogEntry
 from django.contrib.admin import AdminSite
+from django.contrib.admin.options import IncorrectLookupParameters
+from django.contrib.admin.views.main import ChangeList, ORDER_VAR, PAGE_VAR
+from django.core.paginator import Paginator
+from django.db import connection
+from django.db.models import Q
+from django.utils.functional import cached_property
+from .fulltext import search_logs
 from .models import (
     Task, UserProfile, Team, TaskComment, TaskAttachment, TaskPriority, TaskSchedule, TaskRecurrence, TaskDependence, History, TaskReport, UserTeams, Log
 )
@@ -105,13 +115,182 @@ except admin.sites.NotRegistered:
     pass  # LogEntry zaten kayıtlı değilse geç
 admin.site.register(LogEntry, CustomLogEntryAdmin)
 
+LOG_CURSOR_VAR = 'cursor'
+EPOCH = datetime(1970, 1, 1, tzinfo=dt_timezone.utc)
+# Arama terimi bir IP adresi (veya başı) olabilir mi: yalnızca bu durumda ip_address taranır
+IP_PREFIX_RE = re.compile(r'^[0-9a-fA-F:.]*[.:][0-9a-fA-F:.]*$|^\d+$')
+
+
+def estimate_count(queryset, exact_limit=10000):
+    """COUNT(*) yerine satır sayısı tahmini döndür: (sayı, tahmini_mi)
+
+    PostgreSQL'de planlayıcının tahmini kullanılır; tahmin küçükse ya da başka bir
+    veritabanında en fazla `exact_limit` satır sayılır.
+    """
+    queryset = queryset.order_by()
+    if connection.vendor == 'postgresql':
+        sql, params = queryset.query.sql_with_params()
+        with connection.cursor() as cursor:
+            cursor.execute(f"EXPLAIN (FORMAT JSON) {sql}", params)
+            plan = cursor.fetchone()[0]
+        estimate = int(plan[0]['Plan']['Plan Rows'])
+        if estimate > exact_limit:
+            return estimate, True
+    count = queryset[:exact_limit + 1].count()
+    if count > exact_limit:
+        return exact_limit, True
+    return count, False
+
+
+class EstimatedCountPaginator(Paginator):
+    """Toplam sayıyı tam COUNT(*) yerine tahminle hesaplayan paginator"""
+
+    @cached_property
+    def count(self):
+        count, self.count_is_estimate = estimate_count(self.object_list)
+        return count
+
+
+def encode_log_cursor(direction, log):
+    micros = (log.timestamp - EPOCH) // timedelta(microseconds=1)
+    return f"{direction}.{micros}.{log.pk}"
+
+
+def decode_log_cursor(value):
+    """'n.<mikrosaniye>.<id>' biçimindeki imleci (yön, zaman, id) olarak çöz"""
+    try:
+        direction, micros, pk = value.split('.')
+        if direction not in ('n', 'p'):
+            raise ValueError(direction)
+        return direction, EPOCH + timedelta(microseconds=int(micros)), int(pk)
+    except (ValueError, OverflowError):
+        raise IncorrectLookupParameters(f"Geçersiz imleç: {value}")
+
+
+class LogChangeList(ChangeList):
+    """Varsayılan sıralamada OFFSET yerine (timestamp, id) keyset sayfalama kullanır"""
+
+    def get_results(self, request):
+        self.next_url = None
+        self.previous_url = None
+        self.keyset = ORDER_VAR not in self.params
+        if not self.keyset:
+            # Kullanıcı başka bir sütuna göre sıraladıysa klasik sayfalama
+            return super().get_results(request)
+
+        per_page = self.list_per_page
+        queryset = self.queryset
+        cursor = getattr(request, 'log_cursor', None)
+        has_next = has_previous = False
+        if not cursor:
+            rows = list(queryset[:per_page + 1])
+            has_next = len(rows) > per_page
+            rows = rows[:per_page]
+        else:
+            direction, timestamp, pk = decode_log_cursor(cursor)
+            if direction == 'n':
+                rows = list(
+                    queryset.filter(timestamp__lte=timestamp).exclude(timestamp=timestamp, pk__gte=pk)[:per_page + 1]
+                )
+                has_next = len(rows) > per_page
+                has_previous = True
+                rows = rows[:per_page]
+            else:
+                rows = list(
+                    queryset.filter(timestamp__gte=timestamp).exclude(timestamp=timestamp, pk__lte=pk)
+                    .order_by('timestamp', 'pk')[:per_page + 1]
+                )
+                has_previous = len(rows) > per_page
+                has_next = True
+                rows = rows[:per_page][::-1]
+
+        paginator = self.model_admin.get_paginator(request, queryset, per_page)
+        self.result_count = paginator.count
+        self.show_full_result_count = False
+        self.show_admin_actions = True
+        self.full_result_count = None
+        self.result_list = rows
+        self.can_show_all = False
+        self.multi_page = has_next or has_previous
+        self.paginator = paginator
+        if rows and has_next:
+            self.next_url = self.get_query_string({LOG_CURSOR_VAR: encode_log_cursor('n', rows[-1])})
+        if rows and has_previous:
+            self.previous_url = self.get_query_string({LOG_CURSOR_VAR: encode_log_cursor('p', rows[0])})
+
+
+class LogUserFilter(admin.ListFilter):
+    """Tüm kullanıcıları listelemek yerine kullanıcı adıyla filtreleyen kutu"""
+    title = 'kullanıcı'
+    parameter_name = 'user__username'
+    template = 'admin/base/log/user_filter.html'
+
+    def __init__(self, request, params, model, model_admin):
+        super().__init__(request, params, model, model_admin)
+        if self.parameter_name in params:
+            self.used_parameters[self.parameter_name] = params.pop(self.parameter_name)
+
+    def has_output(self):
+        return True
+
+    def expected_parameters(self):
+        return [self.parameter_name]
+
+    def queryset(self, request, queryset):
+        username = self.used_parameters.get(self.parameter_name)
+        if username:
+            return queryset.filter(user__username=username)
+        return queryset
+
+    def choices(self, changelist):
+        yield {
+            'parameter_name': self.parameter_name,
+            'value': self.used_parameters.get(self.parameter_name, ''),
+            'hidden_params': [
+                (key, value) for key, value in changelist.params.items()
+                if key not in (self.parameter_name, PAGE_VAR)
+            ],
+            'clear_url': changelist.get_query_string(remove=[self.parameter_name]),
+        }
+
+
 @admin.register(Log)
 class LogAdmin(admin.ModelAdmin):
     list_display = ['timestamp', 'level', 'log_type', 'user', 'action', 'ip_address']
-    list_filter = ['level', 'log_type', 'timestamp', 'user']
+    list_filter = ['level', 'log_type', 'timestamp', LogUserFilter]
+    list_select_related = ['user']
     search_fields = ['action', 'details', 'user__username', 'ip_address']
-    readonly_fields = ['timestamp', 'level', 'log_type', 'user', 'ip_address', 'action', 'details']
+    readonly_fields = ['timestamp', 'level', 'log_type', 'user', 'ip_address', 'action', 'details', 'event_code', 'payload']
     ordering = ['-timestamp']
+    paginator = EstimatedCountPaginator
+    show_full_result_count = False
+    
+    def get_changelist(self, request, **kwargs):
+        return LogChangeList
+    
+    def get_search_results(self, request, queryset, search_term):
+        """action/details aramasını LIKE taraması yerine tam metin indeksiyle yap;
+        kullanıcı adı ve IP adresi eşleşmeleri de sonuca eklenir"""
+        term = search_term.strip()
+        if term:
+            results = search_logs(queryset, term)
+            if results is not None:
+                extra = Q(user__username__istartswith=term)
+                if IP_PREFIX_RE.match(term):
+                    extra |= Q(ip_address__istartswith=term)
+                return results | queryset.filter(extra), False
+        return super().get_search_results(request, queryset, search_term)
+    
+    def lookup_allowed(self, lookup, value):
+        if lookup == LogUserFilter.parameter_name:
+            return True
+        return super().lookup_allowed(lookup, value)
+    
+    def changelist_view(self, request, extra_context=None):
+        """İmleç parametresini admin filtrelerine gitmeden ayır"""
+        request.GET = request.GET.copy()
+        request.log_cursor = request.GET.pop(LOG_CURSOR_VAR, [None])[-1]
+        return super().changelist_view(request, extra_context)
     
     def get_queryset(self, request):
         """Sadece admin kullanıcılarının loglarını göster"""
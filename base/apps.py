@@ -1,5 +1,26 @@
 from django.apps import AppConfig
+from django.db.models.signals import post_delete, post_migrate, post_save, pre_delete
 
 
 class BaseConfig(AppConfig):
     name = 'base'
+
+    def ready(self):
+        from .fulltext import ensure_fulltext_indexes
+        from .signals import task_deleted, task_saved
+        from .task_closure import dependence_deleted, dependence_saved, task_deleting
+        post_migrate.connect(ensure_fulltext_indexes, sender=self)
+
+        Task = self.get_model('Task')
+        post_save.connect(task_saved, sender=Task, dispatch_uid='task_saved')
+        post_delete.connect(task_deleted, sender=Task, dispatch_uid='task_deleted')
+
+        # Bağımlılık kapanış tablosu (base.task_closure)
+        pre_delete.connect(task_deleting, sender=Task, dispatch_uid='task_deleting')
+        TaskDependence = self.get_model('TaskDependence')
+        post_save.connect(dependence_saved, sender=TaskDependence, dispatch_uid='dependence_saved')
+        post_delete.connect(dependence_deleted, sender=TaskDependence, dispatch_uid='dependence_deleted')
+
+        # Görüntü eklerinin küçük resimleri (base.thumbnails)
+        from .thumbnails import attachment_saved
+        post_save.connect(attachment_saved, sender=self.get_model('TaskAttachment'), dispatch_uid='attachment_saved')
@@ -0,0 +1,322 @@
+import hashlib
+import mimetypes
+import os
+import re
+import tempfile
+import time
+from urllib.parse import quote
+
+from django.conf import settings
+from django.core.files.uploadedfile import UploadedFile
+from django.core.files.uploadhandler import FileUploadHandler, SkipFile
+from django.http import FileResponse, HttpResponse
+from django.template.defaultfilters import filesizeformat
+from django.utils.http import quote_etag
+from rest_framework.exceptions import ValidationError
+
+from .conditional import parse_etags
+
+DEFAULT_ATTACHMENT_STORAGE = {
+    # İçerik adresli blob'ların kök dizini
+    'ROOT': os.path.join(settings.BASE_DIR, 'attachments'),
+    # Tek dosya için üst sınır (bayt)
+    'MAX_SIZE': 50 * 1024 * 1024,
+    # Yükleme diske bu boyutta parçalar halinde yazılır
+    'CHUNK_SIZE': 64 * 1024,
+    # None: Django dosyayı kendisi akıtır; 'x-sendfile' (Apache) veya
+    # 'x-accel-redirect' (nginx): gönderim proxy'ye bırakılır
+    'SENDFILE': None,
+    # X-Accel-Redirect için ROOT'u gösteren internal nginx konumu
+    'ACCEL_PREFIX': '/protected-attachments/',
+    # Hiçbir eke bağlı olmayan blob'lar bu kadar saniye sonra silinebilir
+    'ORPHAN_GRACE_SECONDS': 3600,
+}
+
+RANGE_RE = re.compile(r'^bytes=(\d*)-(\d*)$')
+
+
+def get_attachment_config():
+    """settings.ATTACHMENT_STORAGE ayarlarını varsayılanlarla birleştir"""
+    config = dict(DEFAULT_ATTACHMENT_STORAGE)
+    config.update(getattr(settings, 'ATTACHMENT_STORAGE', {}))
+    return config
+
+
+def blob_relative_path(content_hash):
+    """ab/cd/abcd... — dizin başına dosya sayısı sınırlı kalsın diye iki seviye"""
+    return os.path.join(content_hash[:2], content_hash[2:4], content_hash)
+
+
+def blob_path(relative_path):
+    return os.path.join(get_attachment_config()['ROOT'], relative_path)
+
+
+class HashedUpload(UploadedFile):
+    """Depo dizinindeki geçici dosyaya yazılmış ve SHA-256'sı hesaplanmış yükleme"""
+
+    def __init__(self, file, name, content_type, size, charset, content_hash):
+        super().__init__(file, name, content_type, size, charset)
+        self.content_hash = content_hash
+
+    def temporary_file_path(self):
+        return self.file.name
+
+
+class HashingFileUploadHandler(FileUploadHandler):
+    """Multipart dosya parçalarını belleğe almadan diske yazar ve yazarken özetler.
+
+    Geçici dosya deponun kendi dizininde açılır; böylece içerik adresli yere
+    taşıma aynı dosya sisteminde atomik bir yeniden adlandırmadır. MAX_SIZE'ı
+    aşan dosya atlanır ve `rejected` listesine eklenir.
+    """
+
+    def __init__(self, request=None):
+        super().__init__(request)
+        config = get_attachment_config()
+        self.chunk_size = config['CHUNK_SIZE']
+        self.max_size = config['MAX_SIZE']
+        self.tmp_dir = os.path.join(config['ROOT'], 'tmp')
+        self.rejected = []
+        self.file = None
+
+    def new_file(self, *args, **kwargs):
+        super().new_file(*args, **kwargs)
+        if self.content_length is not None and self.content_length > self.max_size:
+            self.rejected.append(self.field_name)
+            raise SkipFile()
+        os.makedirs(self.tmp_dir, exist_ok=True)
+        self.file = tempfile.NamedTemporaryFile(dir=self.tmp_dir, prefix='upload-', delete=False)
+        self.digest = hashlib.sha256()
+        self.received = 0
+
+    def receive_data_chunk(self, raw_data, start):
+        self.received += len(raw_data)
+        if self.received > self.max_size:
+            self.rejected.append(self.field_name)
+            self.discard()
+            raise SkipFile()
+        self.digest.update(raw_data)
+        self.file.write(raw_data)
+        # Sonraki işleyicilere veri aktarılmaz
+
+    def file_complete(self, file_size):
+        self.file.flush()
+        self.file.seek(0)
+        upload = HashedUpload(
+            self.file, self.file_name, self.content_type, file_size, self.charset, self.digest.hexdigest(),
+        )
+        self.file = None
+        return upload
+
+    def upload_interrupted(self):
+        self.discard()
+
+    def discard(self):
+        if self.file is not None:
+            self.file.close()
+            try:
+                os.remove(self.file.name)
+            except FileNotFoundError:
+                pass
+            self.file = None
+
+
+def spool_file(file):
+    """HashingFileUploadHandler'dan geçmemiş bir dosyayı parça parça geçici dosyaya yaz ve özetle"""
+    tmp_dir = os.path.join(get_attachment_config()['ROOT'], 'tmp')
+    os.makedirs(tmp_dir, exist_ok=True)
+    digest = hashlib.sha256()
+    size = 0
+    with tempfile.NamedTemporaryFile(dir=tmp_dir, prefix='upload-', delete=False) as temporary:
+        for chunk in file.chunks(get_attachment_config()['CHUNK_SIZE']):
+            digest.update(chunk)
+            temporary.write(chunk)
+            size += len(chunk)
+    return temporary.name, digest.hexdigest(), size
+
+
+def store_upload(upload):
+    """Yüklemeyi içerik adresli yerine taşı; aynı içerik zaten varsa geçici dosyayı sil.
+
+    (göreli yol, sha256, boyut) döndürür. Var olan blob'un değiştirilme zamanı
+    yenilenir, böylece sahipsiz blob temizliği yeni referans verilen içeriği silmez.
+    """
+    if isinstance(upload, HashedUpload):
+        temporary_path, content_hash, size = upload.temporary_file_path(), upload.content_hash, upload.size
+        upload.close()
+    else:
+        temporary_path, content_hash, size = spool_file(upload)
+    relative_path = blob_relative_path(content_hash)
+    path = blob_path(relative_path)
+    if os.path.exists(path):
+        os.remove(temporary_path)
+        os.utime(path)
+    else:
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        os.replace(temporary_path, path)
+    return relative_path, content_hash, size
+
+
+class StreamingUploadMixin:
+    """Yazma isteklerinde dosyaları HashingFileUploadHandler ile diske akıt"""
+
+    def initialize_request(self, request, *args, **kwargs):
+        # İstek gövdesi okunmadan önce kurulmalı
+        self.upload_handler = HashingFileUploadHandler(request)
+        request.upload_handlers = [self.upload_handler]
+        return super().initialize_request(request, *args, **kwargs)
+
+    def create(self, request, *args, **kwargs):
+        self.check_rejected_uploads(request)
+        return super().create(request, *args, **kwargs)
+
+    def update(self, request, *args, **kwargs):
+        self.check_rejected_uploads(request)
+        return super().update(request, *args, **kwargs)
+
+    def check_rejected_uploads(self, request):
+        request.data  # Gövdeyi ayrıştır
+        if self.upload_handler.rejected:
+            limit = filesizeformat(get_attachment_config()['MAX_SIZE'])
+            raise ValidationError({name: f"Dosya en fazla {limit} olabilir." for name in self.upload_handler.rejected})
+
+
+def prune_orphan_blobs(referenced_hashes, grace_seconds=None):
+    """Hiçbir eke bağlı olmayan ve grace süresinden eski blob'ları, küçük resimleri ve geçici dosyaları sil"""
+    config = get_attachment_config()
+    grace_seconds = config['ORPHAN_GRACE_SECONDS'] if grace_seconds is None else grace_seconds
+    cutoff = time.time() - grace_seconds
+    removed = 0
+    for directory, _, names in os.walk(config['ROOT']):
+        for name in names:
+            path = os.path.join(directory, name)
+            is_temporary = os.path.basename(directory) == 'tmp'
+            # Küçük resimler <özet>.jpg adını taşır
+            if not is_temporary and name.split('.', 1)[0] in referenced_hashes:
+                continue
+            try:
+                if os.path.getmtime(path) < cutoff:
+                    os.remove(path)
+                    removed += 1
+            except FileNotFoundError:
+                pass
+    return removed
+
+
+class RangeNotSatisfiable(Exception):
+    pass
+
+
+def parse_range(header, size):
+    """Tek aralıklı `Range: bytes=a-b` başlığını (başlangıç, bitiş dahil) olarak çöz.
+
+    Başlık yoksa, sözdizimi geçersizse veya çoklu aralıksa None (tam yanıt);
+    aralık dosyanın dışındaysa RangeNotSatisfiable.
+    """
+    match = RANGE_RE.match(header.strip()) if header else None
+    if match is None:
+        return None
+    first, last = match.groups()
+    if not first and not last:
+        return None
+    if not first:
+        # Son N bayt
+        length = int(last)
+        if length == 0 or size == 0:
+            raise RangeNotSatisfiable()
+        return max(0, size - length), size - 1
+    start = int(first)
+    end = min(int(last), size - 1) if last else size - 1
+    if start >= size or end < start:
+        raise RangeNotSatisfiable()
+    return start, end
+
+
+class RangeFile:
+    """Dosyanın [start, end] aralığını okuyan nesne (FileResponse akışı için)"""
+
+    def __init__(self, file, start, end):
+        self.file = file
+        self.file.seek(start)
+        self.remaining = end - start + 1
+
+    def read(self, size=-1):
+        if self.remaining <= 0:
+            return b''
+        if size < 0 or size > self.remaining:
+            size = self.remaining
+        data = self.file.read(size)
+        self.remaining -= len(data)
+        return data
+
+    def close(self):
+        self.file.close()
+
+
+def attachment_etag(attachment):
+    return quote_etag(attachment.content_hash)
+
+
+def attachment_response(request, attachment):
+    """Eki indirme yanıtı: proxy'ye bırakma (X-Sendfile / X-Accel-Redirect) veya
+    Range destekli FileResponse. Blob yoksa None."""
+    config = get_attachment_config()
+    path = blob_path(attachment.file_path)
+    if not attachment.content_hash or not os.path.isfile(path):
+        return None
+    content_type = attachment.content_type or mimetypes.guess_type(attachment.file_name)[0] or 'application/octet-stream'
+    etag = attachment_etag(attachment)
+
+    if config['SENDFILE']:
+        response = HttpResponse(content_type=content_type)
+        if config['SENDFILE'] == 'x-accel-redirect':
+            response['X-Accel-Redirect'] = config['ACCEL_PREFIX'].rstrip('/') + '/' + attachment.file_path.replace(os.sep, '/')
+        else:
+            response['X-Sendfile'] = path
+        set_download_headers(response, attachment, etag)
+        return response
+
+    if etag in parse_etags(request.META.get('HTTP_IF_NONE_MATCH', '')):
+        response = HttpResponse(status=304)
+        response['ETag'] = etag
+        return response
+
+    size = os.path.getsize(path)
+    byte_range = None
+    if_range = request.META.get('HTTP_IF_RANGE')
+    if if_range is None or if_range == etag:
+        try:
+            byte_range = parse_range(request.META.get('HTTP_RANGE'), size)
+        except RangeNotSatisfiable:
+            response = HttpResponse(status=416)
+            response['Content-Range'] = f'bytes */{size}'
+            return response
+
+    file = open(path, 'rb')
+    if byte_range is None:
+        response = FileResponse(file, content_type=content_type)
+        response['Content-Length'] = size
+    else:
+        start, end = byte_range
+        response = FileResponse(RangeFile(file, start, end), status=206, content_type=content_type)
+        response['Content-Range'] = f'bytes {start}-{end}/{size}'
+        response['Content-Length'] = end - start + 1
+    set_download_headers(response, attachment, etag)
+    return response
+
+
+def set_download_headers(response, attachment, etag):
+    response['Accept-Ranges'] = 'bytes'
+    response['ETag'] = etag
+    response['Content-Disposition'] = content_disposition(attachment.file_name)
+    response['X-Content-Type-Options'] = 'nosniff'
+
+
+def content_disposition(file_name):
+    """ASCII dışı adlar için RFC 6266 filename* biçimi"""
+    try:
+        file_name.encode('ascii')
+        escaped = file_name.replace('\\', '\\\\').replace('"', r'\"')
+        return f'attachment; filename="{escaped}"'
+    except UnicodeEncodeError:
+        return f"attachment; filename*=utf-8''{quote(file_name)}"
@@ -0,0 +1,96 @@
+import hashlib
+from calendar import timegm
+
+from django.db.models import Count, Max
+from django.utils.cache import get_conditional_response, patch_cache_control, patch_vary_headers, quote_etag
+from django.utils.http import http_date, parse_etags
+from rest_framework import status
+from rest_framework.exceptions import APIException
+
+
+def make_etag(*parts):
+    """Parçalardan zayıf olmayan bir ETag üret"""
+    raw = '|'.join('' if part is None else str(part) for part in parts)
+    return quote_etag(hashlib.md5(raw.encode('utf-8')).hexdigest())
+
+
+def to_timestamp(value):
+    return timegm(value.utctimetuple()) if value is not None else None
+
+
+def detail_etag(pk, version, updated_at):
+    """Detay ETag'i; If-Match ile iyimser kilitleme belirteci olarak da kullanılır.
+
+    Sürüm API yazımlarında, updated_at diğer tüm kayıtlarda değişir. Alan seçimi
+    (?fields=) ETag'e girmez; aynı belirteç GET ve PUT/PATCH için geçerlidir.
+    """
+    return make_etag('detail', pk, version, updated_at.isoformat())
+
+
+class PreconditionFailed(APIException):
+    status_code = status.HTTP_412_PRECONDITION_FAILED
+    default_detail = "Görev siz okuduktan sonra değiştirildi; yeniden yükleyip tekrar deneyin."
+    default_code = 'precondition_failed'
+
+
+class ConditionalGetMixin:
+    """Görev list/detail için ETag / Last-Modified doğrulayıcıları ve 304 yanıtları.
+
+    Doğrulayıcılar model örneği oluşturmadan tek bir toplama sorgusuyla hesaplanır:
+    liste için filtrelenmiş sorgunun COUNT(*) ve MAX(updated_at) değerleri, detay
+    için satırın sürüm ve updated_at değerleri. 304 yalnızca If-None-Match ile verilir,
+    Last-Modified bilgi amaçlı gönderilir: listede silinen görevler yalnızca COUNT(*)
+    ile ETag'e yansır, HTTP tarihleri ise saniye çözünürlüklü olduğundan aynı saniyedeki
+    iki yazım If-Modified-Since ile ayırt edilemez.
+    """
+    validator_field = 'updated_at'
+    version_field = 'version'
+
+    def get_list_validators(self, request):
+        queryset = self.filter_queryset(self.get_queryset()).order_by()
+        state = queryset.aggregate(last_modified=Max(self.validator_field), count=Count('pk'))
+        last_modified = state['last_modified']
+        etag = make_etag(
+            'list', request.user.pk, request.get_full_path(), state['count'],
+            last_modified.isoformat() if last_modified else None,
+            *self.get_list_state(queryset),
+        )
+        return etag, last_modified
+
+    def get_list_state(self, queryset):
+        """Satırların updated_at'ini değiştirmeden yanıtı etkileyen ek durum (ETag'e eklenir)"""
+        return ()
+
+    def get_detail_validators(self, request):
+        lookup_url_kwarg = self.lookup_url_kwarg or self.lookup_field
+        lookup = {self.lookup_field: self.kwargs[lookup_url_kwarg]}
+        row = self.get_queryset().filter(**lookup).values_list('pk', self.version_field, self.validator_field).first()
+        if row is None:
+            return None, None
+        return detail_etag(*row), row[2]
+
+    def check_if_match(self, request, instance):
+        """If-Match başlığı varsa nesnenin güncel ETag'iyle karşılaştır; uyuşmazsa 412"""
+        header = request.META.get('HTTP_IF_MATCH')
+        if header is None:
+            return
+        etags = parse_etags(header)
+        current = detail_etag(instance.pk, getattr(instance, self.version_field), getattr(instance, self.validator_field))
+        if '*' not in etags and current not in etags:
+            raise PreconditionFailed()
+
+    def conditional_response(self, request, etag):
+        """İstemcinin kopyası güncelse (If-None-Match) 304 yanıtı, değilse None döndür"""
+        if etag is None:
+            return None
+        return get_conditional_response(request, etag=etag)
+
+    def set_validators(self, response, etag, last_modified):
+        if etag is not None:
+            response['ETag'] = etag
+        if last_modified is not None:
+            response['Last-Modified'] = http_date(to_timestamp(last_modified))
+        # Tarayıcı her istekte yeniden doğrulasın; yanıt kullanıcıya özeldir
+        patch_cache_control(response, private=True, no_cache=True)
+        patch_vary_headers(response, ['Authorization'])
+        return response
@@ -0,0 +1,190 @@
+from django.core.exceptions import FieldDoesNotExist
+from rest_framework import ISO_8601, serializers
+from rest_framework.response import Response
+from rest_framework.fields import empty
+from rest_framework.settings import api_settings
+
+
+# Kolon değeri doğrudan field.to_representation'a verilebilen alanlar
+SCALAR_FIELDS = (
+    serializers.CharField, serializers.IntegerField, serializers.BooleanField,
+    serializers.FloatField, serializers.DecimalField, serializers.TimeField,
+    serializers.DurationField, serializers.UUIDField,
+)
+
+
+class UnsupportedField(Exception):
+    """Alan .values() satırından doğrudan üretilemiyor"""
+
+
+def identity(value):
+    return value
+
+
+def compile_date(field):
+    output_format = getattr(field, 'format', api_settings.DATE_FORMAT)
+    if output_format is None or output_format.lower() != ISO_8601:
+        return field.to_representation
+    return lambda value: value.isoformat()
+
+
+def compile_datetime(field):
+    output_format = getattr(field, 'format', api_settings.DATETIME_FORMAT)
+    if output_format is None or output_format.lower() != ISO_8601:
+        return field.to_representation
+    field_timezone = field.timezone if hasattr(field, 'timezone') else field.default_timezone()
+
+    def convert(value):
+        if field_timezone is None or value.tzinfo is None:
+            return field.to_representation(value)
+        value = value.astimezone(field_timezone).isoformat()
+        if value.endswith('+00:00'):
+            value = value[:-6] + 'Z'
+        return value
+    return convert
+
+
+def compile_choice(field):
+    mapping = field.choice_strings_to_values
+    if all(key == value for key, value in mapping.items()):
+        return identity
+    return lambda value: value if value == '' else mapping.get(str(value), value)
+
+
+def compile_related_field(field, model):
+    """İleri ilişki üzerinden okunan düz alan (ör. user.username): .values() kolonu
+    user__username olur ve satırla aynı sorguda JOIN ile okunur.
+
+    Ara ilişki NULL olabiliyorsa LEFT JOIN None verir; DRF ise bu durumda alanı
+    allow_null=True değilse çıktıdan atlar, default verilmişse onu yazar. Çıktılar
+    ancak allow_null=True ve default yokken aynı olduğundan diğer durumlar
+    derlenmez."""
+    *relations, name = field.source.split('.')
+    nullable = False
+    try:
+        for relation in relations:
+            model_field = model._meta.get_field(relation)
+            if not (model_field.many_to_one or model_field.one_to_one) or not model_field.concrete:
+                raise UnsupportedField(field.field_name)
+            nullable = nullable or model_field.null
+            model = model_field.related_model
+        model_field = model._meta.get_field(name)
+    except FieldDoesNotExist:
+        raise UnsupportedField(field.field_name)
+    if model_field.is_relation or not model_field.concrete:
+        raise UnsupportedField(field.field_name)
+    if type(field) not in (serializers.CharField, serializers.IntegerField, serializers.BooleanField):
+        raise UnsupportedField(field.field_name)
+    if nullable and not (field.allow_null and field.default is empty):
+        raise UnsupportedField(field.field_name)
+    return '__'.join(relations + [model_field.attname]), identity
+
+
+def compile_field(field, model, annotations=()):
+    """Serializer alanı için (kolon adı, dönüştürücü) döndür"""
+    if field.source == '*':
+        raise UnsupportedField(field.field_name)
+    if '.' in field.source:
+        return compile_related_field(field, model)
+    if field.source in annotations:
+        # Sorgu anotasyonları (ör. SQLite'ta 0/1 dönen Exists) DRF dönüşümünden geçer
+        if isinstance(field, SCALAR_FIELDS):
+            return field.source, field.to_representation
+        raise UnsupportedField(field.field_name)
+    try:
+        model_field = model._meta.get_field(field.source)
+    except FieldDoesNotExist:
+        raise UnsupportedField(field.field_name)
+    if model_field.many_to_many or not model_field.concrete:
+        raise UnsupportedField(field.field_name)
+
+    if isinstance(field, serializers.PrimaryKeyRelatedField):
+        if field.pk_field is not None:
+            raise UnsupportedField(field.field_name)
+        return model_field.attname, identity
+    if model_field.is_relation:
+        raise UnsupportedField(field.field_name)
+    if isinstance(field, serializers.DateTimeField):
+        return model_field.attname, compile_datetime(field)
+    if isinstance(field, serializers.DateField):
+        return model_field.attname, compile_date(field)
+    if isinstance(field, serializers.ChoiceField):
+        return model_field.attname, compile_choice(field)
+    if type(field) in (serializers.CharField, serializers.IntegerField, serializers.BooleanField):
+        # Veritabanından gelen str/int/bool değerleri DRF'in dönüşümünden aynen geçer
+        return model_field.attname, identity
+    if isinstance(field, SCALAR_FIELDS):
+        return model_field.attname, field.to_representation
+    # FileField gibi alanlar kolon değerinden değil model alanı nesnesinden üretilir
+    raise UnsupportedField(field.field_name)
+
+
+class ValuesSerializer:
+    """Okuma için .values() satırlarından doğrudan çıktı üreten serializer.
+
+    Alan listesi, sırası ve dönüşümleri verilen ModelSerializer örneğinden
+    derlenir; çıktı aynı serializer'ın JSON çıktısıyla birebir aynıdır.
+    Derlenemeyen bir alan varsa UnsupportedField yükseltilir.
+    """
+
+    def __init__(self, serializer, extra_columns=(), annotations=()):
+        model = serializer.Meta.model
+        self.fields = []
+        for field in serializer._readable_fields:
+            column, converter = compile_field(field, model, annotations)
+            # Dönüşüm gerektirmeyen alanlarda fonksiyon çağrısı atlanır
+            self.fields.append((field.field_name, column, None if converter is identity else converter))
+        # Aynı kolon (ör. iki alanın kaynağı ya da artan/azalan sıralama) SELECT'e bir kez girer
+        self.columns = list(dict.fromkeys([*(column for _, column, _ in self.fields), *extra_columns]))
+
+    def represent(self, rows):
+        fields = self.fields
+        return [
+            {
+                name: row[column] if converter is None or row[column] is None else converter(row[column])
+                for name, column, converter in fields
+            }
+            for row in rows
+        ]
+
+
+def get_values_serializer(serializer, extra_columns=(), annotations=()):
+    """Serializer hızlı yolu destekliyorsa ValuesSerializer, değilse None döndür"""
+    try:
+        return ValuesSerializer(serializer, extra_columns, annotations)
+    except UnsupportedField:
+        return None
+
+
+class FastListMixin:
+    """Liste yanıtlarını model nesnesi oluşturmadan .values() satırlarından üret"""
+    fast_list = True
+
+    def list(self, request, *args, **kwargs):
+        queryset = self.annotate_list(self.filter_queryset(self.get_queryset()))
+        reader = self.get_values_serializer(queryset) if self.fast_list else None
+        if reader is None:
+            page = self.paginate_queryset(queryset)
+            if page is not None:
+                return self.get_paginated_response(self.get_serializer(page, many=True).data)
+            return Response(self.get_serializer(queryset, many=True).data)
+
+        queryset = queryset.values(*reader.columns)
+        page = self.paginate_queryset(queryset)
+        if page is not None:
+            return self.get_paginated_response(reader.represent(page))
+        return Response(reader.represent(queryset))
+
+    def annotate_list(self, queryset):
+        """Yalnızca liste yanıtında gereken anotasyonlar (ETag sorgusuna eklenmez)"""
+        return queryset
+
+    def get_values_serializer(self, queryset):
+        serializer = self.get_serializer()
+        model = serializer.Meta.model
+        extra_columns = [model._meta.pk.attname]
+        for name in getattr(self.pagination_class, 'orderings', {}).values():
+            name = name.lstrip('-')
+            if name != 'pk':
+                extra_columns.append(model._meta.get_field(name).attname)
+        return get_values_serializer(serializer, extra_columns, queryset.query.annotations)
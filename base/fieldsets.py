@@ -0,0 +1,82 @@
+from django.core.exceptions import FieldDoesNotExist
+from rest_framework import serializers
+from rest_framework.exceptions import ValidationError
+from rest_framework.permissions import SAFE_METHODS
+
+FIELDS_QUERY_PARAM = 'fields'
+EXCLUDE_QUERY_PARAM = 'exclude'
+
+
+def parse_field_list(request, name, available):
+    """Virgülle ayrılmış alan listesini oku; bilinmeyen alanlarda 400 döndür"""
+    value = request.query_params.get(name)
+    if not value:
+        return None
+    selected = [item.strip() for item in value.split(',') if item.strip()]
+    invalid = [item for item in selected if item not in available]
+    if invalid:
+        raise ValidationError({
+            name: f"Geçersiz alan: {', '.join(invalid)}. Geçerli alanlar: {', '.join(available)}"
+        })
+    return selected
+
+
+class DynamicFieldsMixin:
+    """?fields=a,b / ?exclude=c ile yalnızca istenen alanları serileştir.
+
+    Yalnızca okuma isteklerinde ve en üst düzey serializer'da uygulanır; yazma
+    isteklerinde doğrulama tüm alanlarla çalışmaya devam eder.
+    """
+
+    def get_fields(self):
+        fields = super().get_fields()
+        request = self.context.get('request')
+        if request is None or request.method not in SAFE_METHODS or not self.is_top_level():
+            return fields
+        only = parse_field_list(request, FIELDS_QUERY_PARAM, list(fields))
+        exclude = parse_field_list(request, EXCLUDE_QUERY_PARAM, list(fields)) or []
+        return {
+            name: field for name, field in fields.items()
+            if (only is None or name in only) and name not in exclude
+        }
+
+    def is_top_level(self):
+        parent = self.parent
+        return parent is None or (isinstance(parent, serializers.ListSerializer) and parent.parent is None)
+
+
+class SparseFieldsMixin:
+    """İstenen alanlara göre sorguyu .only() ile daralt.
+
+    Serializer alanları doğrudan model kolonlarına karşılık geliyorsa yalnızca
+    bu kolonlar (ve birincil anahtar ile sayfalama sıralama alanları) okunur.
+    Kolona karşılık gelmeyen bir alan varsa sorgu daraltılmaz.
+    """
+
+    def filter_queryset(self, queryset):
+        queryset = super().filter_queryset(queryset)
+        params = self.request.query_params
+        if self.request.method not in SAFE_METHODS or not (
+            params.get(FIELDS_QUERY_PARAM) or params.get(EXCLUDE_QUERY_PARAM)
+        ):
+            return queryset
+        columns = self.get_sparse_columns(queryset.model)
+        if columns is None:
+            return queryset
+        return queryset.only(*columns)
+
+    def get_sparse_columns(self, model):
+        columns = {model._meta.pk.name}
+        orderings = getattr(self.pagination_class, 'orderings', {})
+        columns.update(name.lstrip('-') for name in orderings.values())
+        for field in self.get_serializer().fields.values():
+            if field.source == '*' or '.' in field.source:
+                return None
+            try:
+                model_field = model._meta.get_field(field.source)
+            except FieldDoesNotExist:
+                return None
+            if model_field.many_to_many or not model_field.concrete:
+                continue
+            columns.add(model_field.name)
+        return columns
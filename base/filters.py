@@ -0,0 +1,86 @@
+from django.db.models import F
+from django.utils import timezone
+from django.utils.dateparse import parse_date
+from rest_framework.exceptions import ValidationError
+from rest_framework.filters import BaseFilterBackend
+
+from .models import Task
+
+CLOSED_STATUSES = ['completed', 'cancelled']
+
+
+class TaskFilterBackend(BaseFilterBackend):
+    """Görev listesi için sunucu tarafı filtreler.
+
+    Her filtre Task üzerindeki (user, ...) bileşik indekslerinden biriyle karşılanır:
+    - status=pending,in_progress
+    - priority=high,critical
+    - due_date_from=YYYY-MM-DD, due_date_to=YYYY-MM-DD
+    - overdue=true (bitiş tarihi geçmiş, tamamlanmamış/iptal edilmemiş)
+    - ordering=-updated_at | updated_at | due_date | -due_date
+    """
+    ordering_query_param = 'ordering'
+    orderings = {
+        '-updated_at': ['-updated_at', '-id'],
+        'updated_at': ['updated_at', 'id'],
+        'due_date': [F('due_date').asc(nulls_last=True), 'id'],
+        '-due_date': [F('due_date').desc(nulls_last=True), '-id'],
+    }
+    default_ordering = '-updated_at'
+
+    def filter_queryset(self, request, queryset, view):
+        params = request.query_params
+        errors = {}
+
+        statuses = self.parse_choices(params, 'status', Task.STATUS_CHOICES, errors)
+        if statuses:
+            queryset = queryset.filter(status__in=statuses)
+
+        priorities = self.parse_choices(params, 'priority', Task.PRIORITY_CHOICES, errors)
+        if priorities:
+            queryset = queryset.filter(priority__in=priorities)
+
+        due_date_from = self.parse_date_param(params, 'due_date_from', errors)
+        if due_date_from:
+            queryset = queryset.filter(due_date__gte=due_date_from)
+        due_date_to = self.parse_date_param(params, 'due_date_to', errors)
+        if due_date_to:
+            queryset = queryset.filter(due_date__lte=due_date_to)
+
+        overdue = params.get('overdue')
+        if overdue is not None:
+            if overdue.lower() in ('1', 'true'):
+                queryset = queryset.filter(due_date__lt=timezone.localdate()).exclude(status__in=CLOSED_STATUSES)
+            elif overdue.lower() not in ('0', 'false'):
+                errors['overdue'] = "Geçersiz değer. 'true' veya 'false' olmalıdır."
+
+        ordering = params.get(self.ordering_query_param, self.default_ordering)
+        if ordering not in self.orderings:
+            errors[self.ordering_query_param] = f"Geçersiz sıralama. Geçerli değerler: {', '.join(self.orderings)}"
+
+        if errors:
+            raise ValidationError(errors)
+        return queryset.order_by(*self.orderings[ordering])
+
+    def parse_choices(self, params, name, choices, errors):
+        value = params.get(name)
+        if not value:
+            return []
+        valid = [key for key, _ in choices]
+        selected = [item.strip() for item in value.split(',') if item.strip()]
+        invalid = [item for item in selected if item not in valid]
+        if invalid:
+            errors[name] = f"Geçersiz değer: {', '.join(invalid)}. Geçerli değerler: {', '.join(valid)}"
+        return selected
+
+    def parse_date_param(self, params, name, errors):
+        value = params.get(name)
+        if not value:
+            return None
+        try:
+            parsed = parse_date(value)
+        except ValueError:
+            parsed = None
+        if parsed is None:
+            errors[name] = "Geçersiz tarih. Biçim: YYYY-MM-DD"
+        return parsed
@@ -0,0 +1,207 @@
+import logging
+import re
+
+from django.db import connections
+from django.db.models import BooleanField, FloatField
+from django.db.models.expressions import RawSQL
+
+logger = logging.getLogger(__name__)
+
+TSVECTOR_CONFIG = 'simple'
+
+# Log.action + Log.details için PostgreSQL ifade indeksiyle birebir aynı olmalı
+LOG_TSVECTOR_SQL = (
+    f"to_tsvector('{TSVECTOR_CONFIG}', coalesce(action, '') || ' ' || coalesce(details, ''))"
+)
+LOG_FTS_INDEX = 'log_details_fts_idx'
+LOG_FTS_TABLE = 'base_log_fts'
+
+TOKEN_RE = re.compile(r'\w+', re.UNICODE)
+
+# Görev araması: PostgreSQL'de base_task.search_vector kolonu (0009 migration'ındaki
+# tetikleyicilerle güncellenir), SQLite'ta başlık/açıklama/yorumlar için FTS5 tablosu
+TASK_FTS_TABLE = 'base_task_fts'
+# title, description, comments ağırlıkları
+TASK_FTS_WEIGHTS = (10.0, 5.0, 1.0)
+
+
+def fts5_query(term):
+    """Kullanıcı girdisini güvenli bir FTS5 MATCH ifadesine çevir (tüm kelimeler, önek eşleşmeli)"""
+    tokens = TOKEN_RE.findall(term)
+    return ' '.join(f'"{token}"*' for token in tokens)
+
+
+def tsquery_prefix(term):
+    """Kullanıcı girdisini önek eşleşmeli bir to_tsquery ifadesine çevir (tüm kelimeler)"""
+    return ' & '.join(f'{token}:*' for token in TOKEN_RE.findall(term))
+
+
+def sqlite_has_fts5(connection):
+    with connection.cursor() as cursor:
+        cursor.execute("SELECT sqlite_compileoption_used('ENABLE_FTS5')")
+        return bool(cursor.fetchone()[0])
+
+
+def sqlite_table_exists(cursor, name):
+    cursor.execute("SELECT 1 FROM sqlite_master WHERE name = %s", [name])
+    return cursor.fetchone() is not None
+
+
+def ensure_sqlite_log_fts(connection):
+    """SQLite'ta Log için FTS5 tablosunu ve eşitleme tetikleyicilerini oluştur.
+
+    SQLite'ta tablo değiştiren migration'lar tabloyu yeniden oluşturup tetikleyicileri
+    düşürdüğü için bu işlem her migrate sonrasında tekrar çalıştırılır.
+    """
+    if connection.vendor != 'sqlite' or not sqlite_has_fts5(connection):
+        return False
+    from .models import Log
+
+    table = Log._meta.db_table
+    with connection.cursor() as cursor:
+        if not sqlite_table_exists(cursor, table):
+            return False
+        rebuild = not sqlite_table_exists(cursor, f'{LOG_FTS_TABLE}_ai')
+        cursor.execute(
+            f"CREATE VIRTUAL TABLE IF NOT EXISTS {LOG_FTS_TABLE} "
+            f"USING fts5(action, details, content='{table}', content_rowid='id')"
+        )
+        cursor.execute(
+            f"CREATE TRIGGER IF NOT EXISTS {LOG_FTS_TABLE}_ai AFTER INSERT ON {table} BEGIN "
+            f"INSERT INTO {LOG_FTS_TABLE}(rowid, action, details) VALUES (new.id, new.action, new.details); END"
+        )
+        cursor.execute(
+            f"CREATE TRIGGER IF NOT EXISTS {LOG_FTS_TABLE}_ad AFTER DELETE ON {table} BEGIN "
+            f"INSERT INTO {LOG_FTS_TABLE}({LOG_FTS_TABLE}, rowid, action, details) "
+            f"VALUES ('delete', old.id, old.action, old.details); END"
+        )
+        cursor.execute(
+            f"CREATE TRIGGER IF NOT EXISTS {LOG_FTS_TABLE}_au AFTER UPDATE ON {table} BEGIN "
+            f"INSERT INTO {LOG_FTS_TABLE}({LOG_FTS_TABLE}, rowid, action, details) "
+            f"VALUES ('delete', old.id, old.action, old.details); "
+            f"INSERT INTO {LOG_FTS_TABLE}(rowid, action, details) VALUES (new.id, new.action, new.details); END"
+        )
+        if rebuild:
+            cursor.execute(f"INSERT INTO {LOG_FTS_TABLE}({LOG_FTS_TABLE}) VALUES ('rebuild')")
+    return True
+
+
+def ensure_sqlite_task_fts(connection):
+    """SQLite'ta görev başlığı, açıklaması ve yorumları için FTS5 tablosunu ve tetikleyicileri oluştur.
+
+    Her görev tek satırdır (rowid = görev id); görev veya yorumları değiştiğinde
+    satır yeniden yazılır.
+    """
+    if connection.vendor != 'sqlite' or not sqlite_has_fts5(connection):
+        return False
+    from .models import Task, TaskComment
+
+    task_table = Task._meta.db_table
+    comment_table = TaskComment._meta.db_table
+    with connection.cursor() as cursor:
+        if not sqlite_table_exists(cursor, task_table) or not sqlite_table_exists(cursor, comment_table):
+            return False
+        rebuild = not sqlite_table_exists(cursor, f'{TASK_FTS_TABLE}_task_ai')
+        cursor.execute(
+            f"CREATE VIRTUAL TABLE IF NOT EXISTS {TASK_FTS_TABLE} USING fts5(title, description, comments)"
+        )
+
+        def refresh(task_id):
+            return (
+                f"DELETE FROM {TASK_FTS_TABLE} WHERE rowid = {task_id}; "
+                f"INSERT INTO {TASK_FTS_TABLE}(rowid, title, description, comments) "
+                f"SELECT t.id, t.title, t.description, "
+                f"(SELECT group_concat(c.comment, ' ') FROM {comment_table} c WHERE c.task_id = t.id) "
+                f"FROM {task_table} t WHERE t.id = {task_id};"
+            )
+
+        triggers = {
+            'task_ai': f"AFTER INSERT ON {task_table} BEGIN {refresh('new.id')} END",
+            'task_au': f"AFTER UPDATE OF title, description ON {task_table} BEGIN {refresh('new.id')} END",
+            'task_ad': f"AFTER DELETE ON {task_table} BEGIN DELETE FROM {TASK_FTS_TABLE} WHERE rowid = old.id; END",
+            'comment_ai': f"AFTER INSERT ON {comment_table} BEGIN {refresh('new.task_id')} END",
+            'comment_au': f"AFTER UPDATE ON {comment_table} BEGIN {refresh('old.task_id')} {refresh('new.task_id')} END",
+            'comment_ad': f"AFTER DELETE ON {comment_table} BEGIN {refresh('old.task_id')} END",
+        }
+        for name, body in triggers.items():
+            cursor.execute(f"CREATE TRIGGER IF NOT EXISTS {TASK_FTS_TABLE}_{name} {body}")
+        if rebuild:
+            cursor.execute(f"DELETE FROM {TASK_FTS_TABLE}")
+            cursor.execute(
+                f"INSERT INTO {TASK_FTS_TABLE}(rowid, title, description, comments) "
+                f"SELECT t.id, t.title, t.description, "
+                f"(SELECT group_concat(c.comment, ' ') FROM {comment_table} c WHERE c.task_id = t.id) "
+                f"FROM {task_table} t"
+            )
+    return True
+
+
+def ensure_fulltext_indexes(using='default', **kwargs):
+    """post_migrate sinyali: veritabanına özel tam metin yapılarını hazırla"""
+    connection = connections[using]
+    if connection.vendor == 'sqlite':
+        ensure_sqlite_log_fts(connection)
+        ensure_sqlite_task_fts(connection)
+
+
+def search_logs(queryset, term):
+    """Log kayıtlarında action/details üzerinde tam metin arama yap.
+
+    PostgreSQL'de GIN tsvector indeksi, SQLite'ta FTS5 tablosu kullanılır. İkisi de
+    yoksa None döner ve çağıran klasik aramaya düşer.
+    """
+    connection = connections[queryset.db]
+    if connection.vendor == 'postgresql':
+        return queryset.filter(RawSQL(
+            f"{LOG_TSVECTOR_SQL} @@ plainto_tsquery('{TSVECTOR_CONFIG}', %s)",
+            [term], output_field=BooleanField(),
+        ))
+    if connection.vendor == 'sqlite':
+        match = fts5_query(term)
+        if not match:
+            return queryset.none()
+        with connection.cursor() as cursor:
+            if not sqlite_table_exists(cursor, LOG_FTS_TABLE):
+                return None
+        return queryset.filter(id__in=RawSQL(
+            f"SELECT rowid FROM {LOG_FTS_TABLE} WHERE {LOG_FTS_TABLE} MATCH %s", [match],
+        ))
+    return None
+
+
+def search_tasks(queryset, term):
+    """Görevlerde başlık, açıklama ve yorumlar üzerinde sıralı tam metin arama yap.
+
+    Sonuç `search_rank` ile açıklanır (büyük olan daha iyi) ve buna göre sıralanır.
+    PostgreSQL'de GIN indeksli search_vector kolonu, SQLite'ta FTS5 tablosu
+    kullanılır. İkisi de yoksa None döner ve çağıran klasik aramaya düşer.
+    """
+    connection = connections[queryset.db]
+    table = queryset.model._meta.db_table
+    if connection.vendor == 'postgresql':
+        query = tsquery_prefix(term)
+        if not query:
+            return queryset.none()
+        tsquery = f"to_tsquery('{TSVECTOR_CONFIG}', %s)"
+        return queryset.filter(RawSQL(
+            f"{table}.search_vector @@ {tsquery}", [query], output_field=BooleanField(),
+        )).annotate(search_rank=RawSQL(
+            f"ts_rank({table}.search_vector, {tsquery})", [query], output_field=FloatField(),
+        )).order_by('-search_rank', '-pk')
+    if connection.vendor == 'sqlite':
+        match = fts5_query(term)
+        if not match:
+            return queryset.none()
+        with connection.cursor() as cursor:
+            if not sqlite_table_exists(cursor, TASK_FTS_TABLE):
+                return None
+        weights = ', '.join(str(weight) for weight in TASK_FTS_WEIGHTS)
+        return queryset.filter(id__in=RawSQL(
+            f"SELECT rowid FROM {TASK_FTS_TABLE} WHERE {TASK_FTS_TABLE} MATCH %s", [match],
+        )).annotate(search_rank=RawSQL(
+            # bm25 daha iyi eşleşmede daha küçük (negatif) değer verir
+            f"SELECT -bm25({TASK_FTS_TABLE}, {weights}) FROM {TASK_FTS_TABLE} "
+            f"WHERE {TASK_FTS_TABLE} MATCH %s AND rowid = {table}.id",
+            [match], output_field=FloatField(),
+        )).order_by('-search_rank', '-pk')
+    return None
@@ -0,0 +1,219 @@
+import atexit
+import logging
+import os
+import queue
+import threading
+import time
+
+from django.conf import settings
+from django.db import DEFAULT_DB_ALIAS, close_old_connections, connections
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_LOG_BUFFER = {
+    'ENABLED': False,
+    'MAX_SIZE': 10000,
+    'BATCH_SIZE': 500,
+    'FLUSH_INTERVAL': 2.0,
+    'OVERFLOW_POLICY': 'drop',
+    'BLOCK_TIMEOUT': 1.0,
+}
+
+
+def get_log_buffer_config():
+    """settings.LOG_BUFFER ayarlarını varsayılanlarla birleştir"""
+    config = dict(DEFAULT_LOG_BUFFER)
+    config.update(getattr(settings, 'LOG_BUFFER', {}))
+    return config
+
+
+class LogBuffer:
+    """Log kayıtlarını sınırlı bir kuyrukta toplayıp arka planda toplu yazan tampon"""
+
+    OVERFLOW_DROP = 'drop'
+    OVERFLOW_BLOCK = 'block'
+
+    def __init__(self, max_size=10000, batch_size=500, flush_interval=2.0,
+                 overflow_policy=OVERFLOW_DROP, block_timeout=1.0):
+        if overflow_policy not in (self.OVERFLOW_DROP, self.OVERFLOW_BLOCK):
+            raise ValueError(f"Geçersiz taşma politikası: {overflow_policy}")
+        self.max_size = max_size
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self.overflow_policy = overflow_policy
+        self.block_timeout = block_timeout
+
+        self._queue = queue.Queue(maxsize=max_size)
+        self._lock = threading.Lock()
+        self._flush_lock = threading.Lock()
+        self._stop_event = threading.Event()
+        self._thread = None
+        self._pid = None
+        self._stopped = False
+        self._database = None
+
+        self.enqueued = 0
+        self.written = 0
+        self.dropped = 0
+        self.failed = 0
+
+    def put(self, log_entry):
+        """Kaydedilmemiş bir Log nesnesini kuyruğa ekle"""
+        self._database = current_database()
+        if self._stopped:
+            # Kapanış sırasında gelen kayıtlar (ör. başka atexit işleyicilerinden) doğrudan yazılır
+            self._write([log_entry])
+            return True
+        self._ensure_worker()
+        try:
+            if self.overflow_policy == self.OVERFLOW_BLOCK:
+                self._queue.put(log_entry, timeout=self.block_timeout)
+            else:
+                self._queue.put_nowait(log_entry)
+        except queue.Full:
+            with self._lock:
+                self.dropped += 1
+            return False
+        with self._lock:
+            self.enqueued += 1
+        return True
+
+    def flush(self):
+        """Kuyrukta bekleyen tüm kayıtları senkron olarak yaz"""
+        while True:
+            batch = self._drain(self.batch_size)
+            if not batch:
+                return
+            self._write(batch)
+
+    def stop(self, timeout=5.0):
+        """Arka plan iş parçacığını durdur ve kalan kayıtları yaz"""
+        self._stopped = True
+        self._stop_event.set()
+        thread = self._thread
+        if thread is not None and thread.is_alive() and thread is not threading.current_thread():
+            thread.join(timeout)
+        self.flush()
+
+    def shutdown(self, timeout=5.0):
+        """atexit: stop() gibi, ancak hiçbir zaman hata yükseltmez.
+
+        Kayıtlar kuyruğa alındıktan sonra veritabanı ayarı değiştiyse (ör. test
+        veritabanı silinip bağlantı asıl veritabanına döndüyse) kalan kayıtlar
+        yanlış veritabanına yazılmasın diye bırakılır.
+        """
+        try:
+            if self._database is not None and current_database() != self._database:
+                self._stopped = True
+                self._stop_event.set()
+                discarded = len(self._drain(self.max_size))
+                if discarded:
+                    with self._lock:
+                        self.dropped += discarded
+                    logger.warning(f"Veritabanı kapandığı için {discarded} log kaydı yazılmadı")
+                return
+            self.stop(timeout)
+        except Exception as e:
+            logger.error(f"Log tamponu kapatılamadı: {e}")
+        finally:
+            try:
+                connections.close_all()
+            except Exception:
+                pass
+
+    def stats(self):
+        """Tampon sayaçlarını döndür"""
+        with self._lock:
+            return {
+                'queued': self._queue.qsize(),
+                'enqueued': self.enqueued,
+                'written': self.written,
+                'dropped': self.dropped,
+                'failed': self.failed,
+            }
+
+    def _ensure_worker(self):
+        # Fork sonrası (ör. gunicorn --preload) iş parçacığı alt sürece geçmez
+        pid = os.getpid()
+        if self._thread is not None and self._pid == pid and self._thread.is_alive():
+            return
+        with self._lock:
+            if self._thread is not None and self._pid == pid and self._thread.is_alive():
+                return
+            if self._pid != pid:
+                self._queue = queue.Queue(maxsize=self.max_size)
+            self._pid = pid
+            self._stop_event.clear()
+            self._thread = threading.Thread(target=self._run, name='log-buffer-flusher', daemon=True)
+            self._thread.start()
+
+    def _run(self):
+        while not self._stop_event.is_set():
+            batch = self._drain(self.batch_size, wait=self.flush_interval)
+            if batch:
+                self._write(batch)
+
+    def _drain(self, limit, wait=None):
+        """Kuyruktan en fazla `limit` kayıt al; `wait` saniye boyunca yeni kayıt bekle"""
+        batch = []
+        deadline = time.monotonic() + wait if wait else None
+        while len(batch) < limit:
+            try:
+                if deadline is None:
+                    batch.append(self._queue.get_nowait())
+                else:
+                    remaining = deadline - time.monotonic()
+                    if remaining <= 0:
+                        break
+                    batch.append(self._queue.get(timeout=remaining))
+            except queue.Empty:
+                break
+        return batch
+
+    def _write(self, batch):
+        from .models import Log
+
+        in_worker = threading.current_thread() is self._thread
+        with self._flush_lock:
+            if in_worker:
+                close_old_connections()
+            try:
+                Log.objects.bulk_create(batch, batch_size=self.batch_size)
+            except Exception as e:
+                with self._lock:
+                    self.failed += len(batch)
+                logger.error(f"Log toplu kayıt hatası ({len(batch)} kayıt): {e}")
+            else:
+                with self._lock:
+                    self.written += len(batch)
+            finally:
+                if in_worker:
+                    close_old_connections()
+
+
+def current_database():
+    return connections[DEFAULT_DB_ALIAS].settings_dict.get('NAME')
+
+
+_log_buffer = None
+_log_buffer_lock = threading.Lock()
+
+
+def get_log_buffer():
+    """Ayarlarda etkinse süreç genelindeki LogBuffer örneğini döndür, değilse None"""
+    global _log_buffer
+    config = get_log_buffer_config()
+    if not config['ENABLED']:
+        return None
+    if _log_buffer is None:
+        with _log_buffer_lock:
+            if _log_buffer is None:
+                _log_buffer = LogBuffer(
+                    max_size=config['MAX_SIZE'],
+                    batch_size=config['BATCH_SIZE'],
+                    flush_interval=config['FLUSH_INTERVAL'],
+                    overflow_policy=config['OVERFLOW_POLICY'],
+                    block_timeout=config['BLOCK_TIMEOUT'],
+                )
+                atexit.register(_log_buffer.shutdown)
+    return _log_buffer
@@ -0,0 +1,385 @@
+import gzip
+import json
+import logging
+import os
+import re
+from datetime import datetime, timedelta
+
+from django.conf import settings
+from django.core.serializers.json import DjangoJSONEncoder
+from django.db import connection, transaction
+from django.utils import timezone
+from django.utils.dateparse import parse_datetime
+
+from .fulltext import LOG_FTS_INDEX, LOG_TSVECTOR_SQL
+from .models import Log
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_LOG_RETENTION = {
+    'MAX_AGE_DAYS': 90,
+    'ARCHIVE_DIR': os.path.join(settings.BASE_DIR, 'logs', 'archive'),
+    'CHUNK_SIZE': 5000,
+    'DELETE_BATCH_SIZE': 1000,
+    'POSTGRES_PARTITIONING': False,
+    'PARTITIONS_AHEAD': 3,
+    'INTERVAL': 3600,
+}
+
+ARCHIVE_FIELDS = [
+    'id', 'timestamp', 'level', 'log_type', 'user_id', 'ip_address', 'action', 'details', 'event_code', 'payload',
+]
+
+PARTITION_NAME_RE = re.compile(r'_p(\d{4})_(\d{2})$')
+
+
+def get_log_retention_config():
+    """settings.LOG_RETENTION ayarlarını varsayılanlarla birleştir"""
+    config = dict(DEFAULT_LOG_RETENTION)
+    config.update(getattr(settings, 'LOG_RETENTION', {}))
+    return config
+
+
+def month_start(value):
+    """Verilen tarihin bulunduğu ayın ilk anı"""
+    return value.replace(day=1, hour=0, minute=0, second=0, microsecond=0)
+
+
+def add_months(value, months):
+    """Ay başı bir tarihe `months` ay ekle"""
+    month_index = value.month - 1 + months
+    return value.replace(year=value.year + month_index // 12, month=month_index % 12 + 1)
+
+
+class LogArchiveEncoder(DjangoJSONEncoder):
+    """Zaman damgalarını mikrosaniyesiyle yazar; DjangoJSONEncoder milisaniyeye keser"""
+
+    def default(self, o):
+        if isinstance(o, datetime):
+            value = o.isoformat()
+            return value[:-6] + 'Z' if value.endswith('+00:00') else value
+        return super().default(o)
+
+
+class LogArchiveWriter:
+    """Log satırlarını aylık gzip sıkıştırılmış JSONL dosyalarına ekler"""
+
+    def __init__(self, archive_dir):
+        self.archive_dir = archive_dir
+        self._files = {}
+        os.makedirs(archive_dir, exist_ok=True)
+
+    def path_for(self, timestamp):
+        return os.path.join(self.archive_dir, f"log-{timestamp:%Y-%m}.jsonl.gz")
+
+    def write_rows(self, rows):
+        """Satırları zaman damgasının ayına göre ilgili arşiv dosyasına yaz"""
+        for row in rows:
+            path = self.path_for(row['timestamp'])
+            handle = self._files.get(path)
+            if handle is None:
+                # Her çalıştırma ayrı bir gzip üyesi ekler; gzip okuyucuları bunları art arda okur
+                handle = gzip.open(path, 'at', encoding='utf-8')
+                self._files[path] = handle
+            handle.write(json.dumps(row, cls=LogArchiveEncoder, ensure_ascii=False))
+            handle.write('\n')
+        # Satırlar silinmeden önce diske yazılmış olmalı
+        for handle in self._files.values():
+            handle.flush()
+            os.fsync(handle.fileno())
+
+    def close(self):
+        for handle in self._files.values():
+            handle.close()
+        self._files = {}
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+
+def archive_logs(cutoff, archive_dir, chunk_size=5000, delete_batch_size=1000, start=None, delete=True):
+    """`cutoff` öncesindeki Log satırlarını parça parça arşivle ve sınırlı partilerle sil.
+
+    Satırlar id sırasıyla (keyset) okunur; bellekte aynı anda en fazla `chunk_size`
+    satır tutulur. Bir parça diske yazılmadan silinmez.
+    """
+    queryset = Log.objects.filter(timestamp__lt=cutoff)
+    if start is not None:
+        queryset = queryset.filter(timestamp__gte=start)
+
+    archived = 0
+    deleted = 0
+    last_id = 0
+    with LogArchiveWriter(archive_dir) as writer:
+        while True:
+            rows = list(
+                queryset.filter(id__gt=last_id).order_by('id').values(*ARCHIVE_FIELDS)[:chunk_size]
+            )
+            if not rows:
+                break
+            writer.write_rows(rows)
+            archived += len(rows)
+            last_id = rows[-1]['id']
+
+            if delete:
+                ids = [row['id'] for row in rows]
+                for i in range(0, len(ids), delete_batch_size):
+                    with transaction.atomic():
+                        count, _ = Log.objects.filter(id__in=ids[i:i + delete_batch_size]).delete()
+                    deleted += count
+    return {'archived': archived, 'deleted': deleted}
+
+
+def read_archive(path):
+    """Arşiv dosyasındaki satırları sözlük olarak oku (payload JSON nesnesi olarak döner)"""
+    with gzip.open(path, 'rt', encoding='utf-8') as handle:
+        for line in handle:
+            if line.strip():
+                yield json.loads(line)
+
+
+def restore_logs(paths, batch_size=1000):
+    """Arşiv dosyalarındaki satırları Log tablosuna geri yükle.
+
+    Satırlar özgün id'leriyle eklenir; zaten var olanlar atlandığı için aynı
+    dosya birden çok kez yüklenebilir. event_code/payload alanı olmayan eski
+    arşivler varsayılan değerlerle yüklenir; silinmiş kullanıcılara ait
+    satırlarda user boş bırakılır. Okunan satır sayısını döndürür.
+    """
+    user_model = Log._meta.get_field('user').related_model
+    restored = 0
+    for path in paths:
+        rows = read_archive(path)
+        while True:
+            batch = [row for _, row in zip(range(batch_size), rows)]
+            if not batch:
+                break
+            user_ids = {row['user_id'] for row in batch if row.get('user_id') is not None}
+            existing_users = set(user_model.objects.filter(pk__in=user_ids).values_list('pk', flat=True))
+            Log.objects.bulk_create(
+                [
+                    Log(
+                        id=row['id'],
+                        timestamp=parse_datetime(row['timestamp']),
+                        level=row['level'],
+                        log_type=row['log_type'],
+                        user_id=row['user_id'] if row.get('user_id') in existing_users else None,
+                        ip_address=row.get('ip_address'),
+                        action=row['action'],
+                        details=row.get('details') or '',
+                        event_code=row.get('event_code') or '',
+                        payload=row.get('payload') or {},
+                    )
+                    for row in batch
+                ],
+                ignore_conflicts=True,
+            )
+            restored += len(batch)
+    return restored
+
+
+# PostgreSQL native bölümleme (partitioning)
+
+def is_postgresql():
+    return connection.vendor == 'postgresql'
+
+
+def is_log_table_partitioned():
+    """Log tablosu PostgreSQL'de bölümlenmiş (partitioned) bir tablo mu?"""
+    if not is_postgresql():
+        return False
+    with connection.cursor() as cursor:
+        cursor.execute(
+            "SELECT 1 FROM pg_partitioned_table pt "
+            "JOIN pg_class c ON c.oid = pt.partrelid WHERE c.relname = %s",
+            [Log._meta.db_table],
+        )
+        return cursor.fetchone() is not None
+
+
+def partition_name(month):
+    return f"{Log._meta.db_table}_p{month:%Y_%m}"
+
+
+def list_monthly_partitions():
+    """Aylık bölümleri (ad, ay başlangıcı) olarak döndür"""
+    with connection.cursor() as cursor:
+        cursor.execute(
+            "SELECT c.relname FROM pg_inherits i "
+            "JOIN pg_class c ON c.oid = i.inhrelid "
+            "JOIN pg_class p ON p.oid = i.inhparent WHERE p.relname = %s",
+            [Log._meta.db_table],
+        )
+        names = [row[0] for row in cursor.fetchall()]
+    partitions = []
+    for name in names:
+        match = PARTITION_NAME_RE.search(name)
+        if match:
+            month = datetime(int(match.group(1)), int(match.group(2)), 1, tzinfo=timezone.utc)
+            partitions.append((name, month))
+    return sorted(partitions, key=lambda item: item[1])
+
+
+def ensure_log_partitions(months_ahead=3, now=None):
+    """Bu ay ve sonraki `months_ahead` ay için bölümlerin var olduğundan emin ol"""
+    table = connection.ops.quote_name(Log._meta.db_table)
+    current = month_start(now or timezone.now())
+    existing = list_monthly_partitions()
+    # İlk aylık bölümden önceki aralık dönüştürülen eski tabloya aittir
+    first_month = existing[0][1] if existing else None
+    existing_names = {name for name, _ in existing}
+    created = []
+    with connection.cursor() as cursor:
+        for offset in range(months_ahead + 1):
+            lower = add_months(current, offset)
+            upper = add_months(lower, 1)
+            name = partition_name(lower)
+            if name in existing_names or (first_month and lower < first_month):
+                continue
+            cursor.execute(
+                f"CREATE TABLE {connection.ops.quote_name(name)} "
+                f"PARTITION OF {table} FOR VALUES FROM (%s) TO (%s)",
+                [lower, upper],
+            )
+            created.append(name)
+    return created
+
+
+def drop_expired_partitions(cutoff, archive_dir, chunk_size=5000):
+    """Tamamı `cutoff` öncesinde kalan aylık bölümleri arşivle, ayır ve sil.
+
+    Satır satır DELETE yerine DETACH + DROP kullanıldığı için silme bir metadata işlemidir.
+    """
+    table = connection.ops.quote_name(Log._meta.db_table)
+    dropped = []
+    archived = 0
+    for name, lower in list_monthly_partitions():
+        upper = add_months(lower, 1)
+        if upper > cutoff:
+            continue
+        result = archive_logs(upper, archive_dir, chunk_size=chunk_size, start=lower, delete=False)
+        archived += result['archived']
+        quoted = connection.ops.quote_name(name)
+        with transaction.atomic(), connection.cursor() as cursor:
+            cursor.execute(f"ALTER TABLE {table} DETACH PARTITION {quoted}")
+            cursor.execute(f"DROP TABLE {quoted}")
+        dropped.append(name)
+    return {'archived': archived, 'dropped': dropped}
+
+
+# Modelde tanımlanmayan, migration'larla (0006) oluşturulan PostgreSQL indeksleri: ad -> yöntem ve ifade
+POSTGRES_LOG_INDEXES = {
+    'log_payload_gin_idx': "USING gin (payload)",
+    LOG_FTS_INDEX: f"USING gin ({LOG_TSVECTOR_SQL})",
+}
+
+
+def log_index_names():
+    return [index.name for index in Log._meta.indexes] + list(POSTGRES_LOG_INDEXES)
+
+
+def create_log_indexes(cursor):
+    """Log modelindeki ve migration'lardaki GIN indekslerini (bölümlenmiş) Log tablosunda oluştur"""
+    table = connection.ops.quote_name(Log._meta.db_table)
+    with connection.schema_editor(atomic=False) as editor:
+        for index in Log._meta.indexes:
+            cursor.execute(str(index.create_sql(Log, editor)))
+    for name, definition in POSTGRES_LOG_INDEXES.items():
+        cursor.execute(f"CREATE INDEX {connection.ops.quote_name(name)} ON {table} {definition}")
+
+
+def convert_log_table_to_partitions(months_ahead=3):
+    """Mevcut Log tablosunu zaman damgasına göre aylık bölümlenmiş tabloya dönüştür.
+
+    Eski tablo, bir sonraki ay başına kadar olan aralığı kapsayan tek bir bölüm
+    olarak eklenir; yeni kayıtlar aylık bölümlere yazılır. Eski bölümdeki satırlar
+    süresi doldukça `archive_logs` ile silinir. Eski tablonun indeksleri `_legacy`
+    sonekiyle yeniden adlandırılır ve üst tabloda oluşturulan indekslere bağlanır.
+    """
+    if not is_postgresql():
+        raise RuntimeError("Log bölümleme yalnızca PostgreSQL üzerinde desteklenir.")
+    if is_log_table_partitioned():
+        return False
+
+    db_table = Log._meta.db_table
+    table = connection.ops.quote_name(db_table)
+    legacy = connection.ops.quote_name(f"{db_table}_legacy")
+    user_table = connection.ops.quote_name(Log._meta.get_field('user').related_model._meta.db_table)
+    boundary = add_months(month_start(timezone.now()), 1)
+
+    index_names = log_index_names()
+
+    with transaction.atomic(), connection.cursor() as cursor:
+        cursor.execute(f"LOCK TABLE {table} IN ACCESS EXCLUSIVE MODE")
+        cursor.execute(f"ALTER TABLE {table} RENAME TO {legacy}")
+        # İndeks adları şema genelinde tekildir; asıl adlar bölümlenmiş üst tabloya geçer
+        for name in index_names:
+            cursor.execute(
+                f"ALTER INDEX IF EXISTS {connection.ops.quote_name(name)} "
+                f"RENAME TO {connection.ops.quote_name(name + '_legacy')}"
+            )
+        cursor.execute(
+            f"CREATE TABLE {table} (LIKE {legacy} INCLUDING DEFAULTS INCLUDING CONSTRAINTS) "
+            f'PARTITION BY RANGE ("timestamp")'
+        )
+        # id dizisi eski tabloya bağlı kalırsa o bölümle birlikte silinir
+        cursor.execute("SELECT pg_get_serial_sequence(%s, 'id')", [f"{db_table}_legacy"])
+        sequence = cursor.fetchone()[0]
+        if sequence:
+            cursor.execute(f"ALTER SEQUENCE {sequence} OWNED BY {table}.id")
+        # Bölümlenmiş tablolarda benzersiz anahtarlar bölüm anahtarını içermelidir
+        cursor.execute(f'ALTER TABLE {table} ADD PRIMARY KEY (id, "timestamp")')
+        cursor.execute(
+            f"ALTER TABLE {table} ADD FOREIGN KEY (user_id) REFERENCES {user_table} (id) "
+            f"DEFERRABLE INITIALLY DEFERRED"
+        )
+        cursor.execute(f"CREATE INDEX ON {table} (user_id)")
+        cursor.execute(
+            f"ALTER TABLE {table} ATTACH PARTITION {legacy} FOR VALUES FROM (MINVALUE) TO (%s)",
+            [boundary],
+        )
+        # LIKE indeks kopyalamaz: indeksler üst tabloda oluşturulur, PostgreSQL bunları
+        # tüm bölümlere yayar. Eski bölümdeki eşdeğer indeksler yeniden kurulmaz, bağlanır.
+        create_log_indexes(cursor)
+        # Zamanında oluşturulmamış bir ay için yazımlar kaybolmasın
+        default = connection.ops.quote_name(f"{db_table}_default")
+        cursor.execute(f"CREATE TABLE {default} PARTITION OF {table} DEFAULT")
+    ensure_log_partitions(months_ahead, now=boundary)
+    return True
+
+
+def run_log_retention(max_age_days=None, archive_dir=None, chunk_size=None, delete_batch_size=None,
+                      use_partitions=None, partitions_ahead=None, now=None):
+    """Tek bir saklama (retention) turunu çalıştır ve özet döndür"""
+    config = get_log_retention_config()
+    max_age_days = config['MAX_AGE_DAYS'] if max_age_days is None else max_age_days
+    archive_dir = archive_dir or config['ARCHIVE_DIR']
+    chunk_size = chunk_size or config['CHUNK_SIZE']
+    delete_batch_size = delete_batch_size or config['DELETE_BATCH_SIZE']
+    if use_partitions is None:
+        use_partitions = config['POSTGRES_PARTITIONING']
+    partitions_ahead = config['PARTITIONS_AHEAD'] if partitions_ahead is None else partitions_ahead
+
+    now = now or timezone.now()
+    cutoff = now - timedelta(days=max_age_days)
+    summary = {'cutoff': cutoff, 'archived': 0, 'deleted': 0, 'dropped_partitions': []}
+
+    if use_partitions and is_log_table_partitioned():
+        ensure_log_partitions(partitions_ahead, now=now)
+        result = drop_expired_partitions(cutoff, archive_dir, chunk_size=chunk_size)
+        summary['archived'] += result['archived']
+        summary['dropped_partitions'] = result['dropped']
+
+    # Bölümlere denk gelmeyen (ya da bölümleme kapalıyken tüm) eski satırlar
+    result = archive_logs(cutoff, archive_dir, chunk_size=chunk_size, delete_batch_size=delete_batch_size)
+    summary['archived'] += result['archived']
+    summary['deleted'] += result['deleted']
+
+    logger.info(
+        f"Log saklama: {summary['archived']} kayıt arşivlendi, {summary['deleted']} kayıt silindi, "
+        f"{len(summary['dropped_partitions'])} bölüm kaldırıldı (sınır: {cutoff:%Y-%m-%d %H:%M})"
+    )
+    return summary
@@ -0,0 +1,65 @@
+import time
+
+from django.core.management.base import BaseCommand, CommandError
+
+from base.log_retention import (
+    convert_log_table_to_partitions, get_log_retention_config, run_log_retention,
+)
+
+
+class Command(BaseCommand):
+    help = (
+        "Saklama süresini aşan Log kayıtlarını gzip sıkıştırılmış JSONL dosyalarına "
+        "arşivler ve veritabanından siler. --loop ile zamanlanmış olarak çalışır."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('--days', type=int, help="Saklanacak gün sayısı (varsayılan: LOG_RETENTION['MAX_AGE_DAYS'])")
+        parser.add_argument('--archive-dir', help="Arşiv dizini (varsayılan: LOG_RETENTION['ARCHIVE_DIR'])")
+        parser.add_argument('--chunk-size', type=int, help="Tek seferde okunan satır sayısı")
+        parser.add_argument('--delete-batch-size', type=int, help="Tek DELETE ile silinen satır sayısı")
+        parser.add_argument(
+            '--partitions', dest='use_partitions', action='store_true', default=None,
+            help="PostgreSQL aylık bölümlerini kullan (eski bölümleri DROP ile kaldır)",
+        )
+        parser.add_argument(
+            '--no-partitions', dest='use_partitions', action='store_false',
+            help="Bölümleme ayarını yok say, yalnızca satır bazlı sil",
+        )
+        parser.add_argument(
+            '--convert-to-partitions', action='store_true',
+            help="Log tablosunu PostgreSQL aylık bölümlenmiş tabloya dönüştür ve çık",
+        )
+        parser.add_argument('--loop', action='store_true', help="Sürekli çalış ve her --interval saniyede bir tur at")
+        parser.add_argument('--interval', type=int, help="--loop için turlar arası saniye (varsayılan: LOG_RETENTION['INTERVAL'])")
+
+    def handle(self, *args, **options):
+        config = get_log_retention_config()
+
+        if options['convert_to_partitions']:
+            try:
+                converted = convert_log_table_to_partitions(config['PARTITIONS_AHEAD'])
+            except RuntimeError as e:
+                raise CommandError(str(e))
+            if converted:
+                self.stdout.write(self.style.SUCCESS("Log tablosu aylık bölümlere dönüştürüldü."))
+            else:
+                self.stdout.write("Log tablosu zaten bölümlenmiş.")
+            return
+
+        interval = options['interval'] or config['INTERVAL']
+        while True:
+            summary = run_log_retention(
+                max_age_days=options['days'],
+                archive_dir=options['archive_dir'],
+                chunk_size=options['chunk_size'],
+                delete_batch_size=options['delete_batch_size'],
+                use_partitions=options['use_partitions'],
+            )
+            self.stdout.write(
+                f"{summary['archived']} kayıt arşivlendi, {summary['deleted']} kayıt silindi, "
+                f"{len(summary['dropped_partitions'])} bölüm kaldırıldı."
+            )
+            if not options['loop']:
+                break
+            time.sleep(interval)
@@ -0,0 +1,89 @@
+import random
+import time
+
+from django.core.management.base import BaseCommand, CommandError
+from django.db import transaction
+
+from base.management.commands.bench_task_queries import delete_bench_data, get_bench_users, seed_tasks
+from base.models import Task, TaskDependence
+from base.task_graph import critical_path, load_graph, reachable_tasks, topological_order, would_create_cycle
+
+
+def seed_dependencies(task_ids, count, batch_size=5000):
+    """Döngüsüz rastgele bağımlılıklar ekle (kenarlar küçük id'den büyüğe, yakın görevlere)"""
+    task_ids = sorted(task_ids)
+    seen = set()
+    edges = []
+    while len(edges) < count:
+        index = random.randrange(len(task_ids) - 1)
+        target = min(len(task_ids) - 1, index + random.randint(1, 50))
+        edge = (task_ids[index], task_ids[target])
+        if edge not in seen:
+            seen.add(edge)
+            edges.append(edge)
+    for start in range(0, len(edges), batch_size):
+        with transaction.atomic():
+            TaskDependence.objects.bulk_create([
+                TaskDependence(task_id=before, dependent_task_id=after)
+                for before, after in edges[start:start + batch_size]
+            ])
+
+
+class Command(BaseCommand):
+    help = (
+        "Görev bağımlılık grafiğini sentetik veriyle ölçer: döngü denetimi, geçişli "
+        "blocked-by/blocks kümeleri, topolojik sıra ve kritik yol sürelerini yazdırır."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('--tasks', type=int, default=50000, help="Görev sayısı")
+        parser.add_argument('--edges', type=int, default=100000, help="Bağımlılık sayısı")
+        parser.add_argument('--repeat', type=int, default=5, help="Her ölçümün tekrar sayısı")
+        parser.add_argument('--batch-size', type=int, default=5000, help="bulk_create parti boyutu")
+        parser.add_argument('--keep', action='store_true', help="Ölçüm verisini silme")
+
+    def handle(self, *args, **options):
+        if options['tasks'] < 2 or options['edges'] < 1:
+            raise CommandError("--tasks en az 2, --edges pozitif olmalıdır.")
+
+        users = get_bench_users(1)
+        user = users[0]
+        try:
+            created = Task.objects.filter(user=user).count()
+            if options['tasks'] > created:
+                seed_tasks(users, options['tasks'] - created, options['batch_size'])
+            task_ids = list(Task.objects.filter(user=user).values_list('pk', flat=True)[:options['tasks']])
+            TaskDependence.objects.filter(task__user=user).delete()
+            seed_dependencies(task_ids, options['edges'], options['batch_size'])
+            self.stdout.write(self.style.MIGRATE_HEADING(f"{len(task_ids)} görev, {options['edges']} bağımlılık"))
+
+            first, last = min(task_ids), max(task_ids)
+            tasks = Task.objects.filter(user=user)
+            graph = {}
+
+            def load():
+                graph['nodes'], graph['edges'] = load_graph(tasks)
+
+            scenarios = [
+                ('döngü denetimi (son -> ilk)', lambda: would_create_cycle(last, first)),
+                ('blocks (ilk görevden aşağı)', lambda: reachable_tasks(first, downstream=True)),
+                ('blocked_by (son görevden yukarı)', lambda: reachable_tasks(last, downstream=False)),
+                ('grafiği yükle', load),
+                ('topolojik sıra', lambda: topological_order(graph['nodes'], graph['edges'])),
+                ('kritik yol', lambda: critical_path(graph['nodes'], graph['edges'])),
+            ]
+            for name, run in scenarios:
+                self.stdout.write(f"  {name:<40} {self.measure(run, options['repeat']):9.1f} ms")
+        finally:
+            if not options['keep']:
+                TaskDependence.objects.filter(task__user__in=users).delete()
+                delete_bench_data(users)
+
+    def measure(self, run, repeat):
+        """En iyi süreyi milisaniye olarak döndür"""
+        timings = []
+        for _ in range(repeat):
+            started = time.perf_counter()
+            run()
+            timings.append((time.perf_counter() - started) * 1000)
+        return min(timings)
@@ -0,0 +1,149 @@
+import random
+import time
+from datetime import timedelta
+
+from django.contrib.auth.models import User
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection, transaction
+from django.http import QueryDict
+from django.test import RequestFactory
+from django.utils import timezone
+from rest_framework.request import Request
+
+from base.filters import TaskFilterBackend
+from base.models import Task
+
+BENCH_USER_PREFIX = 'bench_task_user_'
+
+# (ad, sorgu parametreleri) - TaskFilterBackend üzerinden çalıştırılır
+SCENARIOS = [
+    ('varsayılan (-updated_at)', ''),
+    ('status=pending', 'status=pending'),
+    ('status=pending,in_progress&ordering=due_date', 'status=pending,in_progress&ordering=due_date'),
+    ('priority=critical', 'priority=critical'),
+    ('due_date aralığı', 'due_date_from={today}&due_date_to={next_week}&ordering=due_date'),
+    ('overdue=true', 'overdue=true&ordering=due_date'),
+]
+
+
+def get_bench_users(count):
+    """Ölçüm için ayrılmış kullanıcıları getir veya oluştur"""
+    users = []
+    for index in range(count):
+        user, _ = User.objects.get_or_create(username=f'{BENCH_USER_PREFIX}{index}')
+        users.append(user)
+    return users
+
+
+def seed_tasks(users, count, batch_size=5000):
+    """Kullanıcılara rastgele dağıtılmış sentetik görevler ekle"""
+    today = timezone.localdate()
+    statuses = [key for key, _ in Task.STATUS_CHOICES]
+    priorities = [key for key, _ in Task.PRIORITY_CHOICES]
+    while count > 0:
+        size = min(batch_size, count)
+        tasks = [
+            Task(
+                user=random.choice(users),
+                title=f'Bench görevi {random.randrange(10 ** 9)}',
+                status=random.choice(statuses),
+                priority=random.choice(priorities),
+                due_date=today + timedelta(days=random.randint(-180, 180)) if random.random() < 0.8 else None,
+            )
+            for _ in range(size)
+        ]
+        with transaction.atomic():
+            Task.objects.bulk_create(tasks, batch_size=size)
+        count -= size
+
+
+def delete_bench_data(users):
+    Task.objects.filter(user__in=users).delete()
+    User.objects.filter(pk__in=[user.pk for user in users]).delete()
+
+
+class Command(BaseCommand):
+    help = (
+        "Görev listesi filtrelerini sentetik veriyle ölçer: her veri boyutunda sorgu "
+        "sürelerini ve sorgu planlarını yazdırır, indeks kullanmayan sorguları işaretler."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--rows', type=int, nargs='+', default=[10000, 100000],
+            help="Ölçüm yapılacak toplam görev sayıları (artan sırada)",
+        )
+        parser.add_argument('--users', type=int, default=50, help="Görevlerin dağıtılacağı kullanıcı sayısı")
+        parser.add_argument('--repeat', type=int, default=20, help="Her sorgunun tekrar sayısı")
+        parser.add_argument('--page-size', type=int, default=50, help="Sorgu başına okunan satır sayısı")
+        parser.add_argument('--batch-size', type=int, default=5000, help="bulk_create parti boyutu")
+        parser.add_argument('--explain', action='store_true', help="Sorgu planlarını tam olarak yazdır")
+        parser.add_argument('--keep', action='store_true', help="Ölçüm verisini silme")
+
+    def handle(self, *args, **options):
+        sizes = sorted(options['rows'])
+        if sizes[0] < 1 or options['users'] < 1:
+            raise CommandError("--rows ve --users pozitif olmalıdır.")
+
+        users = get_bench_users(options['users'])
+        today = timezone.localdate()
+        params = {'today': today.isoformat(), 'next_week': (today + timedelta(days=7)).isoformat()}
+        try:
+            created = Task.objects.filter(user__in=users).count()
+            for size in sizes:
+                if size > created:
+                    seed_tasks(users, size - created, options['batch_size'])
+                    created = size
+                self.analyze()
+                self.stdout.write(self.style.MIGRATE_HEADING(f"\n{created} görev, {len(users)} kullanıcı"))
+                for name, query in SCENARIOS:
+                    self.run_scenario(name, query.format(**params), users[0], options)
+        finally:
+            if not options['keep']:
+                delete_bench_data(users)
+
+    def analyze(self):
+        with connection.cursor() as cursor:
+            if connection.vendor == 'postgresql':
+                cursor.execute(f'ANALYZE {Task._meta.db_table}')
+            elif connection.vendor == 'sqlite':
+                cursor.execute('ANALYZE')
+
+    def build_request(self, query, user):
+        request = Request(RequestFactory().get('/api/v1/tasks/'))
+        request._request.GET = QueryDict(query)
+        request.user = user
+        return request
+
+    def run_scenario(self, name, query, user, options):
+        request = self.build_request(query, user)
+        queryset = TaskFilterBackend().filter_queryset(request, Task.objects.filter(user=user), None)
+        queryset = queryset[:options['page_size']]
+
+        timings = []
+        for _ in range(options['repeat']):
+            started = time.perf_counter()
+            list(queryset.all())
+            timings.append((time.perf_counter() - started) * 1000)
+        timings.sort()
+        median = timings[len(timings) // 2]
+
+        plan = queryset.explain()
+        uses_index = self.plan_uses_index(plan)
+        status = self.style.SUCCESS('indeks') if uses_index else self.style.WARNING('TAM TARAMA')
+        self.stdout.write(f"  {name:<50} {median:8.2f} ms  {status}")
+        if options['explain'] or not uses_index:
+            for line in plan.splitlines():
+                self.stdout.write(f"      {line}")
+
+    def plan_uses_index(self, plan):
+        table = Task._meta.db_table
+        if connection.vendor == 'postgresql':
+            return f'Seq Scan on {table}' not in plan
+        if connection.vendor == 'sqlite':
+            # "SCAN base_task" tek başına tam tablo taraması demektir
+            for line in plan.splitlines():
+                if f'SCAN {table}' in line and 'USING' not in line:
+                    return False
+            return True
+        return True
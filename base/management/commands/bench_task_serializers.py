@@ -0,0 +1,89 @@
+import time
+
+from django.core.management.base import BaseCommand, CommandError
+from django.test import RequestFactory
+from rest_framework.renderers import JSONRenderer
+from rest_framework.request import Request
+
+from base.fast_serializers import ValuesSerializer
+from base.management.commands.bench_task_queries import delete_bench_data, get_bench_users, seed_tasks
+from base.models import Task
+from base.serializers import TaskSerializer
+
+
+class Command(BaseCommand):
+    help = (
+        "TaskSerializer ile .values() tabanlı hızlı okuma yolunu karşılaştırır: her veri "
+        "boyutunda saniyedeki satır sayısını (sorgu + serileştirme + JSON) ve yalnızca "
+        "serileştirme + JSON süresini yazdırır, iki yolun JSON çıktısının birebir aynı "
+        "olduğunu doğrular."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--rows', type=int, nargs='+', default=[1000, 10000, 100000],
+            help="Serileştirilecek görev sayıları (artan sırada)",
+        )
+        parser.add_argument('--repeat', type=int, default=3, help="Her ölçümün tekrar sayısı")
+        parser.add_argument('--batch-size', type=int, default=5000, help="bulk_create parti boyutu")
+        parser.add_argument('--keep', action='store_true', help="Ölçüm verisini silme")
+
+    def handle(self, *args, **options):
+        sizes = sorted(options['rows'])
+        if sizes[0] < 1:
+            raise CommandError("--rows pozitif olmalıdır.")
+
+        users = get_bench_users(1)
+        user = users[0]
+        request = Request(RequestFactory().get('/api/v1/tasks/'))
+        request.user = user
+        context = {'request': request}
+        renderer = JSONRenderer()
+        try:
+            created = Task.objects.filter(user=user).count()
+            self.stdout.write(
+                f"{'satır':>8}  {'TaskSerializer':>16}  {'hızlı yol':>16}  {'hız':>6}  "
+                f"{'serileştirme':>12}  {'hızlı serl.':>12}  {'hız':>6}  çıktı"
+            )
+            for size in sizes:
+                if size > created:
+                    seed_tasks(users, size - created, options['batch_size'])
+                    created = size
+                queryset = Task.objects.filter(user=user).order_by('-updated_at', '-id')[:size]
+
+                def classic(rows):
+                    return renderer.render(TaskSerializer(rows, many=True, context=context).data)
+
+                reader = ValuesSerializer(TaskSerializer(context=context))
+
+                def fast(rows):
+                    return renderer.render(reader.represent(rows))
+
+                classic_total, classic_serialize, classic_output = self.measure(
+                    lambda: list(queryset), classic, options['repeat'])
+                fast_total, fast_serialize, fast_output = self.measure(
+                    lambda: list(queryset.values(*reader.columns)), fast, options['repeat'])
+                identical = self.style.SUCCESS('aynı') if classic_output == fast_output else self.style.ERROR('FARKLI')
+                self.stdout.write(
+                    f"{size:>8}  {size / classic_total:>10.0f} sat/s  {size / fast_total:>10.0f} sat/s  "
+                    f"{classic_total / fast_total:>5.1f}x  "
+                    f"{classic_serialize * 1000:>9.1f} ms  {fast_serialize * 1000:>9.1f} ms  "
+                    f"{classic_serialize / fast_serialize:>5.1f}x  {identical}"
+                )
+        finally:
+            if not options['keep']:
+                delete_bench_data(users)
+
+    def measure(self, fetch, serialize, repeat):
+        """En iyi toplam süreyi, en iyi serileştirme+JSON süresini (saniye) ve son çıktıyı döndür"""
+        totals, serialize_times = [], []
+        output = None
+        for _ in range(repeat):
+            started = time.perf_counter()
+            rows = fetch()
+            fetched = time.perf_counter()
+            output = serialize(rows)
+            finished = time.perf_counter()
+            totals.append(finished - started)
+            serialize_times.append(finished - fetched)
+        return min(totals), min(serialize_times), output
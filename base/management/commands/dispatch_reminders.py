@@ -0,0 +1,33 @@
+import time
+
+from django.core.management.base import BaseCommand
+from django.utils.module_loading import import_string
+
+from base.reminders import dispatch_reminders, get_reminder_config
+
+
+class Command(BaseCommand):
+    help = (
+        "Zamanı gelmiş görev hatırlatmalarını (TaskSchedule.reminder_date) partiler halinde "
+        "gönderir; gönderim hızını ve gecikmeyi yazdırır. Birden çok işçi paralel çalışabilir."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('--batch-size', type=int, help="Parti boyutu (varsayılan: TASK_REMINDERS['BATCH_SIZE'])")
+        parser.add_argument('--notifier', help="Gönderici sınıfının yolu (varsayılan: TASK_REMINDERS['NOTIFIER'])")
+        parser.add_argument('--interval', type=int, help="Verilirse bu kadar saniyede bir yeniden çalışır (işçi döngüsü)")
+
+    def handle(self, *args, **options):
+        notifier = None
+        if options['notifier']:
+            notifier = import_string(options['notifier'])(**get_reminder_config()['NOTIFIER_OPTIONS'])
+        while True:
+            stats = dispatch_reminders(notifier, options['batch_size'])
+            self.stdout.write(
+                f"{stats['sent']} hatırlatma gönderildi, {stats['skipped']} atlandı "
+                f"({stats['batches']} parti, {stats['elapsed']:.2f} sn, {stats['throughput']:.0f}/sn); "
+                f"gecikme ort. {stats['avg_lag']:.0f} sn, en fazla {stats['max_lag']:.0f} sn"
+            )
+            if not options['interval']:
+                break
+            time.sleep(options['interval'])
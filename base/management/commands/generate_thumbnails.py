@@ -0,0 +1,40 @@
+from concurrent.futures import FIRST_COMPLETED, wait
+
+from django.core.management.base import BaseCommand
+
+from base.models import TaskAttachment
+from base.thumbnails import get_thumbnail_config, is_image, missing_thumbnails, queue_full, schedule_thumbnails
+
+
+class Command(BaseCommand):
+    help = (
+        "Küçük resmi eksik olan görüntü ekleri için küçük resimleri süreç havuzunda üretir "
+        "(ör. yeni bir boyut eklendikten veya ekler toplu aktarıldıktan sonra)."
+    )
+
+    def handle(self, *args, **options):
+        sizes = get_thumbnail_config()['SIZES']
+        attachments = TaskAttachment.objects.exclude(content_hash='').only(
+            'pk', 'file_name', 'file_path', 'content_hash', 'content_type',
+        )
+        seen = set()
+        running, done = set(), []
+        for attachment in attachments.iterator():
+            if attachment.content_hash in seen or not is_image(attachment):
+                continue
+            seen.add(attachment.content_hash)
+            if not missing_thumbnails(attachment.content_hash, sizes):
+                continue
+            future = schedule_thumbnails(attachment)
+            # None yalnızca kuyruk doluysa beklemeyi gerektirir; yapılacak iş yoksa
+            # (ör. blob eksik ya da başka süreç üretti) ek atlanır
+            while future is None and running and queue_full():
+                # Kuyruk dolu: bir işin bitmesini bekle
+                finished, running = wait(running, return_when=FIRST_COMPLETED)
+                done.extend(finished)
+                future = schedule_thumbnails(attachment)
+            if future is not None:
+                running.add(future)
+        done.extend(wait(running).done)
+        failed = sum(1 for future in done if future.exception() is not None)
+        self.stdout.write(f"{len(done) - failed} görüntünün küçük resimleri üretildi, {failed} görüntü okunamadı.")
@@ -0,0 +1,29 @@
+import time
+
+from django.core.management.base import BaseCommand, CommandError
+
+from base.recurrence import materialize_recurrences
+
+
+class Command(BaseCommand):
+    help = (
+        "Tekrarlanan görevlerin (TaskRecurrence) ufka kadarki örneklerini görev olarak üretir. "
+        "Tekrar tekrar veya birden çok süreçte aynı anda çalıştırılabilir; örnekler çoğalmaz."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('--horizon-days', type=int, help="Bugünden kaç gün sonrasına kadar (varsayılan: TASK_RECURRENCE['HORIZON_DAYS'])")
+        parser.add_argument('--batch-size', type=int, help="Tek işlemde işlenecek tekrar sayısı (varsayılan: TASK_RECURRENCE['BATCH_SIZE'])")
+        parser.add_argument('--interval', type=int, help="Verilirse bu kadar saniyede bir yeniden çalışır (zamanlayıcı döngüsü)")
+
+    def handle(self, *args, **options):
+        if options['horizon_days'] is not None and options['horizon_days'] < 0:
+            raise CommandError("--horizon-days negatif olamaz.")
+        while True:
+            started = time.perf_counter()
+            created = materialize_recurrences(options['horizon_days'], options['batch_size'])
+            elapsed = time.perf_counter() - started
+            self.stdout.write(f"{created} görev örneği oluşturuldu ({elapsed:.1f} sn).")
+            if not options['interval']:
+                break
+            time.sleep(options['interval'])
@@ -0,0 +1,21 @@
+from django.core.management.base import BaseCommand
+
+from base.attachments import prune_orphan_blobs
+from base.models import TaskAttachment
+
+
+class Command(BaseCommand):
+    help = (
+        "Hiçbir eke bağlı olmayan içerik blob'larını ve yarım kalmış yüklemelerin geçici "
+        "dosyalarını siler. Yeni yüklemeler ORPHAN_GRACE_SECONDS boyunca korunur."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('--grace-seconds', type=int, help="Varsayılan: ATTACHMENT_STORAGE['ORPHAN_GRACE_SECONDS']")
+
+    def handle(self, *args, **options):
+        referenced = set(
+            TaskAttachment.objects.exclude(content_hash='').values_list('content_hash', flat=True).distinct().iterator()
+        )
+        removed = prune_orphan_blobs(referenced, options['grace_seconds'])
+        self.stdout.write(f"{removed} sahipsiz dosya silindi ({len(referenced)} blob kullanımda).")
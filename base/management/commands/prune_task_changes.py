@@ -0,0 +1,17 @@
+from django.core.management.base import BaseCommand
+
+from base.task_changes import prune_task_changes
+
+
+class Command(BaseCommand):
+    help = (
+        "Delta senkronizasyon günlüğünden (TaskChange) saklama süresini aşan kayıtları siler. "
+        "Bu kayıtlardan önceki imleçler 410 döndürür ve istemci listeyi yeniden yükler."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('--days', type=int, help="Saklanacak gün sayısı (varsayılan: TASK_CHANGES['RETENTION_DAYS'])")
+
+    def handle(self, *args, **options):
+        deleted = prune_task_changes(options['days'])
+        self.stdout.write(f"{deleted} değişiklik kaydı silindi.")
@@ -0,0 +1,17 @@
+from django.core.management.base import BaseCommand
+
+from base.task_closure import rebuild_task_closure
+
+
+class Command(BaseCommand):
+    help = (
+        "Bağımlılık kapanış tablosunu (TaskClosure) TaskDependence satırlarından yeniden üretir. "
+        "Sinyal göndermeyen toplu yazımlardan (bulk_create, raw SQL) sonra çalıştırılır."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('--batch-size', type=int, default=5000, help="bulk_create parti boyutu")
+
+    def handle(self, *args, **options):
+        count = rebuild_task_closure(options['batch_size'])
+        self.stdout.write(f"{count} kapanış satırı yazıldı.")
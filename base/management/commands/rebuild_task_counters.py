@@ -0,0 +1,18 @@
+from django.core.management.base import BaseCommand
+
+from base.models import TaskCounter
+from base.task_stats import rebuild_task_counters
+
+
+class Command(BaseCommand):
+    help = (
+        "Görev panosu sayaçlarını (TaskCounter) görev tablosundan yeniden hesaplar. "
+        "TASK_STATS['COUNTERS'] sonradan açıldığında veya sayaçlar şüpheli olduğunda çalıştırılır."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('--user', type=int, action='append', dest='users', help="Yalnızca bu kullanıcı id'leri (tekrarlanabilir)")
+
+    def handle(self, *args, **options):
+        rebuild_task_counters(options['users'])
+        self.stdout.write(f"{TaskCounter.objects.count()} sayaç satırı yazıldı.")
@@ -0,0 +1,21 @@
+from django.core.management.base import BaseCommand, CommandError
+
+from base.log_retention import restore_logs
+
+
+class Command(BaseCommand):
+    help = (
+        "archive_logs ile oluşturulan gzip JSONL arşiv dosyalarını Log tablosuna geri yükler. "
+        "Var olan kayıtlar atlanır."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('paths', nargs='+', help="Arşiv dosyaları (log-YYYY-MM.jsonl.gz)")
+        parser.add_argument('--batch-size', type=int, default=1000, help="Tek INSERT ile eklenen satır sayısı")
+
+    def handle(self, *args, **options):
+        try:
+            restored = restore_logs(options['paths'], options['batch_size'])
+        except OSError as e:
+            raise CommandError(str(e))
+        self.stdout.write(self.style.SUCCESS(f"{restored} arşiv kaydı okundu ve geri yüklendi."))
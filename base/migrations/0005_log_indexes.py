@@ -0,0 +1,29 @@
+# Generated by Django 3.2.23 on 2026-10-18 04:04
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('base', '0004_alter_log_timestamp'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='log',
+            index=models.Index(fields=['-timestamp', '-id'], name='log_ts_id_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='log',
+            index=models.Index(fields=['level', '-timestamp'], name='log_level_ts_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='log',
+            index=models.Index(fields=['log_type', '-timestamp'], name='log_type_ts_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='log',
+            index=models.Index(fields=['user', '-timestamp'], name='log_user_ts_idx'),
+        ),
+    ]
@@ -0,0 +1,45 @@
+# Generated by Django 3.2.23 on 2026-10-18 04:06
+
+from django.db import migrations, models
+
+LOG_TSVECTOR_SQL = "to_tsvector('simple', coalesce(action, '') || ' ' || coalesce(details, ''))"
+
+
+def create_postgres_indexes(apps, schema_editor):
+    # SQLite FTS5 tablosu post_migrate sinyalinde oluşturulur (base.fulltext)
+    if schema_editor.connection.vendor != 'postgresql':
+        return
+    schema_editor.execute("CREATE INDEX IF NOT EXISTS log_payload_gin_idx ON base_log USING gin (payload)")
+    schema_editor.execute(f"CREATE INDEX IF NOT EXISTS log_details_fts_idx ON base_log USING gin ({LOG_TSVECTOR_SQL})")
+
+
+def drop_postgres_indexes(apps, schema_editor):
+    if schema_editor.connection.vendor != 'postgresql':
+        return
+    schema_editor.execute("DROP INDEX IF EXISTS log_payload_gin_idx")
+    schema_editor.execute("DROP INDEX IF EXISTS log_details_fts_idx")
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('base', '0005_log_indexes'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='log',
+            name='event_code',
+            field=models.CharField(blank=True, default='', max_length=50),
+        ),
+        migrations.AddField(
+            model_name='log',
+            name='payload',
+            field=models.JSONField(blank=True, default=dict),
+        ),
+        migrations.AddIndex(
+            model_name='log',
+            index=models.Index(fields=['event_code', '-timestamp'], name='log_event_ts_idx'),
+        ),
+        migrations.RunPython(create_postgres_indexes, drop_postgres_indexes),
+    ]
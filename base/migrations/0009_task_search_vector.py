@@ -0,0 +1,82 @@
+# Generated by Django 3.2.23 on 2026-10-18 09:12
+
+from django.db import migrations
+
+# Görev arama vektörü: başlık (A), açıklama (B) ve görevin tüm yorumları (C)
+TASK_SEARCH_FUNCTION_SQL = """
+CREATE OR REPLACE FUNCTION base_task_search_vector(bigint, text, text) RETURNS tsvector AS $$
+    SELECT setweight(to_tsvector('simple', coalesce($2, '')), 'A')
+        || setweight(to_tsvector('simple', coalesce($3, '')), 'B')
+        || setweight(to_tsvector('simple', coalesce(
+            (SELECT string_agg(c.comment, ' ') FROM base_taskcomment c WHERE c.task_id = $1), '')), 'C')
+$$ LANGUAGE sql STABLE
+"""
+
+TASK_SEARCH_TRIGGER_SQL = """
+CREATE OR REPLACE FUNCTION base_task_search_trigger() RETURNS trigger AS $$
+BEGIN
+    NEW.search_vector := base_task_search_vector(NEW.id, NEW.title, NEW.description);
+    RETURN NEW;
+END
+$$ LANGUAGE plpgsql
+"""
+
+# Yorum değişince yalnızca search_vector güncellenir; bu UPDATE görev tetikleyicisini çalıştırmaz
+COMMENT_SEARCH_TRIGGER_SQL = """
+CREATE OR REPLACE FUNCTION base_taskcomment_search_trigger() RETURNS trigger AS $$
+BEGIN
+    IF TG_OP IN ('UPDATE', 'DELETE') THEN
+        UPDATE base_task SET search_vector = base_task_search_vector(id, title, description) WHERE id = OLD.task_id;
+    END IF;
+    IF TG_OP IN ('INSERT', 'UPDATE') THEN
+        UPDATE base_task SET search_vector = base_task_search_vector(id, title, description) WHERE id = NEW.task_id;
+    END IF;
+    RETURN NULL;
+END
+$$ LANGUAGE plpgsql
+"""
+
+
+def create_postgres_search(apps, schema_editor):
+    # SQLite FTS5 tablosu post_migrate sinyalinde oluşturulur (base.fulltext)
+    if schema_editor.connection.vendor != 'postgresql':
+        return
+    schema_editor.execute("ALTER TABLE base_task ADD COLUMN IF NOT EXISTS search_vector tsvector")
+    schema_editor.execute(TASK_SEARCH_FUNCTION_SQL)
+    schema_editor.execute(TASK_SEARCH_TRIGGER_SQL)
+    schema_editor.execute(COMMENT_SEARCH_TRIGGER_SQL)
+    schema_editor.execute("DROP TRIGGER IF EXISTS base_task_search_update ON base_task")
+    schema_editor.execute(
+        "CREATE TRIGGER base_task_search_update BEFORE INSERT OR UPDATE OF title, description ON base_task "
+        "FOR EACH ROW EXECUTE PROCEDURE base_task_search_trigger()"
+    )
+    schema_editor.execute("DROP TRIGGER IF EXISTS base_taskcomment_search_update ON base_taskcomment")
+    schema_editor.execute(
+        "CREATE TRIGGER base_taskcomment_search_update AFTER INSERT OR UPDATE OR DELETE ON base_taskcomment "
+        "FOR EACH ROW EXECUTE PROCEDURE base_taskcomment_search_trigger()"
+    )
+    schema_editor.execute("UPDATE base_task SET search_vector = base_task_search_vector(id, title, description)")
+    schema_editor.execute("CREATE INDEX IF NOT EXISTS task_search_vector_idx ON base_task USING gin (search_vector)")
+
+
+def drop_postgres_search(apps, schema_editor):
+    if schema_editor.connection.vendor != 'postgresql':
+        return
+    schema_editor.execute("DROP TRIGGER IF EXISTS base_taskcomment_search_update ON base_taskcomment")
+    schema_editor.execute("DROP TRIGGER IF EXISTS base_task_search_update ON base_task")
+    schema_editor.execute("DROP FUNCTION IF EXISTS base_taskcomment_search_trigger()")
+    schema_editor.execute("DROP FUNCTION IF EXISTS base_task_search_trigger()")
+    schema_editor.execute("DROP FUNCTION IF EXISTS base_task_search_vector(bigint, text, text)")
+    schema_editor.execute("DROP INDEX IF EXISTS task_search_vector_idx")
+    schema_editor.execute("ALTER TABLE base_task DROP COLUMN IF EXISTS search_vector")
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('base', '0008_task_change_journal'),
+    ]
+
+    operations = [
+        migrations.RunPython(create_postgres_search, drop_postgres_search),
+    ]
@@ -0,0 +1,44 @@
+# Generated by Django 3.2.23 on 2026-10-18 04:27
+
+from django.conf import settings
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+def populate_task_counters(apps, schema_editor):
+    Task = apps.get_model('base', 'Task')
+    TaskCounter = apps.get_model('base', 'TaskCounter')
+    rows = (
+        Task.objects.using(schema_editor.connection.alias)
+        .filter(user__isnull=False).order_by()
+        .values('user_id', 'status', 'priority').annotate(count=models.Count('pk'))
+    )
+    TaskCounter.objects.using(schema_editor.connection.alias).bulk_create(
+        [TaskCounter(**row) for row in rows.iterator()], batch_size=1000,
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+        ('base', '0009_task_search_vector'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='TaskCounter',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('status', models.CharField(max_length=50)),
+                ('priority', models.CharField(max_length=50)),
+                ('count', models.IntegerField(default=0)),
+                ('user', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, to=settings.AUTH_USER_MODEL)),
+            ],
+        ),
+        migrations.AddConstraint(
+            model_name='taskcounter',
+            constraint=models.UniqueConstraint(fields=('user', 'status', 'priority'), name='taskcounter_user_bucket_uniq'),
+        ),
+        migrations.RunPython(populate_task_counters, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,76 @@
+# Generated by Django 3.2.23 on 2026-10-18 04:46
+
+from collections import defaultdict
+
+from django.db import migrations, models
+import django.db.models.deletion
+
+# Tamamlanan/iptal edilen görevlerden çıkan bağımlılıklar kimseyi engellemez
+CLOSED_STATUSES = ('completed', 'cancelled')
+
+
+def populate_task_closure(apps, schema_editor):
+    """Mevcut bağımlılıklardan kapanışı bellekte hesapla (ters topolojik sırada)"""
+    Task = apps.get_model('base', 'Task')
+    TaskDependence = apps.get_model('base', 'TaskDependence')
+    TaskClosure = apps.get_model('base', 'TaskClosure')
+    db = schema_editor.connection.alias
+
+    open_ids = set(Task.objects.using(db).exclude(status__in=CLOSED_STATUSES).values_list('pk', flat=True))
+    successors = defaultdict(list)
+    predecessors = defaultdict(list)
+    pending = defaultdict(int)
+    for before, after in TaskDependence.objects.using(db).values_list('task_id', 'dependent_task_id'):
+        if before in open_ids and before != after:
+            successors[before].append(after)
+            predecessors[after].append(before)
+            pending[before] += 1
+    nodes = set(successors) | set(predecessors)
+    order = [node for node in nodes if not pending[node]]
+    for node in order:
+        for before in predecessors[node]:
+            pending[before] -= 1
+            if not pending[before]:
+                order.append(before)
+
+    descendants = {}
+    rows = []
+    for node in order:
+        reach = {}
+        for after in successors[node]:
+            reach[after] = 1
+            for descendant, depth in descendants.get(after, {}).items():
+                if descendant != node and depth + 1 < reach.get(descendant, depth + 2):
+                    reach[descendant] = depth + 1
+        descendants[node] = reach
+        rows.extend(TaskClosure(ancestor_id=node, descendant_id=descendant, depth=depth)
+                    for descendant, depth in reach.items())
+    TaskClosure.objects.using(db).bulk_create(rows, batch_size=5000)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('base', '0011_task_version'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='TaskClosure',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('depth', models.PositiveIntegerField()),
+                ('ancestor', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='closure_descendants', to='base.task')),
+                ('descendant', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='closure_ancestors', to='base.task')),
+            ],
+        ),
+        migrations.AddIndex(
+            model_name='taskclosure',
+            index=models.Index(fields=['descendant', 'ancestor'], name='taskclosure_desc_idx'),
+        ),
+        migrations.AddConstraint(
+            model_name='taskclosure',
+            constraint=models.UniqueConstraint(fields=('ancestor', 'descendant'), name='taskclosure_pair_uniq'),
+        ),
+        migrations.RunPython(populate_task_closure, migrations.RunPython.noop),
+    ]
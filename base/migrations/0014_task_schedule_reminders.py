@@ -0,0 +1,37 @@
+# Generated by Django 3.2.23 on 2026-10-18 04:57
+
+from django.db import migrations, models
+from django.utils import timezone
+
+
+def skip_past_reminders(apps, schema_editor):
+    # Geçmiş tarihli hatırlatmalar ilk çalıştırmada toplu gönderilmesin
+    TaskSchedule = apps.get_model('base', 'TaskSchedule')
+    TaskSchedule.objects.using(schema_editor.connection.alias).filter(
+        reminder_date__lt=timezone.localdate(),
+    ).update(reminder_sent=True)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('base', '0013_task_recurrence_occurrences'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='taskschedule',
+            name='reminder_sent',
+            field=models.BooleanField(default=False),
+        ),
+        migrations.AddField(
+            model_name='taskschedule',
+            name='reminder_sent_at',
+            field=models.DateTimeField(blank=True, null=True),
+        ),
+        migrations.AddIndex(
+            model_name='taskschedule',
+            index=models.Index(condition=models.Q(('reminder_sent', False)), fields=['reminder_date'], name='schedule_reminder_due_idx'),
+        ),
+        migrations.RunPython(skip_past_reminders, migrations.RunPython.noop),
+    ]
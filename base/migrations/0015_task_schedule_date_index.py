@@ -0,0 +1,17 @@
+# Generated by Django 3.2.23 on 2026-10-18 04:59
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('base', '0014_task_schedule_reminders'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='taskschedule',
+            index=models.Index(fields=['schedule_date'], name='schedule_date_idx'),
+        ),
+    ]
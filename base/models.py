@@ -1,5 +1,6 @@
 from django.db import models
 from django.contrib.auth.models import User
+from django.utils import timezone
 import logging
 
 # Logger setup
@@ -20,18 +21,30 @@ class Log(models.Model):
         ('PERFORMANCE', 'Performans'),
     ]
     
-    timestamp = models.DateTimeField(auto_now_add=True)
+    # auto_now_add yerine default: tamponlu yazımda olay anı korunur
+    timestamp = models.DateTimeField(default=timezone.now)
     level = models.CharField(max_length=10, choices=LOG_LEVELS, default='INFO')
     log_type = models.CharField(max_length=15, choices=LOG_TYPES, default='OPERATION')
     user = models.ForeignKey(User, on_delete=models.SET_NULL, null=True, blank=True)
     ip_address = models.GenericIPAddressField(null=True, blank=True)
     action = models.CharField(max_length=100)
     details = models.TextField()
+    # Sorgulanabilir yapısal içerik (ör. görev id, değişen alanlar, eski/yeni değerler)
+    event_code = models.CharField(max_length=50, blank=True, default='')
+    payload = models.JSONField(default=dict, blank=True)
     
     class Meta:
         ordering = ['-timestamp']
         verbose_name = 'Log Kaydı'
         verbose_name_plural = 'Log Kayıtları'
+        # LogAdmin'in sıralama ve filtre kombinasyonlarına karşılık gelen indeksler
+        indexes = [
+            models.Index(fields=['-timestamp', '-id'], name='log_ts_id_idx'),
+            models.Index(fields=['level', '-timestamp'], name='log_level_ts_idx'),
+            models.Index(fields=['log_type', '-timestamp'], name='log_type_ts_idx'),
+            models.Index(fields=['user', '-timestamp'], name='log_user_ts_idx'),
+            models.Index(fields=['event_code', '-timestamp'], name='log_event_ts_idx'),
+        ]
     
     def __str__(self):
         return f"{self.timestamp} - {self.level} - {self.action}"
@@ -80,11 +93,77 @@ class Task(models.Model):
     due_date = models.DateField(blank=True, null=True)
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
+    # İyimser kilitleme: API üzerinden her yazımda artar (If-Match / ETag)
+    version = models.PositiveIntegerField(default=1)
+    # Tekrarlanan görevden üretilen örnekler (base.recurrence); kaynak silinince örnek kalır
+    recurrence = models.ForeignKey(
+        'TaskRecurrence', on_delete=models.SET_NULL, null=True, blank=True, related_name='occurrences',
+    )
+    occurrence_date = models.DateField(blank=True, null=True)
+
+    class Meta:
+        # Görev listesi filtreleri ve sıralamaları (base.filters.TaskFilterBackend) için
+        indexes = [
+            models.Index(fields=['user', 'status', 'due_date'], name='task_user_status_due_idx'),
+            models.Index(fields=['user', 'priority', 'updated_at'], name='task_user_prio_upd_idx'),
+            models.Index(fields=['user', '-updated_at', '-id'], name='task_user_upd_idx'),
+            models.Index(fields=['user', 'due_date', 'id'], name='task_user_due_idx'),
+        ]
+        constraints = [
+            # Aynı tekrarın aynı günü bir kez üretilir (eşzamanlı çalışan üreticiler dahil)
+            models.UniqueConstraint(fields=['recurrence', 'occurrence_date'], name='task_recurrence_occurrence_uniq'),
+        ]
+
+    @classmethod
+    def from_db(cls, db, field_names, values):
+        instance = super().from_db(db, field_names, values)
+        # Yüklendiği andaki (user_id, status, priority); sayaçlar ve bağımlılık kapanışı
+        # önceki durumu ek sorgu yapmadan buradan alır. Ertelenmiş alan varsa bilinmiyor.
+        loaded = instance.__dict__
+        if all(name in loaded for name in ('user_id', 'status', 'priority')):
+            instance._loaded_state = (loaded['user_id'], loaded['status'], loaded['priority'])
+        return instance
 
     def __str__(self):
         return self.title
 
 
+class TaskCounter(models.Model):
+    """Kullanıcı başına (durum, öncelik) görev sayaçları; görev değişikliklerinde artımlı güncellenir"""
+    user = models.ForeignKey(User, on_delete=models.CASCADE)
+    status = models.CharField(max_length=50)
+    priority = models.CharField(max_length=50)
+    count = models.IntegerField(default=0)
+
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(fields=['user', 'status', 'priority'], name='taskcounter_user_bucket_uniq'),
+        ]
+
+
+class TaskChange(models.Model):
+    """Görev değişiklik günlüğü; artan id delta senkronizasyonun sıra numarasıdır"""
+    ACTION_UPSERT = 'upsert'
+    ACTION_DELETE = 'delete'
+    ACTIONS = [
+        (ACTION_UPSERT, 'Oluşturuldu/Güncellendi'),
+        (ACTION_DELETE, 'Silindi'),
+    ]
+
+    id = models.BigAutoField(primary_key=True)
+    # Görev silindikten sonra da kayıt (tombstone) kalmalı, bu yüzden FK değil
+    task_id = models.BigIntegerField()
+    user = models.ForeignKey(User, on_delete=models.CASCADE, null=True, blank=True)
+    action = models.CharField(max_length=10, choices=ACTIONS)
+    created_at = models.DateTimeField(default=timezone.now)
+
+    class Meta:
+        indexes = [
+            models.Index(fields=['user', 'id'], name='taskchange_user_seq_idx'),
+            models.Index(fields=['created_at'], name='taskchange_created_idx'),
+        ]
+
+
 class TaskComment(models.Model):
     task = models.ForeignKey(Task, on_delete=models.CASCADE)
     user = models.ForeignKey(User, on_delete=models.SET_NULL, null=True, blank=True)
@@ -92,14 +171,31 @@ class TaskComment(models.Model):
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
 
+    class Meta:
+        indexes = [
+            # /tasks/<pk>/comments/: görev içinde (created_at, id) keyset sayfalama
+            models.Index(fields=['task', 'created_at', 'id'], name='comment_task_created_idx'),
+        ]
+
 
 class TaskAttachment(models.Model):
     task = models.ForeignKey(Task, on_delete=models.CASCADE)
     file_name = models.CharField(max_length=255)
+    # İçerik adresli depoda (base.attachments) blob'un göreli yolu
     file_path = models.CharField(max_length=255)
+    # SHA-256; aynı içerik diskte bir kez saklanır
+    content_hash = models.CharField(max_length=64, blank=True, db_index=True)
+    size = models.BigIntegerField(blank=True, null=True)
+    content_type = models.CharField(max_length=255, blank=True)
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
 
+    class Meta:
+        indexes = [
+            # /tasks/<pk>/attachments/: görev içinde (created_at, id) keyset sayfalama
+            models.Index(fields=['task', 'created_at', 'id'], name='attachment_task_created_idx'),
+        ]
+
 
 class TaskPriority(models.Model):
     task = models.ForeignKey(Task, on_delete=models.CASCADE)
@@ -112,13 +208,27 @@ class TaskSchedule(models.Model):
     task = models.ForeignKey(Task, on_delete=models.CASCADE)
     schedule_date = models.DateField(blank=True, null=True)
     reminder_date = models.DateField(blank=True, null=True)
+    # Hatırlatma gönderildi (base.reminders); reminder_date değişince sıfırlanır
+    reminder_sent = models.BooleanField(default=False)
+    reminder_sent_at = models.DateTimeField(blank=True, null=True)
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
 
+    class Meta:
+        indexes = [
+            # Takvim aralık sorgusu (base.task_calendar)
+            models.Index(fields=['schedule_date'], name='schedule_date_idx'),
+            # Gönderilmemiş hatırlatmalar tarih sırasıyla tablo taranmadan bulunur; kısmi
+            # indeks yalnızca bekleyen satırları içerir, gönderildikçe küçülür
+            models.Index(fields=['reminder_date'], condition=models.Q(reminder_sent=False), name='schedule_reminder_due_idx'),
+        ]
+
 
 class TaskRecurrence(models.Model):
     task = models.ForeignKey(Task, on_delete=models.CASCADE)
     recurrence_type = models.CharField(max_length=100)
+    # Bu tarihe kadarki örnekler görev olarak üretildi (base.recurrence.materialize_recurrences)
+    generated_until = models.DateField(blank=True, null=True)
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
 
@@ -132,6 +242,35 @@ class TaskDependence(models.Model):
     class Meta:
         unique_together = ('task', 'dependent_task')
 
+    @classmethod
+    def from_db(cls, db, field_names, values):
+        instance = super().from_db(db, field_names, values)
+        # Kenar güncellendiğinde kapanış tablosu eski kenarı da düzeltir
+        loaded = instance.__dict__
+        if 'task_id' in loaded and 'dependent_task_id' in loaded:
+            instance._loaded_edge = (loaded['task_id'], loaded['dependent_task_id'])
+        return instance
+
+
+class TaskClosure(models.Model):
+    """Etkin bağımlılıkların geçişli kapanışı: ancestor bitmeden descendant başlayamaz.
+
+    Yalnızca açık (tamamlanmamış/iptal edilmemiş) görevlerden çıkan kenarlar
+    etkindir; bu yüzden bir görevin descendant olarak satırı varsa engellidir.
+    depth en kısa yolun kenar sayısıdır.
+    """
+    ancestor = models.ForeignKey(Task, on_delete=models.CASCADE, related_name='closure_descendants')
+    descendant = models.ForeignKey(Task, on_delete=models.CASCADE, related_name='closure_ancestors')
+    depth = models.PositiveIntegerField()
+
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(fields=['ancestor', 'descendant'], name='taskclosure_pair_uniq'),
+        ]
+        indexes = [
+            models.Index(fields=['descendant', 'ancestor'], name='taskclosure_desc_idx'),
+        ]
+
 
 class History(models.Model):
     task = models.ForeignKey(Task, on_delete=models.CASCADE)
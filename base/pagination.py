@@ -0,0 +1,201 @@
+import base64
+import binascii
+import json
+from collections import OrderedDict
+
+from django.core.exceptions import ValidationError as DjangoValidationError
+from django.db.models import F, Q
+from rest_framework.exceptions import NotFound, ValidationError
+from rest_framework.pagination import BasePagination
+from rest_framework.response import Response
+from rest_framework.settings import api_settings
+from rest_framework.utils.urls import remove_query_param, replace_query_param
+
+LEGACY_API_KWARG = 'legacy_api'
+
+
+class KeysetPagination(BasePagination):
+    """(alan, id) çiftine göre keyset (imleç) sayfalama.
+
+    OFFSET ve COUNT(*) kullanılmaz; her sayfa indeksli bir aralık taramasıdır.
+    Sıralama alanı NULL içerebilir, NULL değerler her iki yönde de en sona konur.
+    Eski `/api/...` rotalarında istemci `?paginate=1`, `cursor` veya `page_size`
+    göndermedikçe sayfalama yapılmaz.
+    """
+    page_size = api_settings.PAGE_SIZE or 50
+    max_page_size = 200
+    page_size_query_param = 'page_size'
+    cursor_query_param = 'cursor'
+    ordering_query_param = 'ordering'
+    legacy_opt_in_query_param = 'paginate'
+    # Sorgu parametresindeki ad -> model alanı ('-' azalan)
+    orderings = {'-id': '-id'}
+    default_ordering = '-id'
+
+    def paginate_queryset(self, queryset, request, view=None):
+        self.request = request
+        if not self.is_enabled(request, view):
+            return None
+
+        self.page_size = self.get_page_size(request)
+        self.ordering_name = self.get_ordering_name(request)
+        field_name = self.orderings[self.ordering_name]
+        self.descending = field_name.startswith('-')
+        self.field_name = field_name.lstrip('-')
+        self.field = queryset.model._meta.get_field(self.field_name)
+        if self.field.primary_key:
+            self.field_name = 'pk'
+
+        cursor = self.decode_cursor(request)
+        reverse = bool(cursor and cursor.get('r'))
+        if cursor:
+            queryset = queryset.filter(self.position_filter(cursor['v'], cursor['i'], reverse))
+        rows = list(queryset.order_by(*self.order_expressions(reverse))[:self.page_size + 1])
+        has_more = len(rows) > self.page_size
+        rows = rows[:self.page_size]
+        if reverse:
+            rows.reverse()
+            self.has_previous, self.has_next = has_more, True
+        else:
+            self.has_previous, self.has_next = cursor is not None, has_more
+
+        self.next_position = self.position_of(rows[-1]) if rows and self.has_next else None
+        self.previous_position = self.position_of(rows[0]) if rows and self.has_previous else None
+        self.page = rows
+        return rows
+
+    def is_enabled(self, request, view):
+        if view is None or not getattr(view, 'kwargs', {}).get(LEGACY_API_KWARG):
+            return True
+        params = request.query_params
+        return (
+            params.get(self.legacy_opt_in_query_param) in ('1', 'true', 'True')
+            or self.cursor_query_param in params
+            or self.page_size_query_param in params
+        )
+
+    def get_page_size(self, request):
+        value = request.query_params.get(self.page_size_query_param)
+        if value is None:
+            return self.page_size
+        try:
+            page_size = int(value)
+        except ValueError:
+            raise ValidationError({self.page_size_query_param: "Geçersiz sayfa boyutu."})
+        if page_size < 1:
+            raise ValidationError({self.page_size_query_param: "Sayfa boyutu en az 1 olmalıdır."})
+        return min(page_size, self.max_page_size)
+
+    def get_ordering_name(self, request):
+        name = request.query_params.get(self.ordering_query_param, self.default_ordering)
+        if name not in self.orderings:
+            raise ValidationError({
+                self.ordering_query_param: f"Geçersiz sıralama. Geçerli değerler: {', '.join(self.orderings)}"
+            })
+        return name
+
+    def order_expressions(self, reverse=False):
+        descending = self.descending != reverse
+        if self.field_name == 'pk':
+            return ['-pk' if descending else 'pk']
+        # NULL değerler ileri yönde sonda, geri yönde başta
+        field = F(self.field_name).desc(nulls_last=not reverse, nulls_first=reverse) if descending \
+            else F(self.field_name).asc(nulls_last=not reverse, nulls_first=reverse)
+        return [field, '-pk' if descending else 'pk']
+
+    def position_filter(self, value, pk, reverse=False):
+        """İmleç konumundan sonra (reverse ise önce) gelen satırlar için koşul"""
+        op = 'lt' if self.descending != reverse else 'gt'
+        if self.field_name == 'pk':
+            return Q(**{f'pk__{op}': pk})
+        if value is None:
+            same_position = Q(**{f'{self.field_name}__isnull': True, f'pk__{op}': pk})
+            # NULL'lar en sonda: geri giderken NULL olmayan tüm satırlar öncedir
+            return same_position | Q(**{f'{self.field_name}__isnull': False}) if reverse else same_position
+        condition = Q(**{f'{self.field_name}__{op}': value}) | Q(**{self.field_name: value, f'pk__{op}': pk})
+        if self.field.null and not reverse:
+            condition |= Q(**{f'{self.field_name}__isnull': True})
+        return condition
+
+    def position_of(self, instance):
+        if isinstance(instance, dict):
+            # .values() satırları (hızlı okuma yolu)
+            pk = instance[self.field.model._meta.pk.attname]
+            value = None if self.field_name == 'pk' else instance[self.field.attname]
+            if value is not None:
+                value = value.isoformat() if hasattr(value, 'isoformat') else str(value)
+            return {'v': value, 'i': pk}
+        value = None if self.field_name == 'pk' else getattr(instance, self.field_name)
+        return {'v': self.field.value_to_string(instance) if value is not None else None, 'i': instance.pk}
+
+    def decode_cursor(self, request):
+        encoded = request.query_params.get(self.cursor_query_param)
+        if not encoded:
+            return None
+        try:
+            cursor = json.loads(base64.urlsafe_b64decode(encoded.encode('ascii')).decode('utf-8'))
+            if cursor.get('o') != self.ordering_name:
+                raise ValueError('ordering')
+            cursor['i'] = int(cursor['i'])
+            if cursor['v'] is not None and self.field_name != 'pk':
+                cursor['v'] = self.field.to_python(cursor['v'])
+        except (ValueError, TypeError, KeyError, AttributeError, binascii.Error, DjangoValidationError):
+            raise NotFound("Geçersiz imleç.")
+        return cursor
+
+    def encode_cursor(self, position, reverse=False):
+        cursor = {'o': self.ordering_name, 'v': position['v'], 'i': position['i']}
+        if reverse:
+            cursor['r'] = 1
+        encoded = base64.urlsafe_b64encode(json.dumps(cursor, separators=(',', ':')).encode('utf-8')).decode('ascii')
+        url = self.request.build_absolute_uri()
+        return replace_query_param(url, self.cursor_query_param, encoded)
+
+    def get_next_link(self):
+        if self.next_position is None:
+            return None
+        return self.encode_cursor(self.next_position)
+
+    def get_previous_link(self):
+        if not self.has_previous:
+            return None
+        if self.previous_position is None:
+            return remove_query_param(self.request.build_absolute_uri(), self.cursor_query_param)
+        return self.encode_cursor(self.previous_position, reverse=True)
+
+    def get_paginated_response(self, data):
+        return Response(OrderedDict([
+            ('next', self.get_next_link()),
+            ('previous', self.get_previous_link()),
+            ('results', data),
+        ]))
+
+    def get_paginated_response_schema(self, schema):
+        return {
+            'type': 'object',
+            'properties': {
+                'next': {'type': 'string', 'nullable': True},
+                'previous': {'type': 'string', 'nullable': True},
+                'results': schema,
+            },
+        }
+
+
+class TaskPagination(KeysetPagination):
+    """Görev listesi: (updated_at, id) veya (due_date, id) sıralı"""
+    orderings = {
+        '-updated_at': '-updated_at',
+        'updated_at': 'updated_at',
+        'due_date': 'due_date',
+        '-due_date': '-due_date',
+    }
+    default_ordering = '-updated_at'
+
+
+class TaskChildPagination(KeysetPagination):
+    """Görev altındaki yorum ve ekler: (task, created_at, id) indeksiyle, varsayılan eskiden yeniye"""
+    orderings = {
+        'created_at': 'created_at',
+        '-created_at': '-created_at',
+    }
+    default_ordering = 'created_at'
@@ -0,0 +1,162 @@
+import calendar
+from datetime import timedelta
+from itertools import islice
+
+from django.conf import settings
+from django.db import connection, transaction
+from django.db.models import Q
+from django.utils import timezone
+
+from .models import Task, TaskChange, TaskRecurrence
+from .task_cache import invalidate_task_lists
+from .task_changes import record_task_changes
+from .task_stats import track_task_counters
+
+DEFAULT_TASK_RECURRENCE = {
+    # Örnekler bugünden bu kadar gün sonrasına kadar görev olarak üretilir
+    'HORIZON_DAYS': 30,
+    # Tek işlemde kilitlenen tekrar sayısı ve bulk_create parti boyutu
+    'BATCH_SIZE': 1000,
+    # Önizleme endpoint'inin en fazla döndüreceği örnek sayısı
+    'PREVIEW_LIMIT': 366,
+}
+
+# Tekrar tipi -> (gün adımı, ay adımı)
+RECURRENCE_STEPS = {
+    'daily': (1, 0),
+    'weekly': (7, 0),
+    'monthly': (0, 1),
+    'yearly': (0, 12),
+}
+
+
+def get_recurrence_config():
+    """settings.TASK_RECURRENCE ayarlarını varsayılanlarla birleştir"""
+    config = dict(DEFAULT_TASK_RECURRENCE)
+    config.update(getattr(settings, 'TASK_RECURRENCE', {}))
+    return config
+
+
+def add_months(value, months):
+    """Ay ekle; ay sonunu aşan gün o ayın son gününe çekilir (31 Ocak -> 28/29 Şubat)"""
+    year, month = divmod(value.month - 1 + months, 12)
+    year += value.year
+    day = min(value.day, calendar.monthrange(year, month + 1)[1])
+    return value.replace(year=year, month=month + 1, day=day)
+
+
+def occurrence_dates(anchor, recurrence_type, start, end):
+    """anchor'dan başlayan tekrarın [start, end] aralığındaki tarihleri (anchor hariç).
+
+    Üreteçtir; liste oluşturmaz. Aralığın başına atlanır, anchor'dan itibaren
+    adım adım yürünmez. Aylık/yıllık tekrarda gün her seferinde anchor'dan
+    hesaplanır, böylece 31'inde başlayan tekrar kısa aydan sonra 31'e döner.
+    """
+    if recurrence_type not in RECURRENCE_STEPS or end < start:
+        return
+    days, months = RECURRENCE_STEPS[recurrence_type]
+    if days:
+        index = max(1, -(-(start - anchor).days // days))
+        current = anchor + timedelta(days=days * index)
+        while current <= end:
+            yield current
+            current += timedelta(days=days)
+        return
+    index = max(1, ((start.year - anchor.year) * 12 + start.month - anchor.month) // months)
+    current = add_months(anchor, months * index)
+    while current < start:
+        index += 1
+        current = add_months(anchor, months * index)
+    while current <= end:
+        yield current
+        index += 1
+        current = add_months(anchor, months * index)
+
+
+def recurrence_anchor(recurrence, template):
+    """Tekrarın başlangıcı: kaynak görevin bitiş tarihi, yoksa tekrarın oluşturulduğu gün"""
+    return template.due_date or timezone.localdate(recurrence.created_at)
+
+
+def pending_occurrences(recurrences, today, end):
+    """(tekrar, kaynak görev) çiftleri için henüz üretilmemiş örnekleri Task olarak üret"""
+    for recurrence in recurrences:
+        template = recurrence.task
+        start = today
+        if recurrence.generated_until is not None:
+            start = max(start, recurrence.generated_until + timedelta(days=1))
+        for occurrence in occurrence_dates(recurrence_anchor(recurrence, template), recurrence.recurrence_type, start, end):
+            yield Task(
+                user_id=template.user_id,
+                title=template.title,
+                description=template.description,
+                priority=template.priority,
+                due_date=occurrence,
+                recurrence_id=recurrence.pk,
+                occurrence_date=occurrence,
+            )
+
+
+def claim_recurrences(end, after_pk, batch_size):
+    """Ufku henüz kapsanmayan sıradaki tekrarları kilitle.
+
+    PostgreSQL'de SKIP LOCKED ile başka bir üreticinin işlediği satırlar atlanır;
+    diğer veritabanlarında yazımlar zaten sıralıdır.
+    """
+    queryset = (
+        TaskRecurrence.objects
+        .filter(Q(generated_until__isnull=True) | Q(generated_until__lt=end), pk__gt=after_pk)
+        .select_related('task')
+        .only(
+            'pk', 'recurrence_type', 'generated_until', 'created_at',
+            'task__user_id', 'task__title', 'task__description', 'task__priority', 'task__due_date',
+        )
+        .order_by('pk')
+    )
+    if connection.features.has_select_for_update_skip_locked:
+        queryset = queryset.select_for_update(skip_locked=True, of=('self',))
+    return list(queryset[:batch_size])
+
+
+def materialize_recurrences(horizon_days=None, batch_size=None, today=None):
+    """Tüm tekrarların ufka kadarki örneklerini görev olarak üret; oluşturulan görev sayısını döndür.
+
+    Her parti tek işlemdir: tekrarlar kilitlenir, örnekler bulk_create ile eklenir
+    ve generated_until ilerletilir. (recurrence, occurrence_date) tekil kısıtı ve
+    ignore_conflicts sayesinde yeniden çalıştırma veya aynı anda çalışan birden
+    çok üretici aynı örneği iki kez oluşturmaz. Geçmiş tarihler için örnek üretilmez.
+    """
+    config = get_recurrence_config()
+    horizon_days = config['HORIZON_DAYS'] if horizon_days is None else horizon_days
+    batch_size = batch_size or config['BATCH_SIZE']
+    today = today or timezone.localdate()
+    end = today + timedelta(days=horizon_days)
+
+    created_total = 0
+    after_pk = 0
+    while True:
+        with transaction.atomic():
+            recurrences = claim_recurrences(end, after_pk, batch_size)
+            if not recurrences:
+                break
+            after_pk = recurrences[-1].pk
+            started = timezone.now()
+            occurrences = pending_occurrences(recurrences, today, end)
+            while True:
+                chunk = list(islice(occurrences, batch_size))
+                if not chunk:
+                    break
+                Task.objects.bulk_create(chunk, batch_size=batch_size, ignore_conflicts=True)
+            TaskRecurrence.objects.filter(pk__in=[recurrence.pk for recurrence in recurrences]).update(generated_until=end)
+
+            # bulk_create sinyal göndermez; yeni görevler günlüğe, sayaçlara ve önbelleğe yansıtılır
+            created = list(
+                Task.objects.filter(recurrence__in=recurrences, created_at__gte=started)
+                .only('pk', 'user_id', 'status', 'priority')
+            )
+            if created:
+                record_task_changes(created, TaskChange.ACTION_UPSERT)
+                track_task_counters(created, created=True)
+                invalidate_task_lists({task.user_id for task in created})
+            created_total += len(created)
+    return created_total
@@ -0,0 +1,158 @@
+import json
+import logging
+import threading
+import time
+from datetime import datetime, time as dt_time
+
+from django.conf import settings
+from django.core.serializers.json import DjangoJSONEncoder
+from django.db import connection, transaction
+from django.utils import timezone
+from django.utils.module_loading import import_string
+
+from .filters import CLOSED_STATUSES
+from .models import TaskSchedule
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_TASK_REMINDERS = {
+    # send(reminders) metodu olan sınıfın yolu
+    'NOTIFIER': 'base.reminders.LogNotifier',
+    'NOTIFIER_OPTIONS': {},
+    # Tek işlemde kilitlenip gönderilen hatırlatma sayısı
+    'BATCH_SIZE': 500,
+}
+
+
+def get_reminder_config():
+    """settings.TASK_REMINDERS ayarlarını varsayılanlarla birleştir"""
+    config = dict(DEFAULT_TASK_REMINDERS)
+    config.update(getattr(settings, 'TASK_REMINDERS', {}))
+    return config
+
+
+class ReminderNotifier:
+    """Hatırlatma gönderici arayüzü.
+
+    send() bir partideki hatırlatma sözlüklerini alır; hata yükseltirse parti
+    gönderilmemiş sayılır ve bir sonraki çalıştırmada yeniden denenir.
+    """
+
+    def send(self, reminders):
+        raise NotImplementedError
+
+
+class LogNotifier(ReminderNotifier):
+    """Hatırlatmaları uygulama loguna yazar (varsayılan)"""
+
+    def send(self, reminders):
+        for reminder in reminders:
+            logger.info(f"Hatırlatma: görev {reminder['task_id']} '{reminder['title']}' (kullanıcı {reminder['user_id']})")
+
+
+class FileNotifier(ReminderNotifier):
+    """Hatırlatmaları dosyaya JSON satırları olarak ekler"""
+
+    def __init__(self, path):
+        self.path = path
+
+    def send(self, reminders):
+        with open(self.path, 'a', encoding='utf-8') as sink:
+            for reminder in reminders:
+                sink.write(json.dumps(reminder, cls=DjangoJSONEncoder, ensure_ascii=False) + '\n')
+
+
+class MemoryNotifier(ReminderNotifier):
+    """Hatırlatmaları süreç içi listede tutar (testler ve yerel geliştirme için)"""
+    outbox = []
+    _lock = threading.Lock()
+
+    def send(self, reminders):
+        with self._lock:
+            self.outbox.extend(reminders)
+
+
+def get_notifier():
+    config = get_reminder_config()
+    return import_string(config['NOTIFIER'])(**config['NOTIFIER_OPTIONS'])
+
+
+def claim_due_reminders(today, batch_size):
+    """Zamanı gelmiş, gönderilmemiş hatırlatmaları kilitle.
+
+    reminder_date üzerindeki kısmi indeks (schedule_reminder_due_idx,
+    reminder_sent=False koşullu) yalnızca bekleyen satırları içerir; tarama bu
+    indeks üzerinden sırayla yapıldığı için SKIP LOCKED ucuzdur ve paralel
+    çalışan işçiler birbirinin partisini atlar.
+    """
+    queryset = (
+        TaskSchedule.objects
+        .filter(reminder_sent=False, reminder_date__lte=today)
+        .select_related('task')
+        .only('pk', 'reminder_date', 'schedule_date', 'task__user_id', 'task__title', 'task__status', 'task__due_date')
+        .order_by('reminder_date', 'pk')
+    )
+    if connection.features.has_select_for_update_skip_locked:
+        queryset = queryset.select_for_update(skip_locked=True, of=('self',))
+    return list(queryset[:batch_size])
+
+
+def reminder_payload(schedule):
+    task = schedule.task
+    return {
+        'schedule_id': schedule.pk,
+        'task_id': task.pk,
+        'user_id': task.user_id,
+        'title': task.title,
+        'reminder_date': schedule.reminder_date,
+        'schedule_date': schedule.schedule_date,
+        'due_date': task.due_date,
+    }
+
+
+def dispatch_reminders(notifier=None, batch_size=None, today=None):
+    """Zamanı gelmiş tüm hatırlatmaları partiler halinde gönder ve istatistik döndür.
+
+    Her parti tek işlemdir: satırlar kilitlenir, açık görevlerinkiler gönderilir,
+    hepsi gönderildi olarak işaretlenir. Gönderici hata verirse işlem geri alınır
+    ve parti sonraki çalıştırmada yeniden denenir (en az bir kez teslim).
+    Tamamlanmış/iptal edilmiş görevlerin hatırlatmaları gönderilmeden kapatılır.
+    Gecikme, hatırlatma gününün başlangıcından gönderim anına kadar geçen süredir.
+    """
+    notifier = notifier or get_notifier()
+    batch_size = batch_size or get_reminder_config()['BATCH_SIZE']
+    today = today or timezone.localdate()
+
+    stats = {'sent': 0, 'skipped': 0, 'batches': 0, 'max_lag': 0.0, 'total_lag': 0.0}
+    started = time.perf_counter()
+    while True:
+        with transaction.atomic():
+            schedules = claim_due_reminders(today, batch_size)
+            if not schedules:
+                break
+            reminders = [reminder_payload(schedule) for schedule in schedules if schedule.task.status not in CLOSED_STATUSES]
+            if reminders:
+                notifier.send(reminders)
+            now = timezone.now()
+            TaskSchedule.objects.filter(pk__in=[schedule.pk for schedule in schedules]).update(
+                reminder_sent=True, reminder_sent_at=now,
+            )
+        for reminder in reminders:
+            due_at = timezone.make_aware(datetime.combine(reminder['reminder_date'], dt_time.min))
+            lag = max(0.0, (now - due_at).total_seconds())
+            stats['total_lag'] += lag
+            stats['max_lag'] = max(stats['max_lag'], lag)
+        stats['sent'] += len(reminders)
+        stats['skipped'] += len(schedules) - len(reminders)
+        stats['batches'] += 1
+
+    elapsed = time.perf_counter() - started
+    return {
+        'sent': stats['sent'],
+        'skipped': stats['skipped'],
+        'batches': stats['batches'],
+        'elapsed': elapsed,
+        'throughput': stats['sent'] / elapsed if elapsed else 0.0,
+        'avg_lag': stats['total_lag'] / stats['sent'] if stats['sent'] else 0.0,
+        'max_lag': stats['max_lag'],
+    }
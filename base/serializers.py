@@ -1,32 +1,36 @@
 from rest_framework import serializers
+from rest_framework.reverse import reverse
 from .models import (
     Task, UserProfile, Team, TaskComment, TaskAttachment, TaskPriority, TaskSchedule, TaskRecurrence, TaskDependence, History, TaskReport, UserTeams
 )
 from django.contrib.auth.models import User
+from .fieldsets import DynamicFieldsMixin
+from .attachments import store_upload
+from .thumbnails import get_thumbnail_config, is_image
 from datetime import date
 
-class UserSerializer(serializers.ModelSerializer):
+class UserSerializer(DynamicFieldsMixin, serializers.ModelSerializer):
     class Meta:
         model = User
         fields = ['id', 'username', 'email']
 
-class UserProfileSerializer(serializers.ModelSerializer):
+class UserProfileSerializer(DynamicFieldsMixin, serializers.ModelSerializer):
     user = UserSerializer(read_only=True)
     
     class Meta:
         model = UserProfile
         fields = '__all__'
 
-class TeamSerializer(serializers.ModelSerializer):
+class TeamSerializer(DynamicFieldsMixin, serializers.ModelSerializer):
     class Meta:
         model = Team
         fields = '__all__'
 
-class TaskSerializer(serializers.ModelSerializer):
+class TaskSerializer(DynamicFieldsMixin, serializers.ModelSerializer):
     class Meta:
         model = Task
         fields = '__all__'
-        read_only_fields = ['user', 'created_at', 'updated_at']
+        read_only_fields = ['user', 'created_at', 'updated_at', 'version', 'recurrence', 'occurrence_date']
 
     def validate_title(self, value):
         """Title validation"""
@@ -75,7 +79,12 @@ class TaskSerializer(serializers.ModelSerializer):
         
         return data
 
-class TaskCommentSerializer(serializers.ModelSerializer):
+class TaskListSerializer(TaskSerializer):
+    """Görev listesi: bağımlılık kapanışından gelen engel bilgisiyle (base.task_closure.annotate_blocking)"""
+    is_blocked = serializers.BooleanField(read_only=True)
+    blocking_count = serializers.IntegerField(read_only=True)
+
+class TaskCommentSerializer(DynamicFieldsMixin, serializers.ModelSerializer):
     class Meta:
         model = TaskComment
         fields = '__all__'
@@ -87,11 +96,25 @@ class TaskCommentSerializer(serializers.ModelSerializer):
             raise serializers.ValidationError("Yorum en az 5 karakter olmalıdır.")
         return value.strip()
 
-class TaskAttachmentSerializer(serializers.ModelSerializer):
+class TaskScopedCommentSerializer(TaskCommentSerializer):
+    """/tasks/<pk>/comments/: görev adresten gelir, yazar adı aynı sorguda okunur"""
+    # Yazarı silinmiş (user NULL) yorumlarda null
+    username = serializers.CharField(source='user.username', read_only=True, allow_null=True)
+
+    class Meta(TaskCommentSerializer.Meta):
+        read_only_fields = ['task', 'user', 'created_at', 'updated_at']
+
+class TaskAttachmentSerializer(DynamicFieldsMixin, serializers.ModelSerializer):
+    # Multipart ile yüklenen içerik; blob olarak saklanır, yanıtta yer almaz
+    file = serializers.FileField(write_only=True, required=False)
+    # Görüntü ekleri için {boyut: küçük resim adresi}, diğerleri için null
+    previews = serializers.SerializerMethodField()
+
     class Meta:
         model = TaskAttachment
         fields = '__all__'
-        read_only_fields = ['created_at', 'updated_at']
+        read_only_fields = ['file_path', 'content_hash', 'size', 'content_type', 'created_at', 'updated_at']
+        extra_kwargs = {'file_name': {'required': False}}
 
     def validate_file_name(self, value):
         """File name validation"""
@@ -99,7 +122,46 @@ class TaskAttachmentSerializer(serializers.ModelSerializer):
             raise serializers.ValidationError("Dosya adı boş olamaz.")
         return value.strip()
 
-class TaskPrioritySerializer(serializers.ModelSerializer):
+    def validate(self, data):
+        """Yeni ek için dosya zorunlu; ad verilmezse yüklenen dosyanın adı kullanılır"""
+        upload = data.get('file')
+        if self.instance is None and upload is None:
+            raise serializers.ValidationError({'file': "Dosya yüklenmelidir."})
+        if upload is not None and not data.get('file_name'):
+            data['file_name'] = upload.name
+        return data
+
+    def get_previews(self, obj):
+        if not is_image(obj):
+            return None
+        request = self.context.get('request')
+        # Adres içerik özetiyle sürümlenir; dosya değişince tarayıcı önbelleği atlanır
+        return {
+            str(size): reverse('api-taskattachment-thumbnail', kwargs={'pk': obj.pk, 'size': size}, request=request)
+            + f'?v={obj.content_hash[:12]}'
+            for size in get_thumbnail_config()['SIZES']
+        }
+
+    def store_file(self, validated_data):
+        upload = validated_data.pop('file', None)
+        if upload is not None:
+            validated_data['file_path'], validated_data['content_hash'], validated_data['size'] = store_upload(upload)
+            validated_data['content_type'] = upload.content_type or ''
+        return validated_data
+
+    def create(self, validated_data):
+        return super().create(self.store_file(validated_data))
+
+    def update(self, instance, validated_data):
+        return super().update(instance, self.store_file(validated_data))
+
+class TaskScopedAttachmentSerializer(TaskAttachmentSerializer):
+    """/tasks/<pk>/attachments/: görev adresten gelir"""
+
+    class Meta(TaskAttachmentSerializer.Meta):
+        read_only_fields = TaskAttachmentSerializer.Meta.read_only_fields + ['task']
+
+class TaskPrioritySerializer(DynamicFieldsMixin, serializers.ModelSerializer):
     class Meta:
         model = TaskPriority
         fields = '__all__'
@@ -111,11 +173,11 @@ class TaskPrioritySerializer(serializers.ModelSerializer):
             raise serializers.ValidationError("Öncelik adı en az 2 karakter olmalıdır.")
         return value.strip()
 
-class TaskScheduleSerializer(serializers.ModelSerializer):
+class TaskScheduleSerializer(DynamicFieldsMixin, serializers.ModelSerializer):
     class Meta:
         model = TaskSchedule
         fields = '__all__'
-        read_only_fields = ['created_at', 'updated_at']
+        read_only_fields = ['reminder_sent', 'reminder_sent_at', 'created_at', 'updated_at']
 
     def validate_schedule_date(self, value):
         """Schedule date validation"""
@@ -129,11 +191,18 @@ class TaskScheduleSerializer(serializers.ModelSerializer):
             raise serializers.ValidationError("Hatırlatma tarihi geçmiş bir tarih olamaz.")
         return value
 
-class TaskRecurrenceSerializer(serializers.ModelSerializer):
+    def update(self, instance, validated_data):
+        # Hatırlatma tarihi değişirse yeni tarihte yeniden gönderilir
+        if 'reminder_date' in validated_data and validated_data['reminder_date'] != instance.reminder_date:
+            validated_data['reminder_sent'] = False
+            validated_data['reminder_sent_at'] = None
+        return super().update(instance, validated_data)
+
+class TaskRecurrenceSerializer(DynamicFieldsMixin, serializers.ModelSerializer):
     class Meta:
         model = TaskRecurrence
         fields = '__all__'
-        read_only_fields = ['created_at', 'updated_at']
+        read_only_fields = ['generated_until', 'created_at', 'updated_at']
 
     def validate_recurrence_type(self, value):
         """Recurrence type validation"""
@@ -142,7 +211,7 @@ class TaskRecurrenceSerializer(serializers.ModelSerializer):
             raise serializers.ValidationError(f"Geçersiz tekrar tipi. Geçerli değerler: {', '.join(valid_types)}")
         return value
 
-class TaskDependenceSerializer(serializers.ModelSerializer):
+class TaskDependenceSerializer(DynamicFieldsMixin, serializers.ModelSerializer):
     class Meta:
         model = TaskDependence
         fields = '__all__'
@@ -154,7 +223,7 @@ class TaskDependenceSerializer(serializers.ModelSerializer):
             raise serializers.ValidationError("Görev kendisine bağımlı olamaz.")
         return data
 
-class HistorySerializer(serializers.ModelSerializer):
+class HistorySerializer(DynamicFieldsMixin, serializers.ModelSerializer):
     class Meta:
         model = History
         fields = '__all__'
@@ -166,7 +235,7 @@ class HistorySerializer(serializers.ModelSerializer):
             raise serializers.ValidationError("Görev adı en az 3 karakter olmalıdır.")
         return value.strip()
 
-class TaskReportSerializer(serializers.ModelSerializer):
+class TaskReportSerializer(DynamicFieldsMixin, serializers.ModelSerializer):
     class Meta:
         model = TaskReport
         fields = '__all__'
@@ -179,7 +248,7 @@ class TaskReportSerializer(serializers.ModelSerializer):
             raise serializers.ValidationError(f"Geçersiz rapor tipi. Geçerli değerler: {', '.join(valid_types)}")
         return value
 
-class UserTeamsSerializer(serializers.ModelSerializer):
+class UserTeamsSerializer(DynamicFieldsMixin, serializers.ModelSerializer):
     class Meta:
         model = UserTeams
         fields = '__all__'
@@ -205,4 +274,4 @@ class RegisterSerializer(serializers.ModelSerializer):
             email=validated_data.get('email', ''),
             password=validated_data['password']
         )
-        return user 
\ No newline at end of file
+        return user 
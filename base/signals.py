@@ -0,0 +1,27 @@
+from .models import TaskChange
+from .task_cache import invalidate_task_lists
+from .task_changes import record_task_changes
+from .task_closure import task_removed, task_status_changed
+from .task_stats import task_bucket, track_task_counters
+
+
+def task_saved(sender, instance, created=False, **kwargs):
+    """post_save: değişikliği günlüğe yaz, sayaçları ve bağımlılık kapanışını güncelle,
+    sahibinin liste önbelleğini geçersiz kıl"""
+    record_task_changes([instance], TaskChange.ACTION_UPSERT)
+    track_task_counters([instance], created=created)
+    if not created:
+        previous = getattr(instance, '_loaded_state', None)
+        task_status_changed(instance.pk, previous[1] if previous else None, instance.status)
+    invalidate_task_lists([instance.user_id])
+    # Aynı nesne yeniden kaydedilirse farklar bu durumdan hesaplanır
+    instance._loaded_state = task_bucket(instance)
+
+
+def task_deleted(sender, instance, **kwargs):
+    """post_delete (cascade dahil): silme kaydı (tombstone) yaz, sayaçları ve kapanışı düzelt,
+    önbelleği geçersiz kıl"""
+    record_task_changes([instance], TaskChange.ACTION_DELETE)
+    track_task_counters([instance], deleted=True)
+    task_removed(sender, instance)
+    invalidate_task_lists([instance.user_id])
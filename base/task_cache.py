@@ -0,0 +1,137 @@
+import hashlib
+import threading
+import time
+
+from django.conf import settings
+from django.core.cache import caches
+from django.db import transaction
+
+DEFAULT_TASK_LIST_CACHE = {
+    'ENABLED': False,
+    'ALIAS': 'default',
+    'TIMEOUT': 300,
+    'KEY_PREFIX': 'task_list',
+}
+
+# Admin listeleri tüm görevleri içerdiği için her değişiklikte bu sürüm de artar
+ALL_TASKS = 'all'
+
+
+def get_task_list_cache_config():
+    """settings.TASK_LIST_CACHE ayarlarını varsayılanlarla birleştir"""
+    config = dict(DEFAULT_TASK_LIST_CACHE)
+    config.update(getattr(settings, 'TASK_LIST_CACHE', {}))
+    return config
+
+
+class TaskListCache:
+    """Serileştirilmiş görev listesi yanıtlarının kullanıcı bazında sürümlü önbelleği.
+
+    Anahtarlar kullanıcının (admin için tüm görevlerin) sürüm numarasını içerir;
+    geçersiz kılma yalnızca sürümü artırır, eski kayıtlar TIMEOUT ile düşer.
+    Sürüm anahtarı kaybolursa yeni sürüm zamandan türetildiği için eski
+    kayıtlarla çakışmaz.
+    """
+
+    def __init__(self, alias='default', timeout=300, key_prefix='task_list'):
+        self.alias = alias
+        self.timeout = timeout
+        self.key_prefix = key_prefix
+
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.invalidations = 0
+
+    @property
+    def cache(self):
+        return caches[self.alias]
+
+    def owner(self, user):
+        return ALL_TASKS if user.is_staff or user.is_superuser else user.pk
+
+    def version_key(self, owner):
+        return f'{self.key_prefix}:v:{owner}'
+
+    def get_version(self, owner):
+        key = self.version_key(owner)
+        version = self.cache.get(key)
+        if version is None:
+            self.cache.add(key, int(time.time() * 1000), None)
+            version = self.cache.get(key)
+        return version
+
+    def lookup(self, user, path):
+        """(anahtar, kayıt) döndür; kayıt yoksa None.
+
+        Anahtar sorgudan önce okunan sürümü taşır; istek sırasında geçersiz
+        kılma olursa `set` ile yazılan kayıt hiç okunmaz.
+        """
+        version = self.get_version(self.owner(user))
+        digest = hashlib.md5(path.encode('utf-8')).hexdigest()
+        key = f'{self.key_prefix}:{user.pk}:{version}:{digest}'
+        entry = self.cache.get(key)
+        with self._lock:
+            if entry is None:
+                self.misses += 1
+            else:
+                self.hits += 1
+        return key, entry
+
+    def set(self, key, entry):
+        self.cache.set(key, entry, self.timeout)
+
+    def invalidate(self, user_ids):
+        """Verilen kullanıcıların ve admin listelerinin sürümünü artır"""
+        owners = {user_id for user_id in user_ids if user_id is not None}
+        owners.add(ALL_TASKS)
+        for owner in owners:
+            key = self.version_key(owner)
+            try:
+                self.cache.incr(key)
+            except ValueError:
+                self.cache.add(key, int(time.time() * 1000), None)
+        with self._lock:
+            self.invalidations += 1
+
+    def stats(self):
+        """İsabet/ıska sayaçlarını döndür (süreç bazında)"""
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                'backend': self.cache.__class__.__name__,
+                'hits': self.hits,
+                'misses': self.misses,
+                'hit_ratio': round(self.hits / lookups, 4) if lookups else None,
+                'invalidations': self.invalidations,
+            }
+
+
+_task_list_cache = None
+_task_list_cache_lock = threading.Lock()
+
+
+def get_task_list_cache():
+    """Ayarlarda etkinse süreç genelindeki TaskListCache örneğini döndür, değilse None"""
+    global _task_list_cache
+    config = get_task_list_cache_config()
+    if not config['ENABLED']:
+        return None
+    if _task_list_cache is None:
+        with _task_list_cache_lock:
+            if _task_list_cache is None:
+                _task_list_cache = TaskListCache(
+                    alias=config['ALIAS'],
+                    timeout=config['TIMEOUT'],
+                    key_prefix=config['KEY_PREFIX'],
+                )
+    return _task_list_cache
+
+
+def invalidate_task_lists(user_ids):
+    """İşlem başarıyla bittiğinde ilgili görev listesi önbelleklerini geçersiz kıl"""
+    task_cache = get_task_list_cache()
+    if task_cache is None:
+        return
+    user_ids = set(user_ids)
+    transaction.on_commit(lambda: task_cache.invalidate(user_ids))
@@ -0,0 +1,71 @@
+from collections import defaultdict
+from datetime import timedelta
+
+from django.conf import settings
+from django.db.models import Q
+
+from .models import Task, TaskRecurrence, TaskSchedule
+from .recurrence import occurrence_dates, recurrence_anchor
+
+DEFAULT_TASK_CALENDAR = {
+    # Tek istekte istenebilecek en uzun aralık (gün)
+    'MAX_DAYS': 366,
+    # start/end verilmezse bugünden itibaren gösterilen gün sayısı
+    'DEFAULT_DAYS': 31,
+}
+
+TASK_COLUMNS = ('title', 'status', 'priority', 'due_date')
+
+
+def get_calendar_config():
+    """settings.TASK_CALENDAR ayarlarını varsayılanlarla birleştir"""
+    config = dict(DEFAULT_TASK_CALENDAR)
+    config.update(getattr(settings, 'TASK_CALENDAR', {}))
+    return config
+
+
+def calendar_entries(user, start, end):
+    """[start, end] aralığındaki takvim girdilerini (gün, girdi) olarak üret.
+
+    Görev sayısı ve aralık uzunluğundan bağımsız olarak sabit sayıda sorgu:
+    bitiş tarihi (user, due_date) indeksiyle, planlar schedule_date indeksiyle
+    görevle tek JOIN'de okunur. Tekrarlar bellekte, yalnızca henüz görev olarak
+    üretilmemiş (generated_until sonrası) günler için genişletilir; üretilmiş
+    örnekler zaten bitiş tarihleriyle gelir.
+    """
+    # Görünürlük alt sorgu (task__in) yerine JOIN'deki sahip kolonuyla denetlenir; böylece
+    # SQLite tüm kullanıcı görevlerini değil tarih indeksini tarar
+    owner = Q() if user.is_staff or user.is_superuser else Q(task__user=user)
+    tasks = Task.objects.all() if user.is_staff or user.is_superuser else Task.objects.filter(user=user)
+    for row in tasks.filter(due_date__range=(start, end)).values('id', *TASK_COLUMNS):
+        yield row['due_date'], {'type': 'due', 'task': row}
+
+    schedules = (
+        TaskSchedule.objects.filter(owner, schedule_date__range=(start, end))
+        .values('id', 'schedule_date', 'task_id', *(f'task__{name}' for name in TASK_COLUMNS))
+    )
+    for row in schedules:
+        task = {'id': row['task_id'], **{name: row[f'task__{name}'] for name in TASK_COLUMNS}}
+        yield row['schedule_date'], {'type': 'schedule', 'schedule': row['id'], 'task': task}
+
+    recurrences = (
+        TaskRecurrence.objects.filter(owner, Q(generated_until__isnull=True) | Q(generated_until__lt=end))
+        .select_related('task')
+        .only('id', 'recurrence_type', 'generated_until', 'created_at', 'task__id', *(f'task__{name}' for name in TASK_COLUMNS))
+    )
+    for recurrence in recurrences:
+        template = recurrence.task
+        first = start
+        if recurrence.generated_until is not None:
+            first = max(start, recurrence.generated_until + timedelta(days=1))
+        task = {'id': template.pk, **{name: getattr(template, name) for name in TASK_COLUMNS}}
+        for day in occurrence_dates(recurrence_anchor(recurrence, template), recurrence.recurrence_type, first, end):
+            yield day, {'type': 'recurrence', 'recurrence': recurrence.pk, 'task': {**task, 'due_date': day}}
+
+
+def build_calendar(user, start, end):
+    """Kullanıcının görebildiği girdileri güne göre grupla: [{"date": ..., "items": [...]}], yalnızca dolu günler"""
+    days = defaultdict(list)
+    for day, entry in calendar_entries(user, start, end):
+        days[day].append(entry)
+    return [{'date': day, 'items': days[day]} for day in sorted(days)]
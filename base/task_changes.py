@@ -0,0 +1,135 @@
+import base64
+import binascii
+import json
+import time
+from datetime import timedelta
+
+from django.conf import settings
+from django.utils import timezone
+from rest_framework import status
+from rest_framework.exceptions import APIException, NotFound, ValidationError
+
+from .models import TaskChange
+
+DEFAULT_TASK_CHANGES = {
+    'RETENTION_DAYS': 30,
+    'SETTLE_SECONDS': 2,
+    'PAGE_SIZE': 500,
+    'MAX_PAGE_SIZE': 1000,
+}
+
+
+def get_task_changes_config():
+    """settings.TASK_CHANGES ayarlarını varsayılanlarla birleştir"""
+    config = dict(DEFAULT_TASK_CHANGES)
+    config.update(getattr(settings, 'TASK_CHANGES', {}))
+    return config
+
+
+class CursorExpired(APIException):
+    status_code = status.HTTP_410_GONE
+    default_detail = "İmleç saklama süresini aştı; görev listesini yeniden yükleyin."
+    default_code = 'cursor_expired'
+
+
+def record_task_changes(tasks, action):
+    """Görevler için değişiklik günlüğüne kayıt ekle (tek INSERT)"""
+    TaskChange.objects.bulk_create([
+        TaskChange(task_id=task.pk, user_id=task.user_id, action=action) for task in tasks
+    ])
+
+
+def encode_cursor(seq, position_time):
+    """İmleç: son okunan sıra numarası ve o kaydın zamanı (saklama süresi denetimi için)"""
+    cursor = {'s': seq, 't': int(position_time.timestamp())}
+    return base64.urlsafe_b64encode(json.dumps(cursor, separators=(',', ':')).encode('utf-8')).decode('ascii')
+
+
+def decode_cursor(encoded):
+    """İmleçten sıra numarasını çöz; süresi geçmişse CursorExpired yükselt"""
+    try:
+        cursor = json.loads(base64.urlsafe_b64decode(encoded.encode('ascii')).decode('utf-8'))
+        seq, position_time = int(cursor['s']), int(cursor['t'])
+    except (ValueError, TypeError, KeyError, AttributeError, binascii.Error):
+        raise NotFound("Geçersiz imleç.")
+    retention = get_task_changes_config()['RETENTION_DAYS'] * 86400
+    # Bu konumdan sonraki kayıtlar budanmış olabilir
+    if position_time < time.time() - retention:
+        raise CursorExpired()
+    return seq
+
+
+def get_limit(value, config):
+    if value is None:
+        return config['PAGE_SIZE']
+    try:
+        limit = int(value)
+    except ValueError:
+        raise ValidationError({'limit': "Geçersiz sayı."})
+    if limit < 1:
+        raise ValidationError({'limit': "En az 1 olmalıdır."})
+    return min(limit, config['MAX_PAGE_SIZE'])
+
+
+def read_changes(journal, seq, limit, settled_before):
+    """seq sonrasındaki oturmuş günlük kayıtlarını oku.
+
+    Yeni eklenen kayıtlar henüz commit edilmemiş daha küçük sıra numaralı
+    kayıtların arkasında kalabilir; bu yüzden SETTLE_SECONDS'tan genç ilk
+    kayıtta durulur ve imleç onun ötesine geçmez.
+    (kayıtlar, devamı var mı) döndürür.
+    """
+    rows = list(
+        journal.filter(id__gt=seq).order_by('id').values_list('id', 'task_id', 'action', 'created_at')[:limit + 1]
+    )
+    has_more = len(rows) > limit
+    rows = rows[:limit]
+    for index, row in enumerate(rows):
+        if row[3] > settled_before:
+            # Sonraki kayıtlar bir sonraki yoklamada okunur
+            return rows[:index], False
+    return rows, has_more
+
+
+def latest_seq(journal, settled_before):
+    """Başlangıç imleci için oturmuş en son sıra numarası"""
+    return journal.filter(created_at__lte=settled_before).order_by('-id').values_list('id', flat=True).first() or 0
+
+
+def collect_changes(journal, tasks, cursor, limit=None):
+    """Görev değişikliklerini imleçten itibaren topla.
+
+    `journal` kullanıcının görebildiği TaskChange kayıtları, `tasks` görebildiği
+    görevlerdir. Aynı görevin birden çok kaydı tek sonuca indirgenir; günlükte
+    güncellenmiş görünen ama artık görülemeyen görevler silinmiş sayılır.
+    (güncel görevler, silinen id'ler, yeni imleç, devamı var mı) döndürür.
+    """
+    config = get_task_changes_config()
+    limit = get_limit(limit, config)
+    settled_before = timezone.now() - timedelta(seconds=config['SETTLE_SECONDS'])
+    if cursor is None:
+        return [], [], encode_cursor(latest_seq(journal, settled_before), settled_before), False
+
+    seq = decode_cursor(cursor)
+    rows, has_more = read_changes(journal, seq, limit, settled_before)
+    latest = {}
+    for _, task_id, action, _ in rows:
+        latest[task_id] = action
+    upsert_ids = [task_id for task_id, action in latest.items() if action == TaskChange.ACTION_UPSERT]
+    changed = list(tasks.filter(pk__in=upsert_ids).order_by('pk')) if upsert_ids else []
+    found = {task.pk for task in changed}
+    deleted = sorted(task_id for task_id in latest if task_id not in found)
+    if rows:
+        next_cursor = encode_cursor(rows[-1][0], rows[-1][3])
+    else:
+        # Okunacak oturmuş kayıt yok: sonraki kayıtlar settled_before'dan yenidir
+        next_cursor = encode_cursor(seq, settled_before)
+    return changed, deleted, next_cursor, has_more
+
+
+def prune_task_changes(days=None):
+    """Saklama süresinden eski günlük kayıtlarını sil; silinen sayıyı döndür"""
+    days = days if days is not None else get_task_changes_config()['RETENTION_DAYS']
+    cutoff = timezone.now() - timedelta(days=days)
+    deleted, _ = TaskChange.objects.filter(created_at__lt=cutoff).delete()
+    return deleted
@@ -0,0 +1,225 @@
+from collections import defaultdict
+
+from django.db import connection, transaction
+from django.db.models import Count, Exists, IntegerField, Max, OuterRef, Q, Subquery, Value
+from django.db.models.functions import Coalesce
+
+from .filters import CLOSED_STATUSES
+from .models import Task, TaskClosure, TaskDependence
+from .task_cache import invalidate_task_lists
+
+
+def is_open(status):
+    """Açık görevlerden çıkan bağımlılıklar etkindir"""
+    return status not in CLOSED_STATUSES
+
+
+def closure_min_function():
+    return 'LEAST' if connection.vendor == 'postgresql' else 'MIN'
+
+
+def invalidate_owners(task_ids):
+    """Engel bilgisi değişen görevlerin sahiplerinin liste önbelleğini geçersiz kıl"""
+    if task_ids:
+        invalidate_task_lists(set(Task.objects.filter(pk__in=task_ids).values_list('user_id', flat=True)))
+
+
+def annotate_blocking(queryset):
+    """is_blocked (açık bir ön koşulu var mı) ve blocking_count (geçişli olarak engellediği
+    görev sayısı) anotasyonları; ikisi de kapanış tablosunda tek indeks aramasıdır"""
+    blocking = (
+        TaskClosure.objects.filter(ancestor=OuterRef('pk')).order_by()
+        .values('ancestor').annotate(count=Count('pk')).values('count')
+    )
+    return queryset.annotate(
+        is_blocked=Exists(TaskClosure.objects.filter(descendant=OuterRef('pk'))),
+        blocking_count=Coalesce(Subquery(blocking, output_field=IntegerField()), Value(0)),
+    )
+
+
+def closure_state(queryset):
+    """Görevlere dokunan kapanış satırlarının özeti (liste ETag'i için)"""
+    state = TaskClosure.objects.filter(
+        Q(descendant__in=queryset.values('pk')) | Q(ancestor__in=queryset.values('pk'))
+    ).aggregate(count=Count('pk'), last=Max('pk'))
+    return state['count'], state['last']
+
+
+def add_active_edge(task_id, dependent_task_id):
+    """Etkin task -> dependent_task kenarı için kapanışa yeni çiftleri tek sorguda ekle.
+
+    task'ın ataları (kendisi dahil) x dependent_task'ın torunları (kendisi dahil)
+    çarpımı eklenir; var olan çiftlerde en kısa derinlik korunur.
+    """
+    table = TaskClosure._meta.db_table
+    with connection.cursor() as cursor:
+        cursor.execute(
+            f"INSERT INTO {table} (ancestor_id, descendant_id, depth) "
+            f"SELECT up.ancestor_id, down.descendant_id, up.depth + down.depth + 1 FROM "
+            f"(SELECT %s AS ancestor_id, 0 AS depth"
+            f" UNION ALL SELECT ancestor_id, depth FROM {table} WHERE descendant_id = %s AND ancestor_id <> %s) up "
+            f"CROSS JOIN "
+            f"(SELECT %s AS descendant_id, 0 AS depth"
+            f" UNION ALL SELECT descendant_id, depth FROM {table} WHERE ancestor_id = %s AND descendant_id <> %s) down "
+            f"WHERE up.ancestor_id <> down.descendant_id "
+            f"ON CONFLICT (ancestor_id, descendant_id) "
+            f"DO UPDATE SET depth = {closure_min_function()}({table}.depth, excluded.depth)",
+            [task_id, task_id, task_id, dependent_task_id, dependent_task_id, dependent_task_id],
+        )
+        cursor.execute(f"SELECT ancestor_id FROM {table} WHERE descendant_id = %s", [task_id])
+        affected = {task_id, dependent_task_id, *(row[0] for row in cursor.fetchall())}
+    affected.update(TaskClosure.objects.filter(ancestor_id=dependent_task_id).values_list('descendant_id', flat=True))
+    invalidate_owners(affected)
+
+
+def reverse_topological_order(nodes, edges):
+    """Önce ardılları işlenmiş olacak şekilde düğüm sırası (torunlardan atalara).
+
+    Önceden kaydedilmiş döngülerdeki düğümler sona eklenir (kapanışları yaklaşıktır).
+    """
+    predecessors = defaultdict(list)
+    pending = {node: 0 for node in nodes}
+    for before, after in edges:
+        if before != after:
+            predecessors[after].append(before)
+            pending[before] += 1
+    order = [node for node, count in pending.items() if count == 0]
+    for node in order:
+        for before in predecessors[node]:
+            pending[before] -= 1
+            if pending[before] == 0:
+                order.append(before)
+    order.extend(node for node, count in pending.items() if count > 0)
+    return order
+
+
+def recompute_ancestors(*task_ids):
+    """Görevlerden çıkan etkin yollar değiştiğinde (kenar silme, görev kapanması) kapanışı düzelt.
+
+    Yalnızca verilen görevler ve ataları etkilenir. Bunların satırları silinip ters
+    topolojik sırada (önce torunlar) her düğüm için tek INSERT ... SELECT ile yeniden
+    üretilir: düğümün etkin kenarları ve ardıllarının (güncel) kapanışı.
+    """
+    table = TaskClosure._meta.db_table
+    dependence_table = TaskDependence._meta.db_table
+    ancestors = {*task_ids, *TaskClosure.objects.filter(descendant_id__in=task_ids).values_list('ancestor_id', flat=True)}
+    if not ancestors:
+        return
+    affected = set(ancestors)
+    affected.update(
+        TaskClosure.objects.filter(ancestor_id__in=ancestors).values_list('descendant_id', flat=True)
+    )
+    statuses = dict(Task.objects.filter(pk__in=ancestors).values_list('pk', 'status'))
+
+    edges = TaskDependence.objects.filter(task_id__in=ancestors).values_list('task_id', 'dependent_task_id')
+    order = reverse_topological_order(ancestors, [(before, after) for before, after in edges if after in ancestors])
+
+    TaskClosure.objects.filter(ancestor_id__in=ancestors).delete()
+    with connection.cursor() as cursor:
+        for node in order:
+            if node not in statuses or not is_open(statuses[node]):
+                continue
+            cursor.execute(
+                f"INSERT INTO {table} (ancestor_id, descendant_id, depth) "
+                f"SELECT %s, reach.descendant_id, MIN(reach.depth) FROM ("
+                f" SELECT d.dependent_task_id AS descendant_id, 1 AS depth FROM {dependence_table} d"
+                f" WHERE d.task_id = %s"
+                f" UNION ALL"
+                f" SELECT c.descendant_id, c.depth + 1 FROM {dependence_table} d"
+                f" JOIN {table} c ON c.ancestor_id = d.dependent_task_id WHERE d.task_id = %s"
+                f") reach WHERE reach.descendant_id <> %s GROUP BY reach.descendant_id",
+                [node, node, node, node],
+            )
+    invalidate_owners(affected)
+
+
+def edge_created(task_id, dependent_task_id):
+    if is_open(Task.objects.filter(pk=task_id).values_list('status', flat=True).first()):
+        add_active_edge(task_id, dependent_task_id)
+
+
+def dependence_saved(sender, instance, created=False, **kwargs):
+    """post_save (TaskDependence): yeni kenarı kapanışa ekle, güncellenen kenarda eskisini düzelt"""
+    with transaction.atomic(savepoint=False):
+        previous = getattr(instance, '_loaded_edge', None)
+        current = (instance.task_id, instance.dependent_task_id)
+        if not created and previous is not None and previous != current:
+            recompute_ancestors(previous[0])
+        if created or previous != current:
+            edge_created(*current)
+        instance._loaded_edge = current
+
+
+def dependence_deleted(sender, instance, **kwargs):
+    """post_delete (TaskDependence, görev silinirken cascade dahil)"""
+    recompute_ancestors(instance.task_id)
+
+
+def task_deleting(sender, instance, **kwargs):
+    """pre_delete (Task): kapanış satırları cascade ile silinmeden önce ataları sakla"""
+    instance._closure_ancestors = list(
+        TaskClosure.objects.filter(descendant_id=instance.pk).values_list('ancestor_id', flat=True)
+    )
+
+
+def task_removed(sender, instance, **kwargs):
+    """post_delete (Task): silinen görevin üzerinden geçen yolları atalarında düzelt"""
+    ancestors = getattr(instance, '_closure_ancestors', None)
+    if ancestors:
+        recompute_ancestors(*ancestors)
+
+
+def task_status_changed(task_id, previous_status, status):
+    """Görev kapanınca çıkan kenarları etkisizleşir, yeniden açılınca etkinleşir.
+
+    Önceki durum bilinmiyorsa (None) kapanış yeni duruma göre düzeltilir.
+    """
+    if previous_status is not None and is_open(previous_status) == is_open(status):
+        return
+    if is_open(status):
+        for dependent_task_id in TaskDependence.objects.filter(task_id=task_id).values_list('dependent_task_id', flat=True):
+            add_active_edge(task_id, dependent_task_id)
+    else:
+        recompute_ancestors(task_id)
+
+
+def track_status_changes(transitions):
+    """{görev id: (eski durum, yeni durum)} — sinyal göndermeyen toplu güncellemeler için"""
+    for task_id, (previous_status, status) in transitions.items():
+        task_status_changed(task_id, previous_status, status)
+
+
+def compute_closure(statuses, edges):
+    """Tam kapanışı bellekte hesapla: {(ancestor, descendant): depth}"""
+    edges = [(before, after) for before, after in edges if before != after and is_open(statuses.get(before))]
+    successors = defaultdict(list)
+    for before, after in edges:
+        successors[before].append(after)
+
+    descendants = {}
+    order = reverse_topological_order(statuses, edges)
+    for node in order:
+        reach = {}
+        for after in successors[node]:
+            reach[after] = 1
+            for descendant, depth in descendants.get(after, {}).items():
+                if descendant != node and depth + 1 < reach.get(descendant, depth + 2):
+                    reach[descendant] = depth + 1
+        descendants[node] = reach
+    return {(ancestor, descendant): depth for ancestor, reach in descendants.items() for descendant, depth in reach.items()}
+
+
+def rebuild_task_closure(batch_size=5000):
+    """Kapanış tablosunu bağımlılıklardan baştan üret; yazılan satır sayısını döndür"""
+    statuses = dict(Task.objects.values_list('pk', 'status'))
+    edges = list(TaskDependence.objects.values_list('task_id', 'dependent_task_id'))
+    closure = compute_closure(statuses, edges)
+    with transaction.atomic():
+        TaskClosure.objects.all().delete()
+        TaskClosure.objects.bulk_create(
+            [TaskClosure(ancestor_id=ancestor, descendant_id=descendant, depth=depth)
+             for (ancestor, descendant), depth in closure.items()],
+            batch_size=batch_size,
+        )
+    invalidate_task_lists(set(Task.objects.values_list('user_id', flat=True).distinct()))
+    return len(closure)
@@ -0,0 +1,183 @@
+import heapq
+from collections import defaultdict, deque
+from datetime import date
+
+from django.db import connection, transaction
+from django.utils import timezone
+from rest_framework.exceptions import ValidationError
+
+from .filters import CLOSED_STATUSES
+from .models import Task, TaskDependence
+
+# TaskDependence(task, dependent_task): `task` bitmeden `dependent_task` başlayamaz.
+# Kenar yönü task -> dependent_task'tır; "blocks" aşağı, "blocked_by" yukarı yöndür.
+
+# Bağımlılık yazımlarını PostgreSQL'de seri hale getiren advisory lock anahtarı
+DEPENDENCE_LOCK_KEY = 0x7461736B
+
+
+def lock_dependency_graph():
+    """Eşzamanlı iki ekleme (A->B ve B->A) birlikte döngü oluşturmasın diye yazımları sırala"""
+    if connection.vendor == 'postgresql':
+        with connection.cursor() as cursor:
+            cursor.execute("SELECT pg_advisory_xact_lock(%s)", [DEPENDENCE_LOCK_KEY])
+
+
+def would_create_cycle(task_id, dependent_task_id, exclude_pk=None):
+    """task -> dependent_task kenarı döngü oluşturur mu?
+
+    dependent_task'tan aşağı doğru task'a ulaşılabiliyorsa oluşturur. Özyinelemeli
+    CTE düğüm kümesi üzerinde UNION ile çalışır (mevcut döngülerde de sonlanır) ve
+    ilk eşleşmede durur; güncellenen kenar (exclude_pk) yok sayılır.
+    """
+    if task_id == dependent_task_id:
+        return True
+    table = TaskDependence._meta.db_table
+    exclude = ''
+    params = [dependent_task_id]
+    if exclude_pk is not None:
+        exclude = 'AND d.id <> %s'
+        params.append(exclude_pk)
+    params.append(task_id)
+    with connection.cursor() as cursor:
+        cursor.execute(
+            f"WITH RECURSIVE reachable(id) AS ("
+            f" SELECT %s"
+            f" UNION"
+            f" SELECT d.dependent_task_id FROM {table} d JOIN reachable r ON d.task_id = r.id {exclude}"
+            f") SELECT 1 FROM reachable WHERE id = %s LIMIT 1",
+            params,
+        )
+        return cursor.fetchone() is not None
+
+
+def save_dependence(serializer):
+    """Bağımlılığı döngü denetimiyle aynı işlemde kaydet; döngü varsa ValidationError"""
+    with transaction.atomic():
+        lock_dependency_graph()
+        instance = serializer.instance
+        data = serializer.validated_data
+        task = data.get('task', getattr(instance, 'task', None))
+        dependent_task = data.get('dependent_task', getattr(instance, 'dependent_task', None))
+        if would_create_cycle(task.pk, dependent_task.pk, exclude_pk=getattr(instance, 'pk', None)):
+            raise ValidationError({'dependent_task': "Bu bağımlılık bir döngü oluşturur."})
+        return serializer.save()
+
+
+def reachable_tasks(task_id, downstream=True):
+    """Görevden geçişli olarak ulaşılan görevler: {id: en kısa derinlik}.
+
+    CTE ulaşılabilen kenar kümesini (UNION ile tekilleştirilmiş) döndürür;
+    derinlik bu kenarlar üzerinde bellekte BFS ile hesaplanır.
+    """
+    table = TaskDependence._meta.db_table
+    source, target = ('task_id', 'dependent_task_id') if downstream else ('dependent_task_id', 'task_id')
+    with connection.cursor() as cursor:
+        cursor.execute(
+            f"WITH RECURSIVE walk(src, dst) AS ("
+            f" SELECT {source}, {target} FROM {table} WHERE {source} = %s"
+            f" UNION"
+            f" SELECT d.{source}, d.{target} FROM {table} d JOIN walk w ON d.{source} = w.dst"
+            f") SELECT src, dst FROM walk",
+            [task_id],
+        )
+        adjacency = defaultdict(list)
+        for src, dst in cursor.fetchall():
+            adjacency[src].append(dst)
+
+    depths = {}
+    queue = deque([(task_id, 0)])
+    while queue:
+        node, depth = queue.popleft()
+        for neighbour in adjacency[node]:
+            if neighbour not in depths and neighbour != task_id:
+                depths[neighbour] = depth + 1
+                queue.append((neighbour, depth + 1))
+    return depths
+
+
+def load_graph(tasks):
+    """Görünür görevler arasındaki kenarları ve kenara katılan düğümleri yükle.
+
+    (düğümler {id: {id, title, status, due_date}}, kenarlar [(önce, sonra)]) döndürür.
+    """
+    # İki uç için ayrı IN alt sorgusu SQLite'ta çapraz yoklamaya dönüşüyor; görünürlük
+    # kaynak uçta SQL ile, hedef uçta düğüm kümesiyle denetlenir
+    edges = list(TaskDependence.objects.filter(task__in=tasks).values_list('task_id', 'dependent_task_id'))
+    ids = {node for edge in edges for node in edge}
+    nodes = {
+        row['id']: row
+        for row in tasks.filter(pk__in=ids).values('id', 'title', 'status', 'due_date')
+    } if ids else {}
+    edges = [(before, after) for before, after in edges if after in nodes]
+    return nodes, edges
+
+
+def due_key(node):
+    """Hazır görevler arasında önce bitiş tarihi yakın olanlar (tarihsizler sonda)"""
+    return (node['due_date'] or date.max, node['id'])
+
+
+def topological_order(nodes, edges):
+    """Kahn algoritması; (sıra, döngüdeki düğümler) döndürür.
+
+    Döngü denetiminden önce kaydedilmiş döngüler varsa o düğümler sıraya girmez.
+    """
+    successors = defaultdict(list)
+    indegree = {node_id: 0 for node_id in nodes}
+    for before, after in edges:
+        successors[before].append(after)
+        indegree[after] += 1
+
+    ready = [due_key(nodes[node_id]) for node_id, degree in indegree.items() if degree == 0]
+    heapq.heapify(ready)
+    order = []
+    while ready:
+        _, node_id = heapq.heappop(ready)
+        order.append(node_id)
+        for after in successors[node_id]:
+            indegree[after] -= 1
+            if indegree[after] == 0:
+                heapq.heappush(ready, due_key(nodes[after]))
+    cyclic = sorted(node_id for node_id, degree in indegree.items() if degree > 0)
+    return order, cyclic
+
+
+def critical_path(nodes, edges, today=None):
+    """Bitiş tarihlerine göre en riskli bağımlılık zinciri.
+
+    Açık görevlerde her görev en az bir gün sürer: v'de biten en uzun zincirin
+    uzunluğu k ise boşluk (slack) = (v.due_date - bugün) - k gündür. En küçük
+    boşluklu zincir kritik yoldur (negatifse gecikme kaçınılmazdır).
+    (yol id'leri, boşluk gün) döndürür; tarihli açık görev yoksa ([], None).
+    """
+    today = today or timezone.localdate()
+    open_nodes = {node_id: node for node_id, node in nodes.items() if node['status'] not in CLOSED_STATUSES}
+    open_edges = [(before, after) for before, after in edges if before in open_nodes and after in open_nodes]
+    order, _ = topological_order(open_nodes, open_edges)
+
+    predecessors = defaultdict(list)
+    for before, after in open_edges:
+        predecessors[after].append(before)
+    length, previous = {}, {}
+    for node_id in order:
+        best = None
+        for before in predecessors[node_id]:
+            if best is None or length[before] > length[best]:
+                best = before
+        length[node_id] = 1 + (length[best] if best is not None else 0)
+        previous[node_id] = best
+
+    end, slack = None, None
+    for node_id in order:
+        due_date = open_nodes[node_id]['due_date']
+        if due_date is None:
+            continue
+        node_slack = (due_date - today).days - length[node_id]
+        if slack is None or (node_slack, -length[node_id]) < (slack, -length[end]):
+            end, slack = node_id, node_slack
+    path = []
+    while end is not None:
+        path.append(end)
+        end = previous[end]
+    return path[::-1], slack
@@ -0,0 +1,161 @@
+from collections import Counter
+
+from django.conf import settings
+from django.db import IntegrityError, transaction
+from django.db.models import Count, F, Q
+from django.utils import timezone
+
+from .filters import CLOSED_STATUSES
+from .models import Task, TaskCounter
+
+DEFAULT_TASK_STATS = {
+    # Kullanıcı panosu sayaç tablosundan okunur ve görev değişikliklerinde güncellenir
+    'COUNTERS': False,
+}
+
+
+def get_task_stats_config():
+    """settings.TASK_STATS ayarlarını varsayılanlarla birleştir"""
+    config = dict(DEFAULT_TASK_STATS)
+    config.update(getattr(settings, 'TASK_STATS', {}))
+    return config
+
+
+def counters_enabled():
+    return get_task_stats_config()['COUNTERS']
+
+
+def empty_stats():
+    return {
+        'total': 0,
+        'by_status': {key: 0 for key, _ in Task.STATUS_CHOICES},
+        'by_priority': {key: 0 for key, _ in Task.PRIORITY_CHOICES},
+        'overdue': 0,
+    }
+
+
+def overdue_filter():
+    """Bitiş tarihi geçmiş, tamamlanmamış ve iptal edilmemiş görevler"""
+    return Q(due_date__lt=timezone.localdate()) & ~Q(status__in=CLOSED_STATUSES)
+
+
+def aggregate_task_stats(queryset):
+    """Durum, öncelik ve gecikme sayılarını tek bir koşullu COUNT sorgusuyla hesapla"""
+    aggregates = {'total': Count('pk'), 'overdue': Count('pk', filter=overdue_filter())}
+    for key, _ in Task.STATUS_CHOICES:
+        aggregates[f'status_{key}'] = Count('pk', filter=Q(status=key))
+    for key, _ in Task.PRIORITY_CHOICES:
+        aggregates[f'priority_{key}'] = Count('pk', filter=Q(priority=key))
+    values = queryset.order_by().aggregate(**aggregates)
+
+    stats = empty_stats()
+    stats['total'] = values['total']
+    stats['overdue'] = values['overdue']
+    for key in stats['by_status']:
+        stats['by_status'][key] = values[f'status_{key}']
+    for key in stats['by_priority']:
+        stats['by_priority'][key] = values[f'priority_{key}']
+    return stats
+
+
+def counter_task_stats(user):
+    """Kullanıcının panosunu sayaç satırlarından (en fazla durum x öncelik satır) üret.
+
+    Gecikme tarihe bağlı olduğu için sayaçta tutulmaz; (user, status, due_date)
+    indeksiyle yalnızca gecikmiş görevler sayılır.
+    """
+    stats = empty_stats()
+    rows = TaskCounter.objects.filter(user=user).values_list('status', 'priority', 'count')
+    for status, priority, count in rows:
+        stats['total'] += count
+        if status in stats['by_status']:
+            stats['by_status'][status] += count
+        if priority in stats['by_priority']:
+            stats['by_priority'][priority] += count
+    stats['overdue'] = Task.objects.filter(overdue_filter(), user=user).count()
+    return stats
+
+
+def get_task_stats(user):
+    """Kullanıcının görebildiği görevler için pano sayıları ve kaynağı"""
+    if user.is_staff or user.is_superuser:
+        # Sayaçlar kullanıcı bazındadır; tüm görevler için tek toplama sorgusu
+        return aggregate_task_stats(Task.objects.all()), 'aggregate'
+    if counters_enabled():
+        return counter_task_stats(user), 'counters'
+    return aggregate_task_stats(Task.objects.filter(user=user)), 'aggregate'
+
+
+def task_bucket(task):
+    return (task.user_id, task.status, task.priority)
+
+
+def apply_counter_deltas(deltas):
+    """{(user_id, status, priority): fark} sayaç farklarını F() ile artımlı uygula"""
+    for (user_id, status, priority), delta in deltas.items():
+        if not delta or user_id is None:
+            continue
+        counters = TaskCounter.objects.filter(user_id=user_id, status=status, priority=priority)
+        if counters.update(count=F('count') + delta):
+            continue
+        try:
+            with transaction.atomic():
+                TaskCounter.objects.create(user_id=user_id, status=status, priority=priority, count=delta)
+        except IntegrityError:
+            # Eşzamanlı bir istek satırı oluşturdu
+            counters.update(count=F('count') + delta)
+
+
+def rebuild_task_counters(user_ids=None):
+    """Sayaçları görev tablosundan yeniden hesapla (tümü veya verilen kullanıcılar)"""
+    tasks = Task.objects.filter(user__isnull=False)
+    counters = TaskCounter.objects.all()
+    if user_ids is not None:
+        tasks = tasks.filter(user_id__in=user_ids)
+        counters = counters.filter(user_id__in=user_ids)
+    rows = tasks.order_by().values('user_id', 'status', 'priority').annotate(count=Count('pk'))
+    with transaction.atomic():
+        counters.delete()
+        TaskCounter.objects.bulk_create(
+            [TaskCounter(**row) for row in rows.iterator()], batch_size=1000,
+        )
+
+
+def track_task_counters(tasks, created=False, deleted=False):
+    """Kaydedilen/silinen görevlerin sayaç farklarını uygula.
+
+    Eski kova görevin yüklendiği andaki değerlerden (Task.from_db, kayıttan sonra
+    sinyalde yenilenir) alınır; bilinmiyorsa o kullanıcının sayaçları yeniden hesaplanır.
+    """
+    if not counters_enabled():
+        return
+    deltas = Counter()
+    unknown = set()
+    for task in tasks:
+        current = task_bucket(task)
+        previous = getattr(task, '_loaded_state', None)
+        if deleted:
+            deltas[previous or current] -= 1
+            continue
+        if created:
+            deltas[current] += 1
+        elif previous is None:
+            unknown.add(task.user_id)
+        elif previous != current:
+            deltas[previous] -= 1
+            deltas[current] += 1
+    apply_counter_deltas(deltas)
+    if unknown:
+        rebuild_task_counters(unknown)
+
+
+def track_status_transitions(moves):
+    """[(eski kova, yeni kova)] geçişlerini sayaçlara uygula (sinyal göndermeyen UPDATE'ler için)"""
+    if not counters_enabled():
+        return
+    deltas = Counter()
+    for previous, current in moves:
+        if previous != current:
+            deltas[previous] -= 1
+            deltas[current] += 1
+    apply_counter_deltas(deltas)
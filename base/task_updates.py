@@ -0,0 +1,365 @@
+from django.conf import settings
+from django.db import connection, transaction
+from django.db.models import Case, F, Value, When
+from django.db.models.signals import post_save
+from django.utils import timezone
+from rest_framework import status
+from rest_framework.exceptions import APIException, ValidationError
+
+from .models import History, Task, TaskChange
+from .serializers import TaskSerializer
+from .task_cache import invalidate_task_lists
+from .task_changes import record_task_changes
+from .task_closure import track_status_changes
+from .task_stats import track_status_transitions, track_task_counters
+from .utils import OperationLogger, format_changes
+
+DEFAULT_TASK_UPDATE = {
+    'SELECT_FOR_UPDATE': False,
+    'BATCH_MAX_OPERATIONS': 500,
+}
+
+BATCH_OPERATIONS = ('create', 'update', 'delete', 'toggle')
+
+
+def get_task_update_config():
+    """settings.TASK_UPDATE ayarlarını varsayılanlarla birleştir"""
+    config = dict(DEFAULT_TASK_UPDATE)
+    config.update(getattr(settings, 'TASK_UPDATE', {}))
+    return config
+
+
+def rows_locked():
+    """Okunan görev satırları işlem sonuna kadar kilitli mi (SELECT ... FOR UPDATE)"""
+    return get_task_update_config()['SELECT_FOR_UPDATE'] and connection.features.has_select_for_update
+
+
+class TaskConflict(APIException):
+    status_code = status.HTTP_409_CONFLICT
+    default_detail = "Görev eşzamanlı olarak değiştirildi; tekrar deneyin."
+    default_code = 'task_conflict'
+
+
+def change_value(value):
+    """Değişiklik değerini JSON'a yazılabilir hale getir"""
+    if value is None or isinstance(value, (str, int, float, bool)):
+        return value
+    return str(value)
+
+
+def compute_task_changes(task, validated_data):
+    """Doğrulanmış veriyi mevcut satırla karşılaştır: {alan: (eski, yeni)}
+
+    İlişkili alanlar `<alan>_id` üzerinden karşılaştırılır, ek sorgu yapılmaz.
+    """
+    changes = {}
+    for name, new in validated_data.items():
+        field = task._meta.get_field(name)
+        if field.many_to_many:
+            continue
+        if field.is_relation:
+            old, new = getattr(task, field.attname), getattr(new, 'pk', new)
+        else:
+            old = getattr(task, name)
+        if old != new:
+            changes[name] = (change_value(old), change_value(new))
+    return changes
+
+
+def apply_task_update(task, validated_data, user, ip_address):
+    """Değişen alanları kaydet, History ve Log kayıtlarını aynı işlemde yaz.
+
+    Yalnızca değişen kolonlar (updated_at ve version ile) tek bir UPDATE ile
+    yazılır; değişiklik yoksa satıra yazılmaz. UPDATE okunan sürüm ve updated_at
+    ile koşulludur; satır kilitlenmeden okunduysa ve arada başka bir yazım
+    olduysa hiçbir satır eşleşmez ve TaskConflict yükseltilir. Kayıt save()
+    üzerinden yapılmadığı için post_save buradan gönderilir.
+    Değişiklik sözlüğünü döndürür.
+    """
+    changes = compute_task_changes(task, validated_data)
+    # Çağıranın işlemine katılır; ayrı bir savepoint açılmaz
+    with transaction.atomic(savepoint=False):
+        if changes:
+            values = {name: validated_data[name] for name in changes}
+            now = timezone.now()
+            claimed = Task.objects.filter(pk=task.pk, version=task.version, updated_at=task.updated_at).update(
+                **values, version=F('version') + 1, updated_at=now,
+            )
+            if not claimed:
+                raise TaskConflict()
+            for name, value in values.items():
+                setattr(task, name, value)
+            task.version += 1
+            task.updated_at = now
+            post_save.send(
+                sender=Task, instance=task, created=False, update_fields=frozenset([*changes, 'updated_at', 'version']),
+                raw=False, using=task._state.db,
+            )
+            History.objects.create(task=task, task_name=task.title, changes=format_changes(changes))
+        OperationLogger.log_task_updated(user, task.title, changes, ip_address, task_id=task.pk)
+    return changes
+
+
+def toggled_status(task):
+    """Tamamlanmış görevi beklemeye, diğerlerini tamamlanmışa çevir"""
+    return 'pending' if task.status == 'completed' else 'completed'
+
+
+def parse_batch_operations(operations, queryset, max_operations):
+    """İşlem listesini doğrula ve hedef görevleri tek sorguda yükle.
+
+    (işlemler, görevler, hatalar) döndürür; hatalar {sıra: hata} biçimindedir.
+    """
+    if not isinstance(operations, list) or not operations:
+        raise ValidationError({'operations': "Boş olmayan bir liste olmalıdır."})
+    if len(operations) > max_operations:
+        raise ValidationError({'operations': f"Tek istekte en fazla {max_operations} işlem gönderilebilir."})
+
+    errors = {}
+    parsed = []
+    seen_ids = set()
+    for index, item in enumerate(operations):
+        op = item.get('op') if isinstance(item, dict) else None
+        if op not in BATCH_OPERATIONS:
+            errors[index] = {'op': f"Geçerli değerler: {', '.join(BATCH_OPERATIONS)}"}
+            parsed.append(None)
+            continue
+        task_id = None
+        if op != 'create':
+            try:
+                task_id = int(item.get('id'))
+            except (TypeError, ValueError):
+                errors[index] = {'id': "Geçerli bir görev id'si gerekli."}
+                parsed.append(None)
+                continue
+            if task_id in seen_ids:
+                errors[index] = {'id': "Aynı görev bir istekte yalnızca bir kez işlenebilir."}
+                parsed.append(None)
+                continue
+            seen_ids.add(task_id)
+        data = item.get('data', {})
+        if op in ('create', 'update') and not isinstance(data, dict):
+            errors[index] = {'data': "Nesne olmalıdır."}
+            parsed.append(None)
+            continue
+        parsed.append({'op': op, 'id': task_id, 'data': data})
+
+    if get_task_update_config()['SELECT_FOR_UPDATE']:
+        queryset = queryset.select_for_update()
+    tasks = queryset.in_bulk(seen_ids) if seen_ids else {}
+    for index, operation in enumerate(parsed):
+        if operation and operation['id'] is not None and operation['id'] not in tasks:
+            errors[index] = {'id': "Görev bulunamadı."}
+    return parsed, tasks, errors
+
+
+def validate_batch_data(parsed, op, errors, partial=False):
+    """Aynı türdeki işlemlerin verisini tek bir TaskSerializer(many=True) ile doğrula"""
+    indexes = [index for index, operation in enumerate(parsed) if operation and operation['op'] == op]
+    if not indexes:
+        return {}
+    serializer = TaskSerializer(data=[parsed[index]['data'] for index in indexes], many=True, partial=partial)
+    if serializer.is_valid():
+        return dict(zip(indexes, serializer.validated_data))
+    for index, item_errors in zip(indexes, serializer.errors):
+        if item_errors:
+            errors[index] = item_errors
+    return {}
+
+
+def apply_task_batch(operations, queryset, user, ip_address):
+    """Toplu görev işlemlerini tek işlemde uygula.
+
+    Tüm işlemler önce doğrulanır; herhangi biri geçersizse hiçbiri uygulanmaz.
+    Oluşturma bulk_create, güncelleme/durum değiştirme write_batch_updates (satır
+    kilitli değilse sürüm koşullu), silme tek bir filtreli DELETE ile yapılır ve
+    tüm istek için tek bir Log kaydı yazılır.
+    (başarılı mı, sıralı sonuç listesi) döndürür.
+    """
+    config = get_task_update_config()
+    with transaction.atomic():
+        parsed, tasks, errors = parse_batch_operations(operations, queryset, config['BATCH_MAX_OPERATIONS'])
+        created_data = validate_batch_data(parsed, 'create', errors)
+        updated_data = validate_batch_data(parsed, 'update', errors, partial=True)
+        if errors:
+            return False, [
+                {'index': index, 'status': 'error', 'errors': errors[index]} if index in errors
+                else {'index': index, 'status': 'skipped'}
+                for index in range(len(parsed))
+            ]
+
+        now = timezone.now()
+        created = {index: Task(user=user, **data) for index, data in created_data.items()}
+        bulk_insert = connection.features.can_return_rows_from_bulk_insert
+        if bulk_insert:
+            Task.objects.bulk_create(created.values())
+        else:
+            # Toplu eklemede id döndürmeyen veritabanları: tek tek kaydet (sinyaller günlüğe yazar)
+            for task in created.values():
+                task.save()
+
+        changed = {}
+        changes = {}
+        loaded = {}
+        for index, operation in enumerate(parsed):
+            if operation['op'] == 'update':
+                task = tasks[operation['id']]
+                task_changes = compute_task_changes(task, updated_data[index])
+                for name in task_changes:
+                    setattr(task, name, updated_data[index][name])
+            elif operation['op'] == 'toggle':
+                task = tasks[operation['id']]
+                task_changes = {'status': (task.status, toggled_status(task))}
+                task.status = task_changes['status'][1]
+            else:
+                continue
+            if task_changes:
+                loaded[task.pk] = (task.version, task.updated_at)
+                task.updated_at = now
+                task.version += 1
+                changed[task.pk] = task
+                changes[task.pk] = task_changes
+        if changed:
+            write_batch_updates(changed, changes, loaded)
+            History.objects.bulk_create([
+                History(task=task, task_name=task.title, changes=format_changes(changes[task.pk]))
+                for task in changed.values()
+            ])
+
+        delete_ids = [operation['id'] for operation in parsed if operation['op'] == 'delete']
+        if delete_ids:
+            queryset.filter(pk__in=delete_ids).delete()
+
+        results = []
+        summary = {op: [] for op in BATCH_OPERATIONS}
+        for index, operation in enumerate(parsed):
+            op = operation['op']
+            result = {'index': index, 'op': op, 'status': 'ok'}
+            if op == 'create':
+                task = created[index]
+            elif op == 'delete':
+                task = None
+                result['id'] = operation['id']
+            else:
+                task = tasks[operation['id']]
+            if task is not None:
+                result['id'] = task.pk
+                result['data'] = TaskSerializer(task).data
+            summary[op].append(result['id'])
+            results.append(result)
+
+        # bulk_create / bulk_update sinyal göndermez; silmeler post_delete ile kaydedilir
+        record_task_changes([*(created.values() if bulk_insert else ()), *changed.values()], TaskChange.ACTION_UPSERT)
+        if bulk_insert:
+            track_task_counters(created.values(), created=True)
+        track_task_counters(changed.values())
+        track_status_changes({
+            task.pk: (getattr(task, '_loaded_state', (None, None, None))[1], task.status)
+            for task in changed.values() if 'status' in changes[task.pk]
+        })
+        invalidate_task_lists({user.pk, *(task.user_id for task in tasks.values())})
+        OperationLogger.log_task_batch(user, summary, changes, ip_address)
+    return True, results
+
+
+def write_batch_updates(changed, changes, loaded):
+    """Toplu güncellemeleri yaz; her satıra yalnızca kendi değişen kolonları yazılır.
+
+    Satırlar kilitliyse aynı kolon kümesini değiştiren satırlar tek bulk_update ile
+    yazılır. Kilitli değilse her satır okunan sürüm ve updated_at ile koşullu bir
+    UPDATE'tir; arada başka bir yazım olduysa TaskConflict yükseltilir ve tüm
+    toplu işlem geri alınır.
+    """
+    if rows_locked():
+        groups = {}
+        for pk, task in changed.items():
+            groups.setdefault(frozenset(changes[pk]), []).append(task)
+        for fields, tasks in groups.items():
+            Task.objects.bulk_update(tasks, [*sorted(fields), 'updated_at', 'version'])
+        return
+    for pk, task in changed.items():
+        version, updated_at = loaded[pk]
+        values = {name: getattr(task, name) for name in changes[pk]}
+        claimed = Task.objects.filter(pk=pk, version=version, updated_at=updated_at).update(
+            **values, version=F('version') + 1, updated_at=task.updated_at,
+        )
+        if not claimed:
+            raise TaskConflict()
+
+
+def toggle_status_rows(task_ids, user, now):
+    """PostgreSQL: görünür görevlerin durumunu tek bir koşullu UPDATE ile çevir.
+
+    Yetki denetimi (sahiplik) aynı sorgunun WHERE koşuludur. Eski durum FROM
+    alt sorgusundan gelir; alt sorgu satırları FOR UPDATE ile kilitlediği için
+    eşzamanlı çevirmeler birbirini ezmez.
+    (id, user_id, priority, title, eski durum, yeni durum) satırları döndürür.
+    """
+    table = Task._meta.db_table
+    placeholders = ', '.join(['%s'] * len(task_ids))
+    params = [connection.ops.adapt_datetimefield_value(now), *task_ids]
+    owner = ''
+    if not (user.is_staff or user.is_superuser):
+        owner = 'AND user_id = %s'
+        params.append(user.pk)
+    with connection.cursor() as cursor:
+        cursor.execute(
+            f"UPDATE {table} SET "
+            f"status = CASE WHEN {table}.status = 'completed' THEN 'pending' ELSE 'completed' END, "
+            f"version = {table}.version + 1, updated_at = %s "
+            f"FROM (SELECT id, status FROM {table} WHERE id IN ({placeholders}) {owner} ORDER BY id FOR UPDATE) AS previous "
+            f"WHERE {table}.id = previous.id "
+            f"RETURNING {table}.id, {table}.user_id, {table}.priority, {table}.title, previous.status, {table}.status",
+            params,
+        )
+        return cursor.fetchall()
+
+
+def toggle_status_rows_fallback(task_ids, queryset, now):
+    """Diğer veritabanları: satırları kilitle, tek CASE UPDATE ile çevir.
+
+    SQLite'ta RETURNING, FROM tablolarına erişemez; yazımlar zaten tek tek
+    yapıldığı için arada değişen satır işlemi SQLITE_BUSY ile düşürür.
+    """
+    rows = list(
+        queryset.select_for_update().filter(pk__in=task_ids).order_by('pk')
+        .values_list('pk', 'user_id', 'priority', 'title', 'status')
+    )
+    queryset.filter(pk__in=[row[0] for row in rows]).update(
+        status=Case(When(status='completed', then=Value('pending')), default=Value('completed')),
+        version=F('version') + 1,
+        updated_at=now,
+    )
+    return [(*row, 'pending' if row[4] == 'completed' else 'completed') for row in rows]
+
+
+def toggle_tasks(task_ids, queryset, user):
+    """Görevlerin durumunu atomik olarak çevir (tamamlandı <-> beklemede).
+
+    `queryset` kullanıcının görebildiği görevlerdir (fallback yolunda kullanılır).
+    UPDATE sinyal göndermediği için değişiklik günlüğü, sayaçlar, History ve liste
+    önbelleği burada güncellenir. {id: (eski durum, yeni durum)} döndürür.
+    """
+    task_ids = sorted(set(task_ids))
+    if not task_ids:
+        return {}
+    now = timezone.now()
+    with transaction.atomic():
+        if connection.vendor == 'postgresql':
+            rows = toggle_status_rows(task_ids, user, now)
+        else:
+            rows = toggle_status_rows_fallback(task_ids, queryset, now)
+        if not rows:
+            return {}
+        tasks = [Task(pk=row[0], user_id=row[1]) for row in rows]
+        record_task_changes(tasks, TaskChange.ACTION_UPSERT)
+        track_status_transitions(
+            [((user_id, old, priority), (user_id, new, priority)) for _, user_id, priority, _, old, new in rows]
+        )
+        History.objects.bulk_create([
+            History(task_id=task_id, task_name=title, changes=format_changes({'status': (old, new)}))
+            for task_id, _, _, title, old, new in rows
+        ])
+        track_status_changes({row[0]: (row[4], row[5]) for row in rows})
+        invalidate_task_lists({row[1] for row in rows})
+    return {row[0]: (row[4], row[5]) for row in rows}
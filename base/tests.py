@@ -1,3 +1,1667 @@
-from django.test import TestCase
+import contextlib
+import glob
+import io
+import json
+import os
+import shutil
+import tempfile
+import threading
+import time
+from concurrent.futures import FIRST_COMPLETED, Future, wait
+from datetime import date, datetime, timedelta
+from unittest import mock
 
-# Create your tests here.
+from django.conf import settings
+from django.contrib.auth.models import User
+from django.core.cache import caches
+from django.core.files.uploadedfile import SimpleUploadedFile
+from django.core.management import call_command
+from django.db import connection, transaction
+from django.test import Client, TestCase, override_settings
+from django.test.utils import CaptureQueriesContext
+from django.db.models import F
+from django.utils import timezone
+from PIL import Image
+from rest_framework.test import APIClient
+
+from .access_log import ApiAccessAggregator
+from .admin import EstimatedCountPaginator, LogAdmin, estimate_count
+from .attachments import RangeNotSatisfiable, blob_path, parse_range, prune_orphan_blobs
+from .fast_serializers import ValuesSerializer
+from .fulltext import search_logs
+from .log_buffer import LogBuffer
+from .log_retention import archive_logs, create_log_indexes, log_index_names, read_archive, restore_logs
+from .models import History, Log, Task, TaskAttachment, TaskChange, TaskComment, TaskClosure, TaskCounter, TaskDependence, TaskRecurrence, TaskSchedule
+from .task_closure import compute_closure
+from .recurrence import materialize_recurrences
+from .reminders import MemoryNotifier, ReminderNotifier, claim_due_reminders, dispatch_reminders
+from .task_cache import ALL_TASKS, get_task_list_cache
+from .task_changes import encode_cursor
+from .task_stats import aggregate_task_stats
+from .serializers import TaskListSerializer
+from .task_updates import apply_task_batch
+from .thumbnails import _pending, thumbnail_path
+from .views import TaskAttachmentsAPI, TaskCommentsAPI, TaskListCreateAPI
+from .utils import EventCode, LogManager, OperationLogger, _write_api_access_aggregate
+
+
+@override_settings(TASK_LIST_CACHE={'ENABLED': False})
+class KeysetPaginationTests(TestCase):
+    """Görev listesinde (updated_at, id) imleçli sayfalama ve eski rotalarda isteğe bağlı sayfalama"""
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = User.objects.create_user('ayse', password='parola123')
+        now = timezone.now()
+        cls.tasks = [Task.objects.create(user=cls.user, title=f'Görev {i}') for i in range(7)]
+        # Eşit updated_at değerleri id ile ayrışmalı
+        for index, task in enumerate(cls.tasks):
+            Task.objects.filter(pk=task.pk).update(updated_at=now - timedelta(minutes=index // 2))
+        cls.expected = [
+            task.pk for task in Task.objects.filter(user=cls.user).order_by('-updated_at', '-pk')
+        ]
+
+    def setUp(self):
+        self.client = APIClient()
+        self.client.force_authenticate(self.user)
+
+    def collect(self, url):
+        ids, pages = [], []
+        while url:
+            response = self.client.get(url)
+            self.assertEqual(response.status_code, 200)
+            pages.append(response.data)
+            ids.extend(item['id'] for item in response.data['results'])
+            url = response.data['next']
+        return ids, pages
+
+    def test_cursor_walks_every_row_once_in_order(self):
+        ids, pages = self.collect('/api/v1/tasks/?page_size=3')
+        self.assertEqual(ids, self.expected)
+        self.assertEqual([len(page['results']) for page in pages], [3, 3, 1])
+        self.assertIsNone(pages[0]['previous'])
+
+    def test_previous_link_returns_the_same_page(self):
+        first = self.client.get('/api/v1/tasks/?page_size=3').data
+        second = self.client.get(first['next']).data
+        back = self.client.get(second['previous']).data
+        self.assertEqual([item['id'] for item in back['results']], [item['id'] for item in first['results']])
+
+    def test_ascending_due_date_ordering_keeps_nulls_last(self):
+        due = timezone.localdate() + timedelta(days=5)
+        Task.objects.filter(pk__in=[self.tasks[1].pk, self.tasks[4].pk]).update(due_date=due)
+        ids, _ = self.collect('/api/v1/tasks/?page_size=2&ordering=due_date')
+        self.assertEqual(ids[:2], sorted([self.tasks[1].pk, self.tasks[4].pk]))
+        self.assertEqual(sorted(ids), sorted(self.expected))
+
+    def test_invalid_cursor_is_rejected(self):
+        self.assertEqual(self.client.get('/api/v1/tasks/?cursor=bozuk').status_code, 404)
+
+    def test_cursor_from_another_ordering_is_rejected(self):
+        first = self.client.get('/api/v1/tasks/?page_size=3').data
+        response = self.client.get(first['next'] + '&ordering=due_date')
+        self.assertEqual(response.status_code, 404)
+
+    def test_legacy_route_is_unpaginated_unless_requested(self):
+        response = self.client.get('/api/tasks/')
+        self.assertIsInstance(response.data, list)
+        self.assertEqual(len(response.data), len(self.expected))
+
+        response = self.client.get('/api/tasks/?paginate=1&page_size=3')
+        self.assertEqual([item['id'] for item in response.data['results']], self.expected[:3])
+        self.assertIsNotNone(response.data['next'])
+
+
+@override_settings(TASK_LIST_CACHE={'ENABLED': False})
+class TaskFilterTests(TestCase):
+    """Görev listesi filtreleri: durum, öncelik, bitiş tarihi aralığı, gecikmiş görevler ve hatalı parametreler"""
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = User.objects.create_user('ayse', password='parola123')
+        today = timezone.localdate()
+        cls.today = today
+        rows = [
+            ('Geçmiş açık', 'pending', 'high', today - timedelta(days=2)),
+            ('Geçmiş tamamlanmış', 'completed', 'high', today - timedelta(days=1)),
+            ('Bugün', 'in_progress', 'low', today),
+            ('Gelecek', 'pending', 'critical', today + timedelta(days=5)),
+            ('Tarihsiz', 'pending', 'high', None),
+        ]
+        cls.tasks = {
+            title: Task.objects.create(user=cls.user, title=title, status=status, priority=priority, due_date=due)
+            for title, status, priority, due in rows
+        }
+        # Başka kullanıcının görevleri hiçbir filtrede görünmez
+        other = User.objects.create_user('mehmet', password='parola123')
+        Task.objects.create(user=other, title='Yabancı', status='pending', priority='high', due_date=today)
+
+    def setUp(self):
+        self.client = APIClient()
+        self.client.force_authenticate(self.user)
+
+    def titles(self, query):
+        response = self.client.get(f'/api/v1/tasks/?{query}')
+        self.assertEqual(response.status_code, 200, response.data)
+        return [item['title'] for item in response.data['results']]
+
+    def test_status_and_priority_lists(self):
+        self.assertEqual(set(self.titles('status=pending')), {'Geçmiş açık', 'Gelecek', 'Tarihsiz'})
+        self.assertEqual(set(self.titles('status=pending,in_progress&priority=high')), {'Geçmiş açık', 'Tarihsiz'})
+        self.assertEqual(self.titles('priority=medium'), [])
+
+    def test_due_date_range_is_inclusive(self):
+        today = self.today
+        query = f'due_date_from={today - timedelta(days=1)}&due_date_to={today}'
+        self.assertEqual(set(self.titles(query)), {'Geçmiş tamamlanmış', 'Bugün'})
+        self.assertEqual(set(self.titles(f'due_date_from={today}')), {'Bugün', 'Gelecek'})
+        # Ters aralık boş sonuç verir, hata değildir
+        self.assertEqual(self.titles(f'due_date_from={today}&due_date_to={today - timedelta(days=1)}'), [])
+
+    def test_overdue_combines_with_other_filters(self):
+        self.assertEqual(self.titles('overdue=true'), ['Geçmiş açık'])
+        self.assertEqual(self.titles('overdue=true&priority=low'), [])
+        self.assertEqual(len(self.titles('overdue=false')), 5)
+
+    def test_due_date_ordering_keeps_nulls_last_both_ways(self):
+        self.assertEqual(self.titles('ordering=due_date')[-1], 'Tarihsiz')
+        self.assertEqual(self.titles('ordering=-due_date&status=pending'), ['Gelecek', 'Geçmiş açık', 'Tarihsiz'])
+
+    def test_filters_survive_cursor_pages(self):
+        ids, url = [], '/api/v1/tasks/?status=pending&page_size=1&ordering=due_date'
+        while url:
+            response = self.client.get(url)
+            ids.extend(item['id'] for item in response.data['results'])
+            url = response.data['next']
+        expected = ['Geçmiş açık', 'Gelecek', 'Tarihsiz']
+        self.assertEqual(ids, [self.tasks[title].pk for title in expected])
+
+    def test_invalid_params_are_reported_together(self):
+        response = self.client.get(
+            '/api/v1/tasks/?status=pending,bitti&priority=acil&due_date_from=2024-13-01'
+            '&due_date_to=dün&overdue=belki&ordering=title'
+        )
+        self.assertEqual(response.status_code, 400)
+        self.assertEqual(
+            set(response.data), {'status', 'priority', 'due_date_from', 'due_date_to', 'overdue', 'ordering'},
+        )
+        self.assertIn('bitti', str(response.data['status']))
+
+    def test_filters_are_served_by_indexes(self):
+        if connection.vendor != 'sqlite':
+            # PostgreSQL küçük tablolarda sıralı taramayı seçer
+            self.skipTest('Plan yalnızca SQLite\'ta tablo boyutundan bağımsızdır')
+        queryset = Task.objects.filter(user=self.user, status__in=['pending'], due_date__gte=self.today)
+        self.assertIn('task_user_status_due_idx', queryset.explain())
+        queryset = Task.objects.filter(user=self.user, priority__in=['high']).order_by('-updated_at')
+        self.assertIn('task_user_prio_upd_idx', queryset.explain())
+
+
+@override_settings(TASK_LIST_CACHE={'ENABLED': False})
+class FieldsetTests(TestCase):
+    """?fields= / ?exclude= ile alan seçimi: çıktı, hatalar, hızlı yol ve ETag"""
+    url = '/api/v1/tasks/'
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = User.objects.create_user('ayse', password='parola123')
+        cls.task = Task.objects.create(user=cls.user, title='Rapor hazırla', description='Uzun açıklama')
+
+    def setUp(self):
+        self.client = APIClient()
+        self.client.force_authenticate(self.user)
+
+    def test_fields_and_exclude(self):
+        item = self.client.get(f'{self.url}?fields=id,title,is_blocked').data['results'][0]
+        self.assertEqual(set(item), {'id', 'title', 'is_blocked'})
+
+        item = self.client.get(f'{self.url}?exclude=description,blocking_count').data['results'][0]
+        self.assertNotIn('description', item)
+        self.assertNotIn('blocking_count', item)
+        self.assertIn('status', item)
+
+        detail = self.client.get(f'{self.url}{self.task.pk}/?fields=title,version').data
+        self.assertEqual(detail, {'title': 'Rapor hazırla', 'version': 1})
+
+    def test_unknown_fields_are_rejected(self):
+        for query in ('fields=id,baslik', 'exclude=gizli'):
+            with self.subTest(query=query):
+                response = self.client.get(f'{self.url}?{query}')
+                self.assertEqual(response.status_code, 400)
+                self.assertIn(query.split('=')[0], response.data)
+        self.assertEqual(self.client.get(f'{self.url}{self.task.pk}/?fields=baslik').status_code, 400)
+
+    def test_write_requests_ignore_field_selection(self):
+        response = self.client.patch(f'{self.url}{self.task.pk}/?fields=title', {'status': 'completed'}, format='json')
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.data['status'], 'completed')
+
+    def test_fast_path_reads_only_selected_columns(self):
+        with mock.patch.object(ValuesSerializer, 'represent', autospec=True, side_effect=ValuesSerializer.represent) as fast, \
+                CaptureQueriesContext(connection) as queries:
+            response = self.client.get(f'{self.url}?fields=id,title')
+        self.assertTrue(fast.called)
+        self.assertEqual(response.data['results'], [{'id': self.task.pk, 'title': 'Rapor hazırla'}])
+        self.assertTrue(any('"base_task"."title"' in query['sql'] for query in queries))
+        self.assertFalse(any('"base_task"."description"' in query['sql'] for query in queries))
+
+    def test_list_etag_varies_by_field_set(self):
+        full = self.client.get(self.url)
+        narrow = self.client.get(f'{self.url}?fields=id,title')
+        self.assertNotEqual(full['ETag'], narrow['ETag'])
+        # Başka bir alan seçimiyle alınmış kopya doğrulanmaz
+        response = self.client.get(f'{self.url}?fields=id,title', HTTP_IF_NONE_MATCH=full['ETag'])
+        self.assertEqual(response.status_code, 200)
+        response = self.client.get(f'{self.url}?fields=id,title', HTTP_IF_NONE_MATCH=narrow['ETag'])
+        self.assertEqual(response.status_code, 304)
+
+
+@override_settings(TASK_LIST_CACHE={'ENABLED': False})
+class TaskChildEndpointTests(TestCase):
+    """/tasks/<pk>/comments/ ve /attachments/: (created_at, id) keyset sayfalama ve üst görev erişimi"""
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = User.objects.create_user('ayse', password='parola123')
+        cls.stranger = User.objects.create_user('mehmet', password='parola123')
+        cls.task = Task.objects.create(user=cls.user, title='Rapor hazırla')
+        cls.foreign = Task.objects.create(user=cls.stranger, title='Gizli görev')
+        now = timezone.now()
+        for index in range(5):
+            comment = TaskComment.objects.create(task=cls.task, user=cls.user if index % 2 else cls.stranger,
+                                                 comment=f'Yorum numarası {index}')
+            attachment = TaskAttachment.objects.create(task=cls.task, file_name=f'dosya{index}.txt', file_path=f'ab/{index}',
+                                                       size=index, content_type='text/plain')
+            # Eşit created_at değerleri id ile ayrışmalı
+            created_at = now - timedelta(minutes=index // 2)
+            TaskComment.objects.filter(pk=comment.pk).update(created_at=created_at)
+            TaskAttachment.objects.filter(pk=attachment.pk).update(created_at=created_at)
+        TaskComment.objects.create(task=cls.foreign, user=cls.stranger, comment='Başka görevin yorumu')
+
+    def setUp(self):
+        self.client = APIClient()
+        self.client.force_authenticate(self.user)
+
+    def collect(self, url):
+        ids, pages = [], []
+        while url:
+            response = self.client.get(url)
+            self.assertEqual(response.status_code, 200)
+            pages.append([item['id'] for item in response.data['results']])
+            ids.extend(pages[-1])
+            url = response.data['next']
+        return ids, pages
+
+    def test_keyset_pages_in_both_directions(self):
+        for model, path in ((TaskComment, 'comments'), (TaskAttachment, 'attachments')):
+            rows = model.objects.filter(task=self.task)
+            for ordering, order_by in (('created_at', ('created_at', 'id')), ('-created_at', ('-created_at', '-id'))):
+                with self.subTest(path=path, ordering=ordering):
+                    ids, pages = self.collect(f'/api/v1/tasks/{self.task.pk}/{path}/?page_size=2&ordering={ordering}')
+                    self.assertEqual(ids, list(rows.order_by(*order_by).values_list('pk', flat=True)))
+                    self.assertEqual([len(page) for page in pages], [2, 2, 1])
+
+    def test_previous_link_returns_the_same_page(self):
+        first = self.client.get(f'/api/v1/tasks/{self.task.pk}/comments/?page_size=2').data
+        second = self.client.get(first['next']).data
+        back = self.client.get(second['previous']).data
+        self.assertEqual([item['id'] for item in back['results']], [item['id'] for item in first['results']])
+
+    def test_comments_carry_author_names_without_extra_queries(self):
+        url = f'/api/v1/tasks/{self.task.pk}/comments/'
+        with CaptureQueriesContext(connection) as small:
+            self.client.get(f'{url}?page_size=1')
+        with CaptureQueriesContext(connection) as large:
+            response = self.client.get(f'{url}?page_size=5')
+        self.assertEqual(len(large), len(small))
+        self.assertEqual({item['username'] for item in response.data['results']}, {'ayse', 'mehmet'})
+
+    def test_other_users_task_is_404(self):
+        for path in ('comments', 'attachments'):
+            with self.subTest(path=path):
+                self.assertEqual(self.client.get(f'/api/v1/tasks/{self.foreign.pk}/{path}/').status_code, 404)
+        response = self.client.post(f'/api/v1/tasks/{self.foreign.pk}/comments/', {'comment': 'İzinsiz yorum'}, format='json')
+        self.assertEqual(response.status_code, 404)
+        self.assertFalse(TaskComment.objects.filter(comment='İzinsiz yorum').exists())
+        self.assertEqual(self.client.get('/api/v1/tasks/999999/comments/').status_code, 404)
+
+    def test_invalid_cursor_and_ordering(self):
+        url = f'/api/v1/tasks/{self.task.pk}/comments/'
+        self.assertEqual(self.client.get(f'{url}?cursor=bozuk').status_code, 404)
+        self.assertEqual(self.client.get(f'{url}?ordering=comment').status_code, 400)
+
+
+@override_settings(TASK_LIST_CACHE={'ENABLED': False})
+class TaskIfMatchTests(TestCase):
+    """If-Match ile iyimser kilitleme: eski ETag 412 alır, başarılı yazım sürümü artırır"""
+
+    def setUp(self):
+        self.user = User.objects.create_user('ayse', password='parola123')
+        self.task = Task.objects.create(user=self.user, title='Rapor hazırla')
+        self.client = APIClient()
+        self.client.force_authenticate(self.user)
+        self.url = f'/api/v1/tasks/{self.task.pk}/'
+
+    def test_matching_etag_updates_and_bumps_version(self):
+        etag = self.client.get(self.url)['ETag']
+        response = self.client.patch(self.url, {'title': 'Raporu gönder'}, format='json', HTTP_IF_MATCH=etag)
+        self.assertEqual(response.status_code, 200)
+        self.assertNotEqual(response['ETag'], etag)
+        self.task.refresh_from_db()
+        self.assertEqual((self.task.title, self.task.version), ('Raporu gönder', 2))
+        # Yeni ETag bir sonraki yazım için geçerlidir
+        self.assertEqual(self.client.get(self.url)['ETag'], response['ETag'])
+
+    def test_stale_etag_is_rejected(self):
+        etag = self.client.get(self.url)['ETag']
+        self.client.patch(self.url, {'title': 'Raporu gönder'}, format='json', HTTP_IF_MATCH=etag)
+        response = self.client.patch(self.url, {'title': 'Eski kopya'}, format='json', HTTP_IF_MATCH=etag)
+        self.assertEqual(response.status_code, 412)
+        self.task.refresh_from_db()
+        self.assertEqual((self.task.title, self.task.version), ('Raporu gönder', 2))
+
+    def test_unchanged_data_does_not_bump_version(self):
+        etag = self.client.get(self.url)['ETag']
+        response = self.client.patch(self.url, {'title': 'Rapor hazırla'}, format='json', HTTP_IF_MATCH=etag)
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response['ETag'], etag)
+        self.task.refresh_from_db()
+        self.assertEqual(self.task.version, 1)
+
+    def test_conditional_get_returns_304(self):
+        etag = self.client.get(self.url)['ETag']
+        self.assertEqual(self.client.get(self.url, HTTP_IF_NONE_MATCH=etag).status_code, 304)
+
+    def test_if_modified_since_never_hides_same_second_edits(self):
+        first = self.client.get(self.url)
+        self.client.patch(self.url, {'title': 'Raporu gönder'}, format='json')
+        # Aynı saniyedeki yazım Last-Modified'i değiştirmeyebilir; yanıt yine de güncel olmalı
+        response = self.client.get(self.url, HTTP_IF_MODIFIED_SINCE=first['Last-Modified'])
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.data['title'], 'Raporu gönder')
+
+        response = self.client.get('/api/v1/tasks/', HTTP_IF_MODIFIED_SINCE=first['Last-Modified'])
+        self.assertEqual(response.status_code, 200)
+
+    def task_queries(self, queries, verb):
+        return [query['sql'] for query in queries if query['sql'].startswith(verb) and '"base_task"' in query['sql'].split(' WHERE ')[0]]
+
+    def test_update_loads_and_writes_the_row_once(self):
+        for locked in (False, True):
+            with self.subTest(select_for_update=locked), \
+                    override_settings(TASK_UPDATE={'SELECT_FOR_UPDATE': locked}), \
+                    CaptureQueriesContext(connection) as queries:
+                response = self.client.patch(self.url, {'title': f'Başlık {locked}'}, format='json')
+            self.assertEqual(response.status_code, 200)
+            self.assertEqual(len(self.task_queries(queries, 'SELECT "base_task"')), 1)
+            self.assertEqual(len(self.task_queries(queries, 'UPDATE')), 1)
+
+    def test_concurrent_write_between_load_and_update_conflicts(self):
+        original = Task.objects.get(pk=self.task.pk)
+
+        def concurrent_write(*args, **kwargs):
+            Task.objects.filter(pk=self.task.pk).update(title='Başkası yazdı', version=F('version') + 1)
+            return original
+
+        with override_settings(TASK_UPDATE={'SELECT_FOR_UPDATE': False}), \
+                mock.patch('base.views.TaskDetailAPI.get_object', side_effect=concurrent_write):
+            response = self.client.patch(self.url, {'title': 'Benim yazım'}, format='json')
+        self.assertEqual(response.status_code, 409)
+        self.assertFalse(Task.objects.filter(title='Benim yazım').exists())
+        self.assertFalse(History.objects.exists())
+
+    def test_update_still_notifies_post_save_receivers(self):
+        journal = TaskChange.objects.filter(task_id=self.task.pk).count()
+        self.client.patch(self.url, {'status': 'completed'}, format='json')
+        self.assertEqual(TaskChange.objects.filter(task_id=self.task.pk).count(), journal + 1)
+        self.assertEqual(History.objects.filter(task=self.task).count(), 1)
+        stats = self.client.get('/api/v1/tasks/stats/').data
+        self.assertEqual((stats['by_status']['completed'], stats['by_status']['pending']), (1, 0))
+
+
+@override_settings(TASK_LIST_CACHE={'ENABLED': False})
+class TaskBatchTests(TestCase):
+    """Toplu işlemler ya hep birlikte uygulanır ya hiç uygulanmaz"""
+
+    def setUp(self):
+        self.user = User.objects.create_user('ayse', password='parola123')
+        self.other = User.objects.create_user('mehmet', password='parola123')
+        self.task = Task.objects.create(user=self.user, title='Rapor hazırla')
+        self.doomed = Task.objects.create(user=self.user, title='Eski görev')
+        self.foreign = Task.objects.create(user=self.other, title='Başkasının görevi')
+        self.client = APIClient()
+        self.client.force_authenticate(self.user)
+
+    def snapshot(self):
+        return list(Task.objects.order_by('pk').values_list('pk', 'title', 'status', 'version'))
+
+    def test_all_operations_applied(self):
+        response = self.client.post('/api/v1/tasks/batch/', {'operations': [
+            {'op': 'create', 'data': {'title': 'Yeni görev'}},
+            {'op': 'update', 'id': self.task.pk, 'data': {'title': 'Raporu gönder'}},
+            {'op': 'delete', 'id': self.doomed.pk},
+        ]}, format='json')
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual([result['status'] for result in response.data['results']], ['ok'] * 3)
+        self.task.refresh_from_db()
+        self.assertEqual((self.task.title, self.task.version), ('Raporu gönder', 2))
+        self.assertFalse(Task.objects.filter(pk=self.doomed.pk).exists())
+        self.assertTrue(Task.objects.filter(user=self.user, title='Yeni görev').exists())
+
+    def test_invalid_operation_rolls_back_the_rest(self):
+        before = self.snapshot()
+        response = self.client.post('/api/v1/tasks/batch/', {'operations': [
+            {'op': 'create', 'data': {'title': 'Yeni görev'}},
+            {'op': 'update', 'id': self.task.pk, 'data': {'title': 'Raporu gönder'}},
+            {'op': 'delete', 'id': self.doomed.pk},
+            {'op': 'update', 'id': self.foreign.pk, 'data': {'title': 'Ele geçir'}},
+        ]}, format='json')
+        self.assertEqual(response.status_code, 400)
+        statuses = [result['status'] for result in response.data['results']]
+        self.assertEqual(statuses, ['skipped', 'skipped', 'skipped', 'error'])
+        self.assertEqual(self.snapshot(), before)
+
+    def test_failure_while_applying_rolls_back_the_rest(self):
+        before = self.snapshot()
+        with mock.patch('base.task_updates.OperationLogger.log_task_batch', side_effect=RuntimeError('log')):
+            with self.assertRaises(RuntimeError):
+                apply_task_batch([
+                    {'op': 'create', 'data': {'title': 'Yeni görev'}},
+                    {'op': 'toggle', 'id': self.task.pk},
+                    {'op': 'delete', 'id': self.doomed.pk},
+                ], Task.objects.filter(user=self.user), self.user, '127.0.0.1')
+        self.assertEqual(self.snapshot(), before)
+        self.assertFalse(History.objects.exists())
+
+    def load_then(self, concurrent_write):
+        """Görevler yüklendikten hemen sonra araya başka bir yazım sokan parse_batch_operations"""
+        from .task_updates import parse_batch_operations
+
+        def parse(*args, **kwargs):
+            result = parse_batch_operations(*args, **kwargs)
+            concurrent_write()
+            return result
+        return mock.patch('base.task_updates.parse_batch_operations', side_effect=parse)
+
+    @override_settings(TASK_UPDATE={'SELECT_FOR_UPDATE': False})
+    def test_write_between_load_and_apply_conflicts(self):
+        bump = lambda: Task.objects.filter(pk=self.task.pk).update(status='in_progress', version=F('version') + 1)
+        with self.load_then(bump):
+            response = self.client.post('/api/v1/tasks/batch/', {'operations': [
+                {'op': 'create', 'data': {'title': 'Yeni görev'}},
+                {'op': 'update', 'id': self.task.pk, 'data': {'title': 'Raporu gönder'}},
+            ]}, format='json')
+        self.assertEqual(response.status_code, 409)
+        self.assertFalse(Task.objects.filter(title__in=['Yeni görev', 'Raporu gönder']).exists())
+        self.assertFalse(History.objects.exists())
+
+    def test_rows_only_receive_their_own_changed_columns(self):
+        rename = lambda: Task.objects.filter(pk=self.doomed.pk).update(title='Eşzamanlı başlık')
+        for locked in (False, True):
+            with self.subTest(rows_locked=locked), self.load_then(rename), \
+                    mock.patch('base.task_updates.rows_locked', return_value=locked):
+                response = self.client.post('/api/v1/tasks/batch/', {'operations': [
+                    {'op': 'update', 'id': self.task.pk, 'data': {'title': f'Başlık {locked}'}},
+                    {'op': 'update', 'id': self.doomed.pk, 'data': {'priority': 'high' if locked else 'low'}},
+                ]}, format='json')
+                self.assertEqual(response.status_code, 200)
+                self.doomed.refresh_from_db()
+                # Diğer satırın başlık değişikliği bu satıra yazılmaz, araya giren başlık korunur
+                self.assertEqual((self.doomed.title, self.doomed.priority), ('Eşzamanlı başlık', 'high' if locked else 'low'))
+
+
+@override_settings(TASK_LIST_CACHE={'ENABLED': True, 'ALIAS': 'task_list', 'TIMEOUT': 300, 'KEY_PREFIX': 'test_task_list'})
+class TaskListCacheTests(TestCase):
+    """Önbellek açıkken hiçbir yazımdan sonra eski liste sunulmaz"""
+    url = '/api/v1/tasks/'
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = User.objects.create_user('ayse', password='parola123')
+        cls.admin = User.objects.create_superuser('yonetici', 'yonetici@example.com', 'parola123')
+        cls.task = Task.objects.create(user=cls.user, title='Rapor hazırla')
+        cls.other = Task.objects.create(user=cls.user, title='Sunum')
+
+    def setUp(self):
+        caches['task_list'].clear()
+        self.task_cache = get_task_list_cache()
+        self.client = APIClient()
+        self.client.force_authenticate(self.user)
+
+    def titles(self, client=None):
+        response = (client or self.client).get(self.url)
+        self.assertEqual(response.status_code, 200)
+        return {item['title']: item['status'] for item in response.data['results']}
+
+    def write(self, method, url, data=None):
+        with self.captureOnCommitCallbacks(execute=True):
+            response = getattr(self.client, method)(url, data, format='json')
+        self.assertLess(response.status_code, 300, getattr(response, 'data', response))
+        return response
+
+    def assertServedFromCache(self):
+        hits = self.task_cache.hits
+        before = self.titles()
+        self.assertEqual(self.task_cache.hits, hits + 1)
+        return before
+
+    def test_repeated_list_is_served_from_cache(self):
+        self.titles()
+        self.assertServedFromCache()
+
+    def test_create_update_and_delete_invalidate(self):
+        self.titles()
+        self.write('post', self.url, {'title': 'Yeni görev'})
+        self.assertIn('Yeni görev', self.titles())
+
+        self.write('patch', f'/api/v1/tasks/{self.task.pk}/', {'title': 'Raporu gönder'})
+        titles = self.titles()
+        self.assertIn('Raporu gönder', titles)
+        self.assertNotIn('Rapor hazırla', titles)
+
+        self.write('delete', f'/api/v1/tasks/{self.other.pk}/')
+        self.assertNotIn('Sunum', self.titles())
+
+    def test_batch_and_toggles_invalidate(self):
+        self.titles()
+        self.write('post', '/api/v1/tasks/batch/', {'operations': [
+            {'op': 'update', 'id': self.task.pk, 'data': {'status': 'in_progress'}},
+            {'op': 'delete', 'id': self.other.pk},
+        ]})
+        self.assertEqual(self.titles(), {'Rapor hazırla': 'in_progress'})
+
+        self.write('post', '/api/v1/tasks/toggle/', {'ids': [self.task.pk]})
+        self.assertEqual(self.titles(), {'Rapor hazırla': 'completed'})
+
+        session = Client()
+        session.force_login(self.user)
+        with self.captureOnCommitCallbacks(execute=True):
+            self.assertEqual(session.post(f'/api/v1/tasks/{self.task.pk}/toggle/').status_code, 200)
+        self.assertEqual(self.titles(), {'Rapor hazırla': 'pending'})
+
+    def test_stale_etag_is_not_revalidated(self):
+        etag = self.client.get(self.url)['ETag']
+        self.assertEqual(self.client.get(self.url, HTTP_IF_NONE_MATCH=etag).status_code, 304)
+        self.write('patch', f'/api/v1/tasks/{self.task.pk}/', {'title': 'Raporu gönder'})
+        response = self.client.get(self.url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, 200)
+        self.assertNotEqual(response['ETag'], etag)
+
+    def test_owner_and_admin_versions_are_bumped(self):
+        admin_client = APIClient()
+        admin_client.force_authenticate(self.admin)
+        self.titles(admin_client)
+        versions = {owner: self.task_cache.get_version(owner) for owner in (self.user.pk, ALL_TASKS, self.admin.pk)}
+        self.write('patch', f'/api/v1/tasks/{self.task.pk}/', {'title': 'Raporu gönder'})
+        self.assertGreater(self.task_cache.get_version(self.user.pk), versions[self.user.pk])
+        self.assertGreater(self.task_cache.get_version(ALL_TASKS), versions[ALL_TASKS])
+        # İlgisiz kullanıcıların önbelleği korunur
+        self.assertEqual(self.task_cache.get_version(self.admin.pk), versions[self.admin.pk])
+        self.assertIn('Raporu gönder', self.titles(admin_client))
+
+    def test_invalidation_waits_for_commit(self):
+        self.titles()
+        version = self.task_cache.get_version(self.user.pk)
+        with self.captureOnCommitCallbacks() as callbacks:
+            self.client.patch(f'/api/v1/tasks/{self.task.pk}/', {'title': 'Raporu gönder'}, format='json')
+        # İşlem onaylanmadan sürüm değişmez; onaylanınca artar
+        self.assertEqual(self.task_cache.get_version(self.user.pk), version)
+        for callback in callbacks:
+            callback()
+        self.assertGreater(self.task_cache.get_version(self.user.pk), version)
+
+    def test_rolled_back_write_keeps_version(self):
+        version = self.task_cache.get_version(self.user.pk)
+        with self.captureOnCommitCallbacks(execute=True) as callbacks:
+            with contextlib.suppress(RuntimeError), transaction.atomic():
+                Task.objects.create(user=self.user, title='Geri alınacak')
+                raise RuntimeError
+        self.assertEqual(callbacks, [])
+        self.assertEqual(self.task_cache.get_version(self.user.pk), version)
+        self.assertNotIn('Geri alınacak', self.titles())
+
+
+@override_settings(TASK_CHANGES={'SETTLE_SECONDS': 0}, TASK_LIST_CACHE={'ENABLED': False})
+class TaskChangesTests(TestCase):
+    """Delta senkronizasyon: imleçten sonraki değişiklikler ve silinen görevlerin id'leri"""
+
+    def setUp(self):
+        self.user = User.objects.create_user('ayse', password='parola123')
+        self.other = User.objects.create_user('mehmet', password='parola123')
+        self.client = APIClient()
+        self.client.force_authenticate(self.user)
+
+    def changes(self, since=None, **params):
+        if since is not None:
+            params['since'] = since
+        response = self.client.get('/api/v1/tasks/changes/', params)
+        self.assertEqual(response.status_code, 200)
+        return response.data
+
+    def test_initial_call_returns_only_a_cursor(self):
+        Task.objects.create(user=self.user, title='Rapor hazırla')
+        data = self.changes()
+        self.assertEqual((data['changes'], data['deleted'], data['has_more']), ([], [], False))
+        self.assertEqual(self.changes(data['cursor'])['changes'], [])
+
+    def test_updates_and_tombstones_since_cursor(self):
+        kept = Task.objects.create(user=self.user, title='Rapor hazırla')
+        removed = Task.objects.create(user=self.user, title='Eski görev')
+        cursor = self.changes()['cursor']
+
+        kept.title = 'Raporu gönder'
+        kept.save()
+        created = Task.objects.create(user=self.user, title='Yeni görev')
+        removed_id = removed.pk
+        removed.delete()
+        # Oluşturulup aynı aralıkta silinen görev yalnızca silinmiş olarak döner
+        transient = Task.objects.create(user=self.user, title='Geçici görev')
+        transient_id = transient.pk
+        transient.delete()
+        Task.objects.create(user=self.other, title='Başkasının görevi').delete()
+
+        data = self.changes(cursor)
+        self.assertEqual([task['id'] for task in data['changes']], [kept.pk, created.pk])
+        self.assertEqual(data['changes'][0]['title'], 'Raporu gönder')
+        self.assertEqual(data['deleted'], sorted([removed_id, transient_id]))
+        self.assertEqual(self.changes(data['cursor'])['deleted'], [])
+
+    def test_limit_pages_through_the_journal(self):
+        cursor = self.changes()['cursor']
+        tasks = [Task.objects.create(user=self.user, title=f'Görev {i}') for i in range(3)]
+        first = self.changes(cursor, limit=2)
+        self.assertTrue(first['has_more'])
+        second = self.changes(first['cursor'], limit=2)
+        self.assertFalse(second['has_more'])
+        ids = [task['id'] for task in first['changes'] + second['changes']]
+        self.assertEqual(ids, [task.pk for task in tasks])
+
+    def test_invalid_cursor_is_rejected(self):
+        response = self.client.get('/api/v1/tasks/changes/', {'since': 'bozuk'})
+        self.assertEqual(response.status_code, 404)
+
+    def test_cursor_older_than_retention_is_gone(self):
+        cursor = encode_cursor(0, timezone.now() - timedelta(days=31))
+        response = self.client.get('/api/v1/tasks/changes/', {'since': cursor})
+        self.assertEqual(response.status_code, 410)
+
+
+@override_settings(TASK_LIST_CACHE={'ENABLED': False})
+class TaskSearchTests(TestCase):
+    """Görev araması: başlık > açıklama > yorum sıralaması ve görünürlük"""
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = User.objects.create_user('ayse', password='parola123')
+        cls.other = User.objects.create_user('mehmet', password='parola123')
+        cls.by_title = Task.objects.create(user=cls.user, title='Bütçe planı')
+        cls.by_description = Task.objects.create(user=cls.user, title='Toplantı', description='Bütçe kalemlerini gözden geçir')
+        cls.by_comment = Task.objects.create(user=cls.user, title='Sunum')
+        # Başka bir kullanıcının yorumu da görevi bulunur kılar; görev yine sahibinindir
+        TaskComment.objects.create(task=cls.by_comment, user=cls.other, comment='Bütçe rakamları eksik')
+        Task.objects.create(user=cls.user, title='İlgisiz görev')
+        foreign = Task.objects.create(user=cls.other, title='Bütçe onayı', description='Bütçe')
+        TaskComment.objects.create(task=foreign, user=cls.user, comment='Bütçe tamam')
+
+    def setUp(self):
+        self.client = APIClient()
+        self.client.force_authenticate(self.user)
+
+    def search(self, query):
+        response = self.client.get(f'/api/v1/tasks/search/?{query}')
+        self.assertEqual(response.status_code, 200, response.data)
+        return response.data['results']
+
+    def test_ranked_by_where_the_term_matches(self):
+        results = self.search('q=bütçe')
+        self.assertEqual([item['id'] for item in results],
+                         [self.by_title.pk, self.by_description.pk, self.by_comment.pk])
+        ranks = [item['rank'] for item in results]
+        self.assertEqual(ranks, sorted(ranks, reverse=True))
+        self.assertGreater(ranks[0], ranks[-1])
+
+    def test_prefix_terms_and_limit(self):
+        self.assertEqual([item['id'] for item in self.search('q=büt&limit=1')], [self.by_title.pk])
+        self.assertEqual(self.search('q=bütçe planı')[0]['id'], self.by_title.pk)
+
+    def test_other_users_tasks_and_comments_stay_hidden(self):
+        visible = {task.pk for task in Task.objects.filter(user=self.user)}
+        self.assertTrue({item['id'] for item in self.search('q=bütçe')} <= visible)
+        # Yalnızca başkasının görevinde geçen kelime hiçbir sonuç döndürmez
+        self.assertEqual(self.search('q=onayı'), [])
+        self.assertEqual(self.search('q=tamam'), [])
+
+    def test_search_index_follows_updates_and_deletes(self):
+        Task.objects.filter(pk=self.by_title.pk).update(title='Gider planı')
+        self.by_comment.taskcomment_set.all().delete()
+        self.assertEqual([item['id'] for item in self.search('q=bütçe')], [self.by_description.pk])
+
+    def test_invalid_params(self):
+        self.assertEqual(self.client.get('/api/v1/tasks/search/').status_code, 400)
+        self.assertEqual(self.client.get('/api/v1/tasks/search/?q=bütçe&limit=0').status_code, 400)
+
+
+@override_settings(TASK_STATS={'COUNTERS': True}, TASK_LIST_CACHE={'ENABLED': False})
+class TaskStatsTests(TestCase):
+    """Sayaç tablosundan okunan pano, her yazımdan sonra tam toplama sorgusuyla aynı kalır"""
+    url = '/api/v1/tasks/stats/'
+
+    def setUp(self):
+        self.user = User.objects.create_user('ayse', password='parola123')
+        self.client = APIClient()
+        self.client.force_authenticate(self.user)
+        yesterday = timezone.localdate() - timedelta(days=1)
+        self.tasks = [
+            Task.objects.create(user=self.user, title=f'Görev {index}', priority=priority, due_date=yesterday)
+            for index, priority in enumerate(['low', 'medium', 'high', 'critical'])
+        ]
+
+    def write(self, method, url, data=None):
+        with self.captureOnCommitCallbacks(execute=True):
+            response = getattr(self.client, method)(url, data, format='json')
+        self.assertLess(response.status_code, 300)
+
+    def assertNoDrift(self):
+        response = self.client.get(self.url)
+        self.assertEqual(response.data.pop('source'), 'counters')
+        self.assertEqual(response.data, aggregate_task_stats(Task.objects.filter(user=self.user)))
+        return response.data
+
+    def test_counters_match_aggregate_after_batch_and_deletes(self):
+        first, second, third, fourth = self.tasks
+        self.assertEqual(self.assertNoDrift()['total'], 4)
+
+        self.write('post', '/api/v1/tasks/batch/', {'operations': [
+            {'op': 'create', 'data': {'title': 'Yeni görev', 'priority': 'high'}},
+            {'op': 'update', 'id': first.pk, 'data': {'status': 'completed'}},
+            {'op': 'update', 'id': second.pk, 'data': {'priority': 'critical', 'status': 'in_progress'}},
+            {'op': 'delete', 'id': third.pk},
+        ]})
+        stats = self.assertNoDrift()
+        self.assertEqual((stats['total'], stats['by_status']['completed'], stats['by_priority']['critical']), (4, 1, 2))
+
+        self.write('post', '/api/v1/tasks/toggle/', {'ids': [first.pk, fourth.pk]})
+        self.write('patch', f'/api/v1/tasks/{second.pk}/', {'priority': 'low'})
+        self.write('delete', f'/api/v1/tasks/{fourth.pk}/')
+        stats = self.assertNoDrift()
+        self.assertEqual(stats['overdue'], 2)
+
+        # Sinyal gönderen queryset silmesi de sayılır
+        with self.captureOnCommitCallbacks(execute=True):
+            Task.objects.filter(user=self.user, priority='high').delete()
+        self.assertEqual(self.assertNoDrift()['by_priority']['high'], 0)
+        self.assertFalse(TaskCounter.objects.filter(user=self.user, count__lt=0).exists())
+
+    def test_failed_batch_leaves_counters_untouched(self):
+        before = self.assertNoDrift()
+        response = self.client.post('/api/v1/tasks/batch/', {'operations': [
+            {'op': 'update', 'id': self.tasks[0].pk, 'data': {'status': 'completed'}},
+            {'op': 'delete', 'id': 0},
+        ]}, format='json')
+        self.assertGreaterEqual(response.status_code, 400)
+        self.assertEqual(self.assertNoDrift(), before)
+
+
+@override_settings(TASK_LIST_CACHE={'ENABLED': False})
+class CalendarTests(TestCase):
+    """Takvim: aralık sınırları dahil, girdiler güne göre gruplu, gün sınırı yerel saat diliminde"""
+    url = '/api/v1/calendar/'
+
+    def setUp(self):
+        self.user = User.objects.create_user('ayse', password='parola123')
+        self.client = APIClient()
+        self.client.force_authenticate(self.user)
+
+    def days(self, query=''):
+        response = self.client.get(f'{self.url}{query}')
+        self.assertEqual(response.status_code, 200, response.data)
+        return {day['date']: day['items'] for day in json.loads(response.content)['days']}
+
+    def due(self, value, user=None, title='Görev'):
+        return Task.objects.create(user=user or self.user, title=title, due_date=value)
+
+    def test_range_edges_are_inclusive_and_grouped_by_day(self):
+        start, end = date(2024, 3, 1), date(2024, 3, 7)
+        for offset in (-1, 0, 6, 7):
+            self.due(start + timedelta(days=offset), title=f'Bitiş {offset}')
+        planned = self.due(end + timedelta(days=30), title='Planlı')
+        TaskSchedule.objects.create(task=planned, schedule_date=start)
+        TaskSchedule.objects.create(task=planned, schedule_date=end + timedelta(days=1))
+        weekly = self.due(start - timedelta(days=7), title='Haftalık')
+        TaskRecurrence.objects.create(task=weekly, recurrence_type='weekly')
+        # Başka kullanıcının girdileri görünmez
+        stranger = User.objects.create_user('mehmet', password='parola123')
+        TaskSchedule.objects.create(task=self.due(start + timedelta(days=2), user=stranger), schedule_date=start)
+
+        days = self.days(f'?start={start}&end={end}')
+        self.assertEqual(list(days), ['2024-03-01', '2024-03-07'])
+        first = days['2024-03-01']
+        self.assertEqual(sorted(item['type'] for item in first), ['due', 'recurrence', 'schedule'])
+        self.assertEqual({item['task']['title'] for item in first}, {'Bitiş 0', 'Planlı', 'Haftalık'})
+        recurrence = next(item for item in first if item['type'] == 'recurrence')
+        self.assertEqual(recurrence['task']['due_date'], '2024-03-01')
+        self.assertEqual([item['task']['title'] for item in days['2024-03-07']], ['Bitiş 6'])
+
+    @override_settings(TIME_ZONE='Europe/Istanbul')
+    def test_default_range_and_recurrence_anchor_use_local_date(self):
+        # UTC'de 10 Mart 22:30, İstanbul'da 11 Mart 01:30
+        moment = datetime(2024, 3, 10, 22, 30, tzinfo=timezone.utc)
+        with mock.patch('django.utils.timezone.now', return_value=moment):
+            self.due(date(2024, 3, 10), title='Dün')
+            self.due(date(2024, 3, 11), title='Bugün')
+            TaskRecurrence.objects.create(task=Task.objects.create(user=self.user, title='Günlük'), recurrence_type='daily')
+            days = self.days('?end=2024-03-12')
+        self.assertEqual(list(days), ['2024-03-11', '2024-03-12'])
+        self.assertEqual([item['task']['title'] for item in days['2024-03-11']], ['Bugün'])
+        # Tekrar yerel oluşturulma gününden (11 Mart) sonra başlar
+        self.assertEqual([item['type'] for item in days['2024-03-12']], ['recurrence'])
+
+    def test_invalid_ranges(self):
+        self.assertEqual(self.client.get(f'{self.url}?start=2024-03-07&end=2024-03-01').status_code, 400)
+        self.assertEqual(self.client.get(f'{self.url}?start=2024-01-01&end=2025-01-01').status_code, 400)
+        self.assertEqual(self.client.get(f'{self.url}?start=bugün').status_code, 400)
+
+
+class DependencyTestMixin:
+    def setUp(self):
+        self.user = User.objects.create_user('ayse', password='parola123')
+        self.a, self.b, self.c, self.d = (Task.objects.create(user=self.user, title=f'Görev {name}') for name in 'abcd')
+        self.client = APIClient()
+        self.client.force_authenticate(self.user)
+
+    def depend(self, task, dependent_task):
+        return self.client.post('/api/v1/taskdependences/', {'task': task.pk, 'dependent_task': dependent_task.pk}, format='json')
+
+    def closure(self):
+        return {(row.ancestor_id, row.descendant_id): row.depth for row in TaskClosure.objects.all()}
+
+    def assertClosureConsistent(self):
+        """Artımlı bakım, kapanışın baştan hesaplanmış haliyle aynı olmalı"""
+        statuses = dict(Task.objects.values_list('pk', 'status'))
+        edges = TaskDependence.objects.values_list('task_id', 'dependent_task_id')
+        self.assertEqual(self.closure(), compute_closure(statuses, edges))
+
+
+@override_settings(TASK_LIST_CACHE={'ENABLED': False})
+class TaskDependencyCycleTests(DependencyTestMixin, TestCase):
+    """Döngü oluşturan bağımlılıklar eklenmez ve güncellenemez"""
+
+    def test_cycle_is_rejected(self):
+        self.depend(self.a, self.b)
+        self.depend(self.b, self.c)
+        before = self.closure()
+        response = self.depend(self.c, self.a)
+        self.assertEqual(response.status_code, 400)
+        self.assertIn('dependent_task', response.data)
+        self.assertFalse(TaskDependence.objects.filter(task=self.c, dependent_task=self.a).exists())
+        self.assertEqual(self.closure(), before)
+
+    def test_retargeting_an_edge_into_a_cycle_is_rejected(self):
+        self.depend(self.a, self.b)
+        edge = TaskDependence.objects.get(task=self.a, dependent_task=self.b)
+        self.depend(self.b, self.c)
+        response = self.client.patch(f'/api/v1/taskdependences/{edge.pk}/', {'task': self.c.pk, 'dependent_task': self.b.pk}, format='json')
+        self.assertEqual(response.status_code, 400)
+        self.assertClosureConsistent()
+
+    def test_self_dependency_is_rejected(self):
+        self.assertEqual(self.depend(self.a, self.a).status_code, 400)
+        self.assertFalse(TaskDependence.objects.exists())
+
+
+@override_settings(TASK_LIST_CACHE={'ENABLED': False})
+class TaskClosureTests(DependencyTestMixin, TestCase):
+    """Bağımlılık ekleme/silme ve görev kapanmasında kapanış tablosunun bakımı"""
+
+    def test_adding_edges_extends_closure(self):
+        a, b, c, d = self.a.pk, self.b.pk, self.c.pk, self.d.pk
+        self.assertEqual(self.depend(self.a, self.b).status_code, 201)
+        self.assertEqual(self.depend(self.b, self.c).status_code, 201)
+        self.assertEqual(self.closure(), {(a, b): 1, (b, c): 1, (a, c): 2})
+        # Kısayol kenarı derinliği kısaltır
+        self.depend(self.a, self.c)
+        self.depend(self.c, self.d)
+        self.assertEqual(self.closure()[(a, c)], 1)
+        self.assertEqual(self.closure()[(a, d)], 2)
+        self.assertClosureConsistent()
+
+    def test_removing_an_edge_shrinks_closure(self):
+        a, b, c = self.a.pk, self.b.pk, self.c.pk
+        self.depend(self.a, self.b)
+        self.depend(self.b, self.c)
+        self.depend(self.a, self.c)
+        edge = TaskDependence.objects.get(task=self.a, dependent_task=self.c)
+        self.assertEqual(self.client.delete(f'/api/v1/taskdependences/{edge.pk}/').status_code, 204)
+        # a -> c yolu b üzerinden sürer
+        self.assertEqual(self.closure()[(a, c)], 2)
+        edge = TaskDependence.objects.get(task=self.a, dependent_task=self.b)
+        self.client.delete(f'/api/v1/taskdependences/{edge.pk}/')
+        self.assertEqual(self.closure(), {(b, c): 1})
+        self.assertClosureConsistent()
+
+    def test_closing_and_reopening_a_task_toggles_its_edges(self):
+        a, b, c = self.a.pk, self.b.pk, self.c.pk
+        self.depend(self.a, self.b)
+        self.depend(self.b, self.c)
+        self.client.patch(f'/api/v1/tasks/{b}/', {'status': 'completed'}, format='json')
+        self.assertEqual(self.closure(), {(a, b): 1})
+        blocked = {task['id']: task['is_blocked'] for task in self.client.get('/api/v1/tasks/').data['results']}
+        self.assertEqual((blocked[b], blocked[c]), (True, False))
+        self.client.patch(f'/api/v1/tasks/{b}/', {'status': 'pending'}, format='json')
+        self.assertEqual(self.closure(), {(a, b): 1, (b, c): 1, (a, c): 2})
+        self.assertClosureConsistent()
+
+    def test_deleting_a_task_repairs_paths_through_it(self):
+        self.depend(self.a, self.b)
+        self.depend(self.b, self.c)
+        self.b.delete()
+        self.assertEqual(self.closure(), {})
+        self.assertClosureConsistent()
+
+
+class RecurrenceTests(TestCase):
+    """Tekrar örneklerinin üretimi yeniden çalıştırmada ve çakışan üreticilerde tekrarlanmaz"""
+
+    def setUp(self):
+        self.today = timezone.localdate()
+        self.user = User.objects.create_user('ayse', password='parola123')
+        self.template = Task.objects.create(user=self.user, title='Günlük rapor', due_date=self.today)
+        self.recurrence = TaskRecurrence.objects.create(task=self.template, recurrence_type='daily')
+
+    def occurrences(self):
+        return list(Task.objects.filter(recurrence=self.recurrence).order_by('occurrence_date').values_list('occurrence_date', flat=True))
+
+    def test_materializes_until_horizon(self):
+        created = materialize_recurrences(horizon_days=5, today=self.today)
+        self.assertEqual(created, 5)
+        self.assertEqual(self.occurrences(), [self.today + timedelta(days=i) for i in range(1, 6)])
+        self.recurrence.refresh_from_db()
+        self.assertEqual(self.recurrence.generated_until, self.today + timedelta(days=5))
+
+    def test_rerun_creates_nothing(self):
+        materialize_recurrences(horizon_days=5, today=self.today)
+        self.assertEqual(materialize_recurrences(horizon_days=5, today=self.today), 0)
+        self.assertEqual(len(self.occurrences()), 5)
+
+    def test_conflicting_rows_are_ignored(self):
+        materialize_recurrences(horizon_days=3, today=self.today)
+        # İlerlemesi kaydedilmemiş bir üretici aynı örnekleri yeniden eklemeye çalışır
+        TaskRecurrence.objects.filter(pk=self.recurrence.pk).update(generated_until=None)
+        self.assertEqual(materialize_recurrences(horizon_days=5, today=self.today), 2)
+        self.assertEqual(self.occurrences(), [self.today + timedelta(days=i) for i in range(1, 6)])
+
+    def test_horizon_extension_only_adds_new_dates(self):
+        materialize_recurrences(horizon_days=3, today=self.today)
+        later = self.today + timedelta(days=2)
+        self.assertEqual(materialize_recurrences(horizon_days=3, today=later), 2)
+        self.assertEqual(len(set(self.occurrences())), 5)
+
+
+class FailingNotifier(ReminderNotifier):
+    def send(self, reminders):
+        raise ConnectionError('smtp')
+
+
+class ReminderTests(TestCase):
+    """Zamanı gelen hatırlatmalar partiler halinde kilitlenir, bir kez gönderilir ve işaretlenir"""
+
+    def setUp(self):
+        MemoryNotifier.outbox.clear()
+        self.today = timezone.localdate()
+        self.user = User.objects.create_user('ayse', password='parola123')
+        open_task = Task.objects.create(user=self.user, title='Rapor hazırla')
+        closed_task = Task.objects.create(user=self.user, title='Bitti', status='completed')
+        yesterday = self.today - timedelta(days=1)
+        self.due = [TaskSchedule.objects.create(task=open_task, reminder_date=yesterday) for _ in range(3)]
+        self.due.append(TaskSchedule.objects.create(task=open_task, reminder_date=self.today))
+        self.closed = TaskSchedule.objects.create(task=closed_task, reminder_date=yesterday)
+        self.future = TaskSchedule.objects.create(task=open_task, reminder_date=self.today + timedelta(days=1))
+        self.sent = TaskSchedule.objects.create(task=open_task, reminder_date=yesterday, reminder_sent=True)
+
+    def test_claims_only_due_unsent_reminders_in_date_order(self):
+        claimed = claim_due_reminders(self.today, 10)
+        self.assertEqual([schedule.pk for schedule in claimed], [*(s.pk for s in self.due[:3]), self.closed.pk, self.due[3].pk])
+        self.assertEqual(len(claim_due_reminders(self.today, 2)), 2)
+
+    def test_dispatch_sends_once_and_marks_claimed_rows(self):
+        stats = dispatch_reminders(notifier=MemoryNotifier(), batch_size=2, today=self.today)
+        self.assertEqual((stats['sent'], stats['skipped'], stats['batches']), (4, 1, 3))
+        self.assertEqual(sorted(reminder['schedule_id'] for reminder in MemoryNotifier.outbox), sorted(s.pk for s in self.due))
+        self.assertFalse(TaskSchedule.objects.filter(reminder_sent=False, reminder_date__lte=self.today).exists())
+        self.assertIsNotNone(TaskSchedule.objects.get(pk=self.closed.pk).reminder_sent_at)
+        self.assertFalse(TaskSchedule.objects.get(pk=self.future.pk).reminder_sent)
+
+        stats = dispatch_reminders(notifier=MemoryNotifier(), batch_size=2, today=self.today)
+        self.assertEqual((stats['sent'], stats['batches']), (0, 0))
+        self.assertEqual(len(MemoryNotifier.outbox), 4)
+
+    def test_failed_send_leaves_batch_unclaimed(self):
+        with self.assertRaises(ConnectionError):
+            dispatch_reminders(notifier=FailingNotifier(), batch_size=10, today=self.today)
+        self.assertEqual(TaskSchedule.objects.filter(reminder_sent=False, reminder_date__lte=self.today).count(), 5)
+        # Sonraki çalıştırma aynı partiyi yeniden dener
+        self.assertEqual(dispatch_reminders(notifier=MemoryNotifier(), today=self.today)['sent'], 4)
+
+
+class ParseRangeTests(TestCase):
+    """Range başlığı: tek aralık, son N bayt, taşan ve karşılanamayan aralıklar"""
+
+    def test_satisfiable_ranges(self):
+        self.assertEqual(parse_range('bytes=0-9', 100), (0, 9))
+        self.assertEqual(parse_range('bytes=95-', 100), (95, 99))
+        self.assertEqual(parse_range('bytes=50-1000', 100), (50, 99))
+        self.assertEqual(parse_range('bytes=99-99', 100), (99, 99))
+
+    def test_suffix_ranges(self):
+        self.assertEqual(parse_range('bytes=-10', 100), (90, 99))
+        # Dosyadan uzun son ek tüm dosyayı kapsar
+        self.assertEqual(parse_range('bytes=-500', 100), (0, 99))
+
+    def test_unsatisfiable_ranges(self):
+        for header, size in [('bytes=100-', 100), ('bytes=150-200', 100), ('bytes=5-2', 100), ('bytes=-0', 100), ('bytes=-5', 0), ('bytes=0-', 0)]:
+            with self.subTest(header=header, size=size), self.assertRaises(RangeNotSatisfiable):
+                parse_range(header, size)
+
+    def test_ignored_headers_mean_full_response(self):
+        for header in [None, '', 'bytes=-', 'bytes=0-1,5-6', 'items=0-5', 'bytes=a-b']:
+            with self.subTest(header=header):
+                self.assertIsNone(parse_range(header, 100))
+
+
+class AttachmentDownloadTests(TestCase):
+    """Ek indirme: 206 kısmi yanıt, 416, If-Range ve If-None-Match"""
+
+    def setUp(self):
+        self.root = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.root, ignore_errors=True)
+        storage = override_settings(ATTACHMENT_STORAGE=dict(settings.ATTACHMENT_STORAGE, ROOT=self.root, SENDFILE=None))
+        storage.enable()
+        self.addCleanup(storage.disable)
+
+        self.user = User.objects.create_user('ayse', password='parola123')
+        self.task = Task.objects.create(user=self.user, title='Rapor hazırla')
+        self.client = APIClient()
+        self.client.force_authenticate(self.user)
+        self.content = bytes(range(256)) * 4
+        response = self.client.post(
+            f'/api/v1/tasks/{self.task.pk}/attachments/',
+            {'file': SimpleUploadedFile('veri.bin', self.content, content_type='application/octet-stream')},
+            format='multipart',
+        )
+        self.assertEqual(response.status_code, 201)
+        self.url = f"/api/v1/taskattachments/{response.data['id']}/download/"
+
+    def body(self, response):
+        return b''.join(response.streaming_content)
+
+    def test_full_download(self):
+        response = self.client.get(self.url)
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response['Accept-Ranges'], 'bytes')
+        self.assertEqual(self.body(response), self.content)
+
+    def test_partial_download(self):
+        response = self.client.get(self.url, HTTP_RANGE='bytes=10-19')
+        self.assertEqual(response.status_code, 206)
+        self.assertEqual(response['Content-Range'], f'bytes 10-19/{len(self.content)}')
+        self.assertEqual(self.body(response), self.content[10:20])
+
+        response = self.client.get(self.url, HTTP_RANGE='bytes=-4')
+        self.assertEqual(self.body(response), self.content[-4:])
+
+    def test_out_of_bounds_range_is_416(self):
+        response = self.client.get(self.url, HTTP_RANGE=f'bytes={len(self.content)}-')
+        self.assertEqual(response.status_code, 416)
+        self.assertEqual(response['Content-Range'], f'bytes */{len(self.content)}')
+
+    def test_if_range(self):
+        etag = self.client.get(self.url)['ETag']
+        response = self.client.get(self.url, HTTP_RANGE='bytes=0-9', HTTP_IF_RANGE=etag)
+        self.assertEqual(response.status_code, 206)
+        # Değişmiş içerik: aralık yok sayılır, tüm dosya döner
+        response = self.client.get(self.url, HTTP_RANGE='bytes=0-9', HTTP_IF_RANGE='"eski"')
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(self.body(response), self.content)
+
+    def test_if_none_match(self):
+        etag = self.client.get(self.url)['ETag']
+        self.assertEqual(self.client.get(self.url, HTTP_IF_NONE_MATCH=etag).status_code, 304)
+
+    def test_other_users_cannot_download(self):
+        self.client.force_authenticate(User.objects.create_user('mehmet', password='parola123'))
+        self.assertEqual(self.client.get(self.url).status_code, 404)
+
+
+class SyncExecutor:
+    """Süreç havuzu yerine işi çağıran iş parçacığında hemen çalıştırır"""
+
+    def __init__(self):
+        self.submitted = []
+
+    def submit(self, fn, *args):
+        self.submitted.append(args)
+        future = Future()
+        try:
+            future.set_result(fn(*args))
+        except Exception as error:
+            future.set_exception(error)
+        return future
+
+
+class AttachmentThumbnailTests(TestCase):
+    """Küçük resimler: çözme, MAX_PIXELS sınırı, generate_thumbnails ve sahipsiz küçük resimlerin temizlenmesi"""
+
+    def setUp(self):
+        self.root = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.root, ignore_errors=True)
+        storage = override_settings(ATTACHMENT_STORAGE=dict(settings.ATTACHMENT_STORAGE, ROOT=self.root, SENDFILE=None))
+        storage.enable()
+        self.addCleanup(storage.disable)
+        # İşçi fonksiyonu bu süreçte çalıştığından global Pillow sınırı geri alınır
+        self.addCleanup(setattr, Image, 'MAX_IMAGE_PIXELS', Image.MAX_IMAGE_PIXELS)
+        self.addCleanup(_pending.clear)
+        self.executor = SyncExecutor()
+        patcher = mock.patch('base.thumbnails.get_executor', return_value=self.executor)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+        self.user = User.objects.create_user('ayse', password='parola123')
+        self.task = Task.objects.create(user=self.user, title='Rapor hazırla')
+        self.client = APIClient()
+        self.client.force_authenticate(self.user)
+
+    def upload(self, color=(255, 0, 0, 0), size=(300, 200)):
+        buffer = io.BytesIO()
+        Image.new('RGBA', size, color).save(buffer, 'PNG')
+        response = self.client.post(
+            f'/api/v1/tasks/{self.task.pk}/attachments/',
+            {'file': SimpleUploadedFile('resim.png', buffer.getvalue(), content_type='image/png')},
+            format='multipart',
+        )
+        self.assertEqual(response.status_code, 201)
+        return TaskAttachment.objects.get(pk=response.data['id'])
+
+    def generate(self):
+        output = io.StringIO()
+        call_command('generate_thumbnails', stdout=output)
+        return output.getvalue()
+
+    def test_upload_renders_all_sizes_on_commit(self):
+        with self.captureOnCommitCallbacks(execute=True):
+            attachment = self.upload()
+        for size in (128, 512):
+            self.assertTrue(os.path.isfile(thumbnail_path(attachment.content_hash, size)))
+
+        response = self.client.get(f'/api/v1/taskattachments/{attachment.pk}/thumbnail/128/')
+        self.assertEqual(response.status_code, 200)
+        with Image.open(io.BytesIO(b''.join(response.streaming_content))) as image:
+            self.assertEqual((image.format, image.mode, image.size), ('JPEG', 'RGB', (128, 85)))
+            # Saydam alanlar beyaz zemine oturtulur
+            self.assertTrue(all(channel > 245 for channel in image.getpixel((64, 42))))
+        # Küçük resim görüntüden büyük olamaz
+        with Image.open(thumbnail_path(attachment.content_hash, 512)) as image:
+            self.assertEqual(image.size, (300, 200))
+
+    def test_missing_thumbnail_is_rendered_on_request(self):
+        attachment = self.upload()
+        response = self.client.get(f'/api/v1/taskattachments/{attachment.pk}/thumbnail/512/')
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(len(self.executor.submitted), 1)
+
+    @override_settings(ATTACHMENT_THUMBNAILS={'MAX_PIXELS': 40_000})
+    def test_images_over_max_pixels_are_rejected(self):
+        # 60.000 piksel: Pillow'un yalnızca uyardığı sınır ile iki katı arasında
+        attachment = self.upload()
+        with self.assertLogs('base.thumbnails', 'WARNING'):
+            response = self.client.get(f'/api/v1/taskattachments/{attachment.pk}/thumbnail/128/')
+        self.assertEqual(response.status_code, 404)
+        self.assertFalse(os.path.exists(thumbnail_path(attachment.content_hash, 128)))
+
+    def test_generate_thumbnails_is_idempotent(self):
+        attachment = self.upload()
+        self.assertIn('1 görüntünün', self.generate())
+        paths = {size: thumbnail_path(attachment.content_hash, size) for size in (128, 512)}
+        mtimes = {size: os.path.getmtime(path) for size, path in paths.items()}
+
+        self.assertIn('0 görüntünün', self.generate())
+        self.assertEqual(len(self.executor.submitted), 1)
+
+        # Yalnızca eksik boyut yeniden üretilir
+        os.remove(paths[128])
+        self.generate()
+        self.assertEqual([size for size, _ in self.executor.submitted[-1][1]], [128])
+        self.assertTrue(os.path.isfile(paths[128]))
+        self.assertEqual(os.path.getmtime(paths[512]), mtimes[512])
+
+    def test_generate_thumbnails_skips_missing_blobs_without_waiting(self):
+        self.upload()
+        lost = self.upload(color=(0, 0, 255, 255))
+        os.remove(blob_path(lost.file_path))
+        with mock.patch('base.management.commands.generate_thumbnails.wait', wraps=wait) as waits:
+            output = self.generate()
+        self.assertIn('1 görüntünün', output)
+        # Kuyruk dolu değilken üretilecek bir şey olmayan ek çalışan işleri beklemez
+        self.assertNotIn(FIRST_COMPLETED, [call.kwargs.get('return_when') for call in waits.call_args_list])
+
+    def test_prune_removes_orphan_thumbnails(self):
+        with self.captureOnCommitCallbacks(execute=True):
+            kept = self.upload()
+            orphan = self.upload(color=(0, 0, 255, 255))
+        orphan_hash = orphan.content_hash
+        orphan.delete()
+
+        prune_orphan_blobs({kept.content_hash}, grace_seconds=-60)
+        for size in (128, 512):
+            self.assertFalse(os.path.exists(thumbnail_path(orphan_hash, size)))
+            self.assertTrue(os.path.isfile(thumbnail_path(kept.content_hash, size)))
+        self.assertTrue(os.path.isfile(blob_path(kept.file_path)))
+
+
+class LogArchiveTests(TestCase):
+    """Süresi dolan Log satırları aylık gzip JSONL dosyalarına yazılıp silinir"""
+
+    def setUp(self):
+        self.archive_dir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.archive_dir, ignore_errors=True)
+        self.user = User.objects.create_user('ayse', password='parola123')
+        self.now = timezone.now()
+        self.cutoff = self.now - timedelta(days=90)
+        self.old = [
+            Log.objects.create(
+                timestamp=self.cutoff - timedelta(days=days), user=self.user, ip_address='10.0.0.1',
+                action='Task Updated', details=f'Görev {days}', event_code=EventCode.TASK_UPDATED,
+                payload={'task_id': days, 'changes': {'status': ['pending', 'completed']}},
+            )
+            for days in (1, 40, 70)
+        ]
+        self.recent = Log.objects.create(timestamp=self.now, action='Task Created', details='Yeni görev')
+
+    def archived_rows(self):
+        return [row for path in sorted(glob.glob(os.path.join(self.archive_dir, '*.jsonl.gz'))) for row in read_archive(path)]
+
+    def test_archives_and_deletes_expired_rows(self):
+        result = archive_logs(self.cutoff, self.archive_dir, chunk_size=2, delete_batch_size=1)
+        self.assertEqual(result, {'archived': 3, 'deleted': 3})
+        self.assertEqual(list(Log.objects.values_list('pk', flat=True)), [self.recent.pk])
+        months = {f"log-{log.timestamp:%Y-%m}.jsonl.gz" for log in self.old}
+        self.assertEqual(set(os.listdir(self.archive_dir)), months)
+        self.assertEqual(sorted(row['id'] for row in self.archived_rows()), sorted(log.pk for log in self.old))
+
+    def test_archive_without_delete_keeps_rows(self):
+        result = archive_logs(self.cutoff, self.archive_dir, delete=False)
+        self.assertEqual(result, {'archived': 3, 'deleted': 0})
+        self.assertEqual(Log.objects.count(), 4)
+
+    def snapshot(self, logs):
+        return [
+            (log.pk, log.timestamp, log.level, log.log_type, log.user_id, log.ip_address,
+             log.action, log.details, log.event_code, log.payload)
+            for log in logs
+        ]
+
+    def test_restore_round_trip(self):
+        before = self.snapshot(Log.objects.filter(pk__in=[log.pk for log in self.old]).order_by('pk'))
+        archive_logs(self.cutoff, self.archive_dir)
+        paths = glob.glob(os.path.join(self.archive_dir, '*.jsonl.gz'))
+        self.assertEqual(restore_logs(paths), 3)
+        after = self.snapshot(Log.objects.exclude(pk=self.recent.pk).order_by('pk'))
+        self.assertEqual(after, before)
+        # Aynı arşivin yeniden yüklenmesi satır çoğaltmaz
+        restore_logs(paths)
+        self.assertEqual(Log.objects.count(), 4)
+
+    def test_restore_drops_deleted_users(self):
+        archive_logs(self.cutoff, self.archive_dir)
+        self.user.delete()
+        restore_logs(glob.glob(os.path.join(self.archive_dir, '*.jsonl.gz')))
+        restored = Log.objects.exclude(pk=self.recent.pk)
+        self.assertEqual(restored.count(), 3)
+        self.assertFalse(restored.filter(user__isnull=False).exists())
+        self.assertEqual(restored.first().event_code, EventCode.TASK_UPDATED)
+
+
+@override_settings(LOG_BUFFER={'ENABLED': False})
+class LogAdminTests(TestCase):
+    """Log admin: (timestamp, id) keyset sayfalama, tahmini sayım, kullanıcı filtresi ve tam metin arama"""
+    url = '/admin/base/log/'
+
+    def setUp(self):
+        self.admin = User.objects.create_superuser('yonetici', 'yonetici@example.com', 'parola123')
+        self.ayse = User.objects.create_user('ayse', password='parola123')
+        self.client.force_login(self.admin)
+        now = timezone.now()
+        # Üçerli gruplar aynı zaman damgasını paylaşır; sıra id ile ayrışmalı
+        for index in range(8):
+            Log.objects.create(
+                timestamp=now - timedelta(minutes=index // 3), user=self.ayse if index % 2 else None,
+                action='Task Updated', details=f'Görev {index} kaydedildi', ip_address='10.0.0.1',
+            )
+        Log.objects.create(timestamp=now - timedelta(hours=1), user=self.admin, action='Login', details='Oturum açıldı',
+                           ip_address='192.168.1.5')
+
+    def changelist(self, query=''):
+        response = self.client.get(f'{self.url}{query}')
+        self.assertEqual(response.status_code, 200)
+        return response.context['cl']
+
+    def walk(self, query='', per_page=3):
+        """İleri imleçlerle sonuna, sonra geri imleçlerle başa dön; sayfaları döndür"""
+        forward, backward = [], []
+        with mock.patch.object(LogAdmin, 'list_per_page', per_page):
+            cl = self.changelist(query)
+            forward.append([log.pk for log in cl.result_list])
+            while cl.next_url:
+                cl = self.changelist(cl.next_url)
+                forward.append([log.pk for log in cl.result_list])
+            while cl.previous_url:
+                cl = self.changelist(cl.previous_url)
+                backward.append([log.pk for log in cl.result_list])
+        return forward, backward
+
+    def test_keyset_pages_split_tied_timestamps(self):
+        expected = list(Log.objects.order_by('-timestamp', '-pk').values_list('pk', flat=True))
+        forward, backward = self.walk()
+        self.assertTrue(all(len(page) <= 3 for page in forward))
+        self.assertEqual([pk for page in forward for pk in page], expected)
+        # Geri sayfalar aynı sınırlarda kesilir
+        self.assertEqual(backward, forward[-2::-1])
+
+    def test_invalid_cursor_is_rejected(self):
+        response = self.client.get(f'{self.url}?cursor=x.1.2')
+        # Admin geçersiz parametrede hata sayfası yerine ?e=1 ile yönlendirir
+        self.assertEqual(response.status_code, 302)
+
+    def test_estimated_count_falls_back_to_bounded_count(self):
+        self.assertEqual(estimate_count(Log.objects.all()), (9, False))
+        self.assertEqual(estimate_count(Log.objects.all(), exact_limit=4), (4, True))
+        paginator = EstimatedCountPaginator(Log.objects.all(), 3)
+        self.assertEqual((paginator.count, paginator.count_is_estimate), (9, False))
+        self.assertEqual(self.changelist().result_count, 9)
+
+    def test_user_filter(self):
+        cl = self.changelist('?user__username=ayse')
+        self.assertEqual({log.user_id for log in cl.result_list}, {self.ayse.pk})
+        self.assertEqual(len(cl.result_list), 4)
+        self.assertEqual(self.changelist('?user__username=bilinmeyen').result_list, [])
+        response = self.client.get(f'{self.url}?user__username=ayse')
+        self.assertContains(response, 'value="ayse"')
+
+        # Filtre imleçli sayfalar boyunca korunur
+        forward, _ = self.walk('?user__username=ayse', per_page=3)
+        self.assertEqual(sorted(pk for page in forward for pk in page),
+                         sorted(Log.objects.filter(user=self.ayse).values_list('pk', flat=True)))
+
+    def test_search_keeps_username_and_ip_matches(self):
+        with mock.patch('base.admin.search_logs', wraps=search_logs) as fulltext:
+            text = self.changelist('?q=kaydedildi').result_list
+            by_username = self.changelist('?q=yonetici').result_list
+            by_ip = self.changelist('?q=192.168').result_list
+        self.assertEqual(fulltext.call_count, 3)
+        self.assertIsNotNone(search_logs(Log.objects.all(), 'kaydedildi'))
+        self.assertEqual(len(text), 8)
+        self.assertEqual([log.action for log in by_username], ['Login'])
+        self.assertEqual([log.ip_address for log in by_ip], ['192.168.1.5'])
+        # Tam metin yolunun kendisi bu eşleşmeleri bulamaz
+        self.assertFalse(search_logs(Log.objects.all(), 'yonetici').exists())
+
+
+def wait_until(condition, timeout=3.0):
+    deadline = time.monotonic() + timeout
+    while not condition():
+        if time.monotonic() > deadline:
+            return False
+        time.sleep(0.01)
+    return True
+
+
+class LogBufferTests(TestCase):
+    """Log tamponu: parti/aralıkla yazım, taşma politikaları, on_commit ve kapanışta son yazım"""
+
+    def entry(self, index=0):
+        return Log(action='Test', details=f'Kayıt {index}')
+
+    def idle_buffer(self, **options):
+        """Arka plan iş parçacığı başlatmayan tampon (kuyruk yalnızca elle boşaltılır)"""
+        buffer = LogBuffer(**options)
+        patcher = mock.patch.object(buffer, '_ensure_worker')
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        return buffer
+
+    def recording_buffer(self, **options):
+        """Yazımları veritabanı yerine listeye kaydeden, iş parçacıklı tampon"""
+        buffer = LogBuffer(**options)
+        batches = []
+        buffer._write = lambda batch: batches.append(len(batch))
+        self.addCleanup(buffer._stop_event.set)
+        return buffer, batches
+
+    def test_worker_writes_full_batches(self):
+        buffer, batches = self.recording_buffer(batch_size=3, flush_interval=0.5)
+        for index in range(7):
+            buffer.put(self.entry(index))
+        self.assertTrue(wait_until(lambda: sum(batches) == 7))
+        self.assertEqual(batches[0], 3)
+        self.assertTrue(all(size <= 3 for size in batches))
+
+    def test_worker_writes_partial_batch_after_interval(self):
+        buffer, batches = self.recording_buffer(batch_size=100, flush_interval=0.1)
+        buffer.put(self.entry())
+        self.assertTrue(wait_until(lambda: batches == [1]))
+
+    def test_drop_policy_discards_when_full(self):
+        buffer = self.idle_buffer(max_size=2, overflow_policy=LogBuffer.OVERFLOW_DROP)
+        self.assertEqual([buffer.put(self.entry(index)) for index in range(3)], [True, True, False])
+        self.assertEqual(buffer.stats()['dropped'], 1)
+        self.assertEqual(buffer.stats()['queued'], 2)
+
+    def test_block_policy_waits_for_space(self):
+        buffer = self.idle_buffer(max_size=1, overflow_policy=LogBuffer.OVERFLOW_BLOCK, block_timeout=0.1)
+        buffer.put(self.entry())
+        started = time.monotonic()
+        self.assertFalse(buffer.put(self.entry()))
+        self.assertGreaterEqual(time.monotonic() - started, 0.1)
+        self.assertEqual(buffer.stats()['dropped'], 1)
+
+        buffer.block_timeout = 2.0
+        threading.Timer(0.05, buffer._queue.get_nowait).start()
+        self.assertTrue(buffer.put(self.entry()))
+        self.assertEqual(buffer.stats()['dropped'], 1)
+
+    def test_enqueue_waits_for_commit(self):
+        buffer = self.idle_buffer()
+        with mock.patch('base.utils.get_log_buffer', return_value=buffer):
+            with self.captureOnCommitCallbacks(execute=True):
+                with transaction.atomic():
+                    LogManager.log_operation_event('INFO', 'Test', 'onaylanan')
+                self.assertEqual(buffer.stats()['queued'], 0)
+            self.assertEqual(buffer.stats()['queued'], 1)
+
+    def test_enqueue_is_discarded_on_rollback(self):
+        buffer = self.idle_buffer()
+        with mock.patch('base.utils.get_log_buffer', return_value=buffer):
+            with self.captureOnCommitCallbacks(execute=True) as callbacks:
+                try:
+                    with transaction.atomic():
+                        LogManager.log_operation_event('INFO', 'Test', 'geri alınan')
+                        raise RuntimeError('geri al')
+                except RuntimeError:
+                    pass
+        self.assertEqual(callbacks, [])
+        self.assertEqual(buffer.stats()['queued'], 0)
+
+    def test_stop_flushes_remaining_entries(self):
+        buffer = self.idle_buffer(batch_size=2)
+        for index in range(5):
+            buffer.put(self.entry(index))
+        buffer.stop()
+        self.assertEqual(Log.objects.filter(action='Test').count(), 5)
+        self.assertEqual(buffer.stats()['written'], 5)
+        # Durdurulduktan sonra gelen kayıtlar doğrudan yazılır
+        buffer.put(self.entry(5))
+        self.assertEqual(Log.objects.filter(action='Test').count(), 6)
+
+    def test_shutdown_drops_entries_when_database_changed(self):
+        buffer = self.idle_buffer()
+        buffer.put(self.entry())
+        with mock.patch('base.log_buffer.current_database', return_value='baska_veritabani'), \
+                mock.patch('base.log_buffer.connections.close_all'):
+            buffer.shutdown()
+        self.assertEqual(buffer.stats()['dropped'], 1)
+        self.assertFalse(Log.objects.filter(action='Test').exists())
+
+    def test_shutdown_never_raises(self):
+        buffer = self.idle_buffer()
+        buffer.put(self.entry())
+        with mock.patch.object(buffer, 'stop', side_effect=RuntimeError('bağlantı yok')), \
+                mock.patch('base.log_buffer.connections.close_all'), \
+                self.assertLogs('base.log_buffer', 'ERROR'):
+            buffer.shutdown()
+
+
+class FakeClock:
+    def __init__(self, now):
+        self.now = now
+
+    def __call__(self):
+        return self.now
+
+
+@override_settings(LOG_BUFFER={'ENABLED': False})
+class ApiAccessLogTests(TestCase):
+    """API erişim logu: ham kayıt (varsayılan), pencere bazında sayma, örnekleme ve arka plan yazımı"""
+
+    def setUp(self):
+        self.user = User.objects.create_user('ayse', password='parola123')
+        self.clock = FakeClock(1_000_020.0)
+        self.written = []
+
+    def aggregator(self, write=None, sample_rate=0.0):
+        aggregator = ApiAccessAggregator(write or (lambda *args: self.written.append(args)),
+                                         window_seconds=60, sample_rate=sample_rate, clock=self.clock)
+        patcher = mock.patch.object(aggregator, '_ensure_worker')
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        return aggregator
+
+    def test_raw_mode_writes_a_row_per_request(self):
+        for _ in range(2):
+            OperationLogger.log_api_access(self.user, 'Task List', 'GET', '10.0.0.1')
+        self.assertEqual(Log.objects.filter(event_code=EventCode.API_ACCESS).count(), 2)
+
+    def test_counts_are_bucketed_by_window(self):
+        aggregator = self.aggregator()
+        aggregator.record(self.user, 'Task List', 'GET', '10.0.0.1')
+        aggregator.record(self.user, 'Task List', 'GET', '10.0.0.2')
+        aggregator.record(self.user, 'Task List', 'POST', '10.0.0.1')
+        self.clock.now += 60
+        aggregator.record(self.user, 'Task List', 'GET', '10.0.0.1')
+
+        # Yalnızca kapanmış pencere yazılır
+        self.assertEqual(aggregator.flush(), 2)
+        window = 1_000_020 // 60 * 60
+        self.assertEqual(
+            sorted((endpoint, method, ip, start, count) for _, endpoint, method, ip, start, _, count in self.written),
+            [('Task List', 'GET', '10.0.0.2', window, 2), ('Task List', 'POST', '10.0.0.1', window, 1)],
+        )
+        self.assertEqual(aggregator.flush(), 0)
+        self.assertEqual(aggregator.flush(force=True), 1)
+        self.assertEqual(self.written[-1][4], window + 60)
+
+    def test_sampling(self):
+        self.assertFalse(self.aggregator(sample_rate=0.0).record(self.user, 'Task List', 'GET', '10.0.0.1'))
+        self.assertTrue(self.aggregator(sample_rate=1.0).record(self.user, 'Task List', 'GET', '10.0.0.1'))
+
+    def test_aggregate_mode_writes_one_row_per_window(self):
+        aggregator = self.aggregator(write=_write_api_access_aggregate)
+        with mock.patch('base.utils.get_api_access_aggregator', return_value=aggregator):
+            for _ in range(3):
+                OperationLogger.log_api_access(self.user, 'Task List', 'GET', '10.0.0.1')
+        self.assertFalse(Log.objects.filter(event_code=EventCode.API_ACCESS).exists())
+        aggregator.flush(force=True)
+        row = Log.objects.get(event_code=EventCode.API_ACCESS_AGGREGATE)
+        self.assertEqual((row.user, row.payload['count'], row.payload['method']), (self.user, 3, 'GET'))
+
+    def test_sampled_request_also_writes_a_raw_row(self):
+        aggregator = self.aggregator(sample_rate=1.0)
+        with mock.patch('base.utils.get_api_access_aggregator', return_value=aggregator):
+            OperationLogger.log_api_access(self.user, 'Task List', 'GET', '10.0.0.1')
+        row = Log.objects.get(event_code=EventCode.API_ACCESS)
+        self.assertTrue(row.payload['sampled'])
+
+    def test_worker_flush_recycles_connections(self):
+        aggregator = self.aggregator()
+        aggregator.record(self.user, 'Task List', 'GET', '10.0.0.1')
+        self.clock.now += 60
+        with mock.patch('base.access_log.close_old_connections') as close_old_connections:
+            aggregator.flush_in_worker()
+        self.assertEqual(close_old_connections.call_count, 2)
+        self.assertEqual(len(self.written), 1)
+
+
+class LogPartitionIndexTests(TestCase):
+    """Bölümlemeye dönüştürülen Log tablosunda tüm indeksler üst tabloda yeniden oluşturulur"""
+
+    def test_every_log_index_is_recreated(self):
+        cursor = mock.Mock()
+        # SQL yalnızca üretilir; çalıştırılmaz (sahte imleç)
+        editor = contextlib.nullcontext(connection.SchemaEditorClass(connection, atomic=False))
+        with mock.patch.object(connection, 'schema_editor', return_value=editor):
+            create_log_indexes(cursor)
+        statements = [call.args[0] for call in cursor.execute.call_args_list]
+        for name in log_index_names():
+            with self.subTest(index=name):
+                self.assertTrue(any(f'"{name}"' in str(statement) for statement in statements))
+        self.assertIn('log_payload_gin_idx', log_index_names())
+
+
+@override_settings(TASK_LIST_CACHE={'ENABLED': False})
+class FastListParityTests(TestCase):
+    """.values() hızlı yolu aynı sorgu için DRF serializer'ıyla birebir aynı JSON'u üretir"""
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = User.objects.create_user('ayse', password='parola123')
+        ghost = User.objects.create_user('silinen', password='parola123')
+        cls.task = Task.objects.create(
+            user=cls.user, title='Rapor hazırla', description='Çeyrek raporu', status='in_progress',
+            priority='high', due_date=timezone.localdate() + timedelta(days=3),
+        )
+        blocker = Task.objects.create(user=cls.user, title='Veri topla')
+        TaskDependence.objects.create(task=blocker, dependent_task=cls.task)
+        Task.objects.create(user=cls.user, title='Boş alanlı görev')
+        TaskComment.objects.create(task=cls.task, user=cls.user, comment='İlk yorum')
+        TaskComment.objects.create(task=cls.task, user=ghost, comment='Yazarı silinecek')
+        ghost.delete()
+        TaskAttachment.objects.create(task=cls.task, file_name='rapor.pdf', file_path='ab/rapor', content_hash='ab' * 32,
+                                      size=10, content_type='application/pdf')
+
+    def setUp(self):
+        self.client = APIClient()
+        self.client.force_authenticate(self.user)
+
+    def assertSameOutput(self, view, url):
+        with mock.patch.object(ValuesSerializer, 'represent', autospec=True, side_effect=ValuesSerializer.represent) as fast:
+            fast_response = self.client.get(url)
+        with mock.patch.object(view, 'fast_list', False):
+            drf_response = self.client.get(url)
+        self.assertEqual(fast_response.status_code, 200)
+        self.assertEqual(json.loads(fast_response.content), json.loads(drf_response.content))
+        return fast.called
+
+    def test_task_list(self):
+        for url in ['/api/v1/tasks/', '/api/v1/tasks/?ordering=due_date', '/api/v1/tasks/?fields=id,title,is_blocked']:
+            with self.subTest(url=url):
+                self.assertTrue(self.assertSameOutput(TaskListCreateAPI, url))
+
+    def test_task_comments_with_deleted_author(self):
+        self.assertTrue(self.assertSameOutput(TaskCommentsAPI, f'/api/v1/tasks/{self.task.pk}/comments/'))
+
+    def test_task_attachments(self):
+        # previews alanı hızlı yolu kapatır; çıktı yine aynı olmalı
+        self.assertSameOutput(TaskAttachmentsAPI, f'/api/v1/tasks/{self.task.pk}/attachments/')
+
+    def test_select_columns_are_unique(self):
+        reader = ValuesSerializer(TaskListSerializer(), extra_columns=['id', 'updated_at', 'updated_at', 'due_date'],
+                                  annotations=('is_blocked', 'blocking_count'))
+        self.assertEqual(len(reader.columns), len(set(reader.columns)))
@@ -0,0 +1,41 @@
+"""Küçük resim üretimi: süreç havuzu işçilerinde çalışır.
+
+spawn ile başlayan işçiler bu modülü içe aktarır; Django ayarlarına veya
+uygulama kayıt defterine ihtiyaç duymaması için bağımlılığı yalnızca Pillow'dur.
+"""
+import os
+import warnings
+
+from PIL import Image, ImageOps
+
+
+def render_thumbnails(source, targets, max_pixels, quality):
+    """[(boyut, hedef yol)] için küçük resimleri üret. Süreç havuzunda çalışır.
+
+    Görüntü bir kez çözülür (JPEG'de draft ile doğrudan küçültülmüş olarak),
+    boyutlar büyükten küçüğe aynı görüntü üzerinden küçültülür.
+    """
+    Image.MAX_IMAGE_PIXELS = max_pixels
+    targets = sorted(targets, reverse=True)
+    with warnings.catch_warnings():
+        # Pillow sınırın iki katına kadar yalnızca uyarır; sınırı aşan her görüntü reddedilir
+        warnings.simplefilter('error', Image.DecompressionBombWarning)
+        image = Image.open(source)
+    with image:
+        image.draft('RGB', (targets[0][0], targets[0][0]))
+        image = ImageOps.exif_transpose(image)
+        if image.mode in ('RGBA', 'LA', 'PA', 'P'):
+            # Saydam alanlar beyaz zemine oturtulur
+            image = image.convert('RGBA')
+            background = Image.new('RGB', image.size, 'white')
+            background.paste(image, mask=image.getchannel('A'))
+            image = background
+        elif image.mode not in ('RGB', 'L'):
+            image = image.convert('RGB')
+        for size, target in targets:
+            image.thumbnail((size, size), Image.LANCZOS)
+            os.makedirs(os.path.dirname(target), exist_ok=True)
+            temporary = f'{target}.{os.getpid()}.tmp'
+            image.save(temporary, 'JPEG', quality=quality, optimize=True)
+            os.replace(temporary, target)
+    return [size for size, _ in targets]
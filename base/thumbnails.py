@@ -0,0 +1,174 @@
+import logging
+import mimetypes
+import multiprocessing
+import os
+import threading
+from concurrent.futures import ProcessPoolExecutor, TimeoutError as FutureTimeoutError
+from functools import partial
+
+from django.conf import settings
+from django.db import transaction
+from django.http import FileResponse, HttpResponse
+from django.utils.http import quote_etag
+
+from .attachments import blob_path, get_attachment_config
+from .conditional import parse_etags
+from .thumbnail_worker import render_thumbnails
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_ATTACHMENT_THUMBNAILS = {
+    # Üretilen küçük resimlerin en uzun kenarı (piksel)
+    'SIZES': (128, 512),
+    # Görüntü işleme süreç havuzunun boyutu
+    'WORKERS': 2,
+    # Havuzda bekleyebilecek en fazla iş; dolarsa yeni işler ilk istekte üretilir
+    'QUEUE_SIZE': 64,
+    # Bundan büyük görüntüler açılmaz (decompression bomb koruması)
+    'MAX_PIXELS': 50_000_000,
+    'QUALITY': 85,
+    # Eksik küçük resim isteğinde havuzdaki üretim en fazla bu kadar beklenir (sn)
+    'RENDER_TIMEOUT': 10,
+    # İçerik özetiyle sürümlendiği için yanıtlar değişmez sayılır
+    'CACHE_SECONDS': 365 * 24 * 3600,
+}
+
+IMAGE_TYPES = {'image/jpeg', 'image/png', 'image/gif', 'image/webp', 'image/bmp', 'image/tiff'}
+
+_executor = None
+_pending = {}
+_lock = threading.Lock()
+
+
+def get_thumbnail_config():
+    """settings.ATTACHMENT_THUMBNAILS ayarlarını varsayılanlarla birleştir"""
+    config = dict(DEFAULT_ATTACHMENT_THUMBNAILS)
+    config.update(getattr(settings, 'ATTACHMENT_THUMBNAILS', {}))
+    return config
+
+
+def is_image(attachment):
+    content_type = attachment.content_type or mimetypes.guess_type(attachment.file_name)[0]
+    return bool(attachment.content_hash) and content_type in IMAGE_TYPES
+
+
+def thumbnail_path(content_hash, size):
+    """ROOT/thumbnails/<boyut>/ab/<özet>.jpg — aynı içerikli ekler küçük resmi paylaşır"""
+    root = get_attachment_config()['ROOT']
+    return os.path.join(root, 'thumbnails', str(size), content_hash[:2], f'{content_hash}.jpg')
+
+
+def get_executor():
+    """Süreç havuzunu ilk kullanımda oluştur.
+
+    Web sunucusu süreci iş parçacıklı olabileceğinden fork yerine spawn kullanılır;
+    işçiler yalnızca Django'dan bağımsız base.thumbnail_worker modülünü yükler.
+    """
+    global _executor
+    with _lock:
+        if _executor is None:
+            _executor = ProcessPoolExecutor(
+                max_workers=get_thumbnail_config()['WORKERS'], mp_context=multiprocessing.get_context('spawn'),
+            )
+        return _executor
+
+
+def missing_thumbnails(content_hash, sizes):
+    targets = [(size, thumbnail_path(content_hash, size)) for size in sizes]
+    return [(size, path) for size, path in targets if not os.path.isfile(path)]
+
+
+def schedule_thumbnails(attachment):
+    """Eksik küçük resimleri havuza gönder ve Future döndür.
+
+    Aynı içerik için bekleyen iş varsa o döner. Yapılacak iş yoksa, kaynak
+    blob yoksa veya kuyruk doluysa None.
+    """
+    config = get_thumbnail_config()
+    content_hash = attachment.content_hash
+    source = blob_path(attachment.file_path)
+    targets = missing_thumbnails(content_hash, config['SIZES'])
+    if not targets or not os.path.isfile(source):
+        return None
+    with _lock:
+        future = _pending.get(content_hash)
+        if future is not None:
+            return future
+        if active_jobs() >= config['QUEUE_SIZE']:
+            return None
+    executor = get_executor()
+    with _lock:
+        future = _pending.get(content_hash)
+        if future is not None:
+            return future
+        future = executor.submit(render_thumbnails, source, targets, config['MAX_PIXELS'], config['QUALITY'])
+        _pending[content_hash] = future
+    # İş zaten bittiyse geri çağırma hemen bu iş parçacığında çalışır; kilit dışında eklenir
+    future.add_done_callback(partial(thumbnails_done, content_hash))
+    return future
+
+
+def active_jobs():
+    """Havuzda bekleyen veya çalışan iş sayısı; _lock tutulurken çağrılır.
+
+    Biten işin geri çağırması bekleyenlere haber verildikten sonra çalıştığından
+    _pending'de kısa süre bitmiş işler de bulunabilir, bunlar sayılmaz.
+    """
+    return sum(1 for future in _pending.values() if not future.done())
+
+
+def queue_full():
+    with _lock:
+        return active_jobs() >= get_thumbnail_config()['QUEUE_SIZE']
+
+
+def thumbnails_done(content_hash, future):
+    with _lock:
+        _pending.pop(content_hash, None)
+    if not future.cancelled() and future.exception() is not None:
+        logger.warning(f"Küçük resim üretilemedi ({content_hash}): {future.exception()}")
+
+
+def attachment_saved(sender, instance, **kwargs):
+    """post_save: görüntü eklerinin küçük resimlerini işlem onaylanınca arka planda üret"""
+    if is_image(instance):
+        transaction.on_commit(partial(schedule_thumbnails, instance))
+
+
+def thumbnail_response(request, attachment, size):
+    """Küçük resim yanıtı. Henüz üretilmemişse havuzda üretilmesi beklenir;
+    süre aşılır veya kuyruk doluysa 503. Görüntü okunamıyorsa None."""
+    config = get_thumbnail_config()
+    path = thumbnail_path(attachment.content_hash, size)
+    etag = quote_etag(f'{attachment.content_hash}-{size}')
+    if etag in parse_etags(request.META.get('HTTP_IF_NONE_MATCH', '')):
+        response = HttpResponse(status=304)
+    else:
+        ready = os.path.isfile(path) or wait_for_thumbnail(attachment, path, config['RENDER_TIMEOUT'])
+        if ready is None:
+            return None
+        if not ready:
+            response = HttpResponse(status=503)
+            response['Retry-After'] = 1
+            return response
+        response = FileResponse(open(path, 'rb'), content_type='image/jpeg')
+    response['ETag'] = etag
+    response['Cache-Control'] = f"private, max-age={config['CACHE_SECONDS']}, immutable"
+    return response
+
+
+def wait_for_thumbnail(attachment, path, timeout):
+    """Üretildiyse True; havuz meşgulse veya süre aşıldıysa False; görüntü okunamıyorsa None"""
+    if not os.path.isfile(blob_path(attachment.file_path)):
+        return None
+    future = schedule_thumbnails(attachment)
+    if future is None:
+        # Kuyruk dolu ya da başka bir iş az önce bitirdi
+        return os.path.isfile(path)
+    try:
+        future.result(timeout=timeout)
+    except FutureTimeoutError:
+        return False
+    except Exception:
+        return None
+    return os.path.isfile(path)
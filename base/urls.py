@@ -1,19 +1,22 @@
 from django.urls import path, include
 from .views import (
-    TaskListCreateAPI, TaskDetailAPI, TaskToggleCompleteView,
+    TaskListCreateAPI, TaskDetailAPI, TaskToggleCompleteView, TaskBatchAPI, TaskChangesAPI, TaskSearchAPI, TaskStatsAPI, TaskBulkToggleAPI,
     UserProfileListCreateAPI, UserProfileDetailAPI,
     TeamListCreateAPI, TeamDetailAPI,
-    TaskCommentListCreateAPI, TaskCommentDetailAPI,
-    TaskAttachmentListCreateAPI, TaskAttachmentDetailAPI,
+    TaskCommentListCreateAPI, TaskCommentDetailAPI, TaskCommentsAPI,
+    TaskAttachmentListCreateAPI, TaskAttachmentDetailAPI, TaskAttachmentDownloadAPI, TaskAttachmentThumbnailAPI, TaskAttachmentsAPI,
     TaskPriorityListCreateAPI, TaskPriorityDetailAPI,
     TaskScheduleListCreateAPI, TaskScheduleDetailAPI,
-    TaskRecurrenceListCreateAPI, TaskRecurrenceDetailAPI,
+    TaskRecurrenceListCreateAPI, TaskRecurrenceDetailAPI, TaskRecurrenceOccurrencesAPI,
     TaskDependenceListCreateAPI, TaskDependenceDetailAPI,
+    TaskGraphOrderAPI, TaskCriticalPathAPI, TaskDependencyTreeAPI, CalendarAPI,
     HistoryListCreateAPI, HistoryDetailAPI,
     TaskReportListCreateAPI, TaskReportDetailAPI,
     UserTeamsListCreateAPI, UserTeamsDetailAPI,
     RegisterAPIView,
+    LogEventStatsAPI, LogFieldChangeStatsAPI, TaskListCacheStatsAPI,
 )
+from .pagination import LEGACY_API_KWARG
 from rest_framework_simplejwt.views import (
     TokenObtainPairView,
     TokenRefreshView,
@@ -24,7 +27,20 @@ from rest_framework_simplejwt.views import (
 api_v1_patterns = [
     path('tasks/', TaskListCreateAPI.as_view(), name='api-task-list-create'),
     path('tasks/<int:pk>/', TaskDetailAPI.as_view(), name='api-task-detail'),
+    path('tasks/toggle/', TaskBulkToggleAPI.as_view(), name='api-task-bulk-toggle'),
+    path('tasks/stats/', TaskStatsAPI.as_view(), name='api-task-stats'),
+    path('tasks/search/', TaskSearchAPI.as_view(), name='api-task-search'),
+    path('tasks/batch/', TaskBatchAPI.as_view(), name='api-task-batch'),
+    path('tasks/changes/', TaskChangesAPI.as_view(), name='api-task-changes'),
+    path('tasks/cache/stats/', TaskListCacheStatsAPI.as_view(), name='api-task-cache-stats'),
     path('tasks/<int:pk>/toggle/', TaskToggleCompleteView.as_view(), name='api-task-toggle'),
+    path('tasks/<int:pk>/blocked-by/', TaskDependencyTreeAPI.as_view(), name='api-task-blocked-by'),
+    path('tasks/<int:pk>/blocks/', TaskDependencyTreeAPI.as_view(downstream=True), name='api-task-blocks'),
+    path('tasks/<int:task_pk>/comments/', TaskCommentsAPI.as_view(), name='api-task-comments'),
+    path('tasks/<int:task_pk>/attachments/', TaskAttachmentsAPI.as_view(), name='api-task-attachments'),
+    path('tasks/graph/order/', TaskGraphOrderAPI.as_view(), name='api-task-graph-order'),
+    path('tasks/graph/critical-path/', TaskCriticalPathAPI.as_view(), name='api-task-critical-path'),
+    path('calendar/', CalendarAPI.as_view(), name='api-calendar'),
 
     path('userprofiles/', UserProfileListCreateAPI.as_view(), name='api-userprofile-list-create'),
     path('userprofiles/<int:pk>/', UserProfileDetailAPI.as_view(), name='api-userprofile-detail'),
@@ -37,6 +53,8 @@ api_v1_patterns = [
 
     path('taskattachments/', TaskAttachmentListCreateAPI.as_view(), name='api-taskattachment-list-create'),
     path('taskattachments/<int:pk>/', TaskAttachmentDetailAPI.as_view(), name='api-taskattachment-detail'),
+    path('taskattachments/<int:pk>/download/', TaskAttachmentDownloadAPI.as_view(), name='api-taskattachment-download'),
+    path('taskattachments/<int:pk>/thumbnail/<int:size>/', TaskAttachmentThumbnailAPI.as_view(), name='api-taskattachment-thumbnail'),
 
     path('taskpriorities/', TaskPriorityListCreateAPI.as_view(), name='api-taskpriority-list-create'),
     path('taskpriorities/<int:pk>/', TaskPriorityDetailAPI.as_view(), name='api-taskpriority-detail'),
@@ -46,6 +64,7 @@ api_v1_patterns = [
 
     path('taskrecurrences/', TaskRecurrenceListCreateAPI.as_view(), name='api-taskrecurrence-list-create'),
     path('taskrecurrences/<int:pk>/', TaskRecurrenceDetailAPI.as_view(), name='api-taskrecurrence-detail'),
+    path('taskrecurrences/<int:pk>/occurrences/', TaskRecurrenceOccurrencesAPI.as_view(), name='api-taskrecurrence-occurrences'),
 
     path('taskdependences/', TaskDependenceListCreateAPI.as_view(), name='api-taskdependence-list-create'),
     path('taskdependences/<int:pk>/', TaskDependenceDetailAPI.as_view(), name='api-taskdependence-detail'),
@@ -60,48 +79,54 @@ api_v1_patterns = [
     path('userteams/<int:pk>/', UserTeamsDetailAPI.as_view(), name='api-userteams-detail'),
 
     path('register/', RegisterAPIView.as_view(), name='api-register'),
+
+    path('logs/stats/events/', LogEventStatsAPI.as_view(), name='api-log-stats-events'),
+    path('logs/stats/changed-fields/', LogFieldChangeStatsAPI.as_view(), name='api-log-stats-changed-fields'),
 ]
 
+# Eski liste rotaları istemci açıkça istemedikçe sayfalanmaz (?paginate=1, cursor veya page_size)
+LEGACY = {LEGACY_API_KWARG: True}
+
 urlpatterns = [
     # REST API endpoints with versioning
     path('api/v1/', include(api_v1_patterns)),
     
     # Legacy API endpoints (for backward compatibility)
-    path('api/tasks/', TaskListCreateAPI.as_view(), name='api-task-list-create-legacy'),
+    path('api/tasks/', TaskListCreateAPI.as_view(), LEGACY, name='api-task-list-create-legacy'),
     path('api/tasks/<int:pk>/', TaskDetailAPI.as_view(), name='api-task-detail-legacy'),
     path('api/tasks/<int:pk>/toggle/', TaskToggleCompleteView.as_view(), name='api-task-toggle-legacy'),
 
-    path('api/userprofiles/', UserProfileListCreateAPI.as_view(), name='api-userprofile-list-create-legacy'),
+    path('api/userprofiles/', UserProfileListCreateAPI.as_view(), LEGACY, name='api-userprofile-list-create-legacy'),
     path('api/userprofiles/<int:pk>/', UserProfileDetailAPI.as_view(), name='api-userprofile-detail-legacy'),
 
-    path('api/teams/', TeamListCreateAPI.as_view(), name='api-team-list-create-legacy'),
+    path('api/teams/', TeamListCreateAPI.as_view(), LEGACY, name='api-team-list-create-legacy'),
     path('api/teams/<int:pk>/', TeamDetailAPI.as_view(), name='api-team-detail-legacy'),
 
-    path('api/taskcomments/', TaskCommentListCreateAPI.as_view(), name='api-taskcomment-list-create-legacy'),
+    path('api/taskcomments/', TaskCommentListCreateAPI.as_view(), LEGACY, name='api-taskcomment-list-create-legacy'),
     path('api/taskcomments/<int:pk>/', TaskCommentDetailAPI.as_view(), name='api-taskcomment-detail-legacy'),
 
-    path('api/taskattachments/', TaskAttachmentListCreateAPI.as_view(), name='api-taskattachment-list-create-legacy'),
+    path('api/taskattachments/', TaskAttachmentListCreateAPI.as_view(), LEGACY, name='api-taskattachment-list-create-legacy'),
     path('api/taskattachments/<int:pk>/', TaskAttachmentDetailAPI.as_view(), name='api-taskattachment-detail-legacy'),
 
-    path('api/taskpriorities/', TaskPriorityListCreateAPI.as_view(), name='api-taskpriority-list-create-legacy'),
+    path('api/taskpriorities/', TaskPriorityListCreateAPI.as_view(), LEGACY, name='api-taskpriority-list-create-legacy'),
     path('api/taskpriorities/<int:pk>/', TaskPriorityDetailAPI.as_view(), name='api-taskpriority-detail-legacy'),
 
-    path('api/taskschedules/', TaskScheduleListCreateAPI.as_view(), name='api-taskschedule-list-create-legacy'),
+    path('api/taskschedules/', TaskScheduleListCreateAPI.as_view(), LEGACY, name='api-taskschedule-list-create-legacy'),
     path('api/taskschedules/<int:pk>/', TaskScheduleDetailAPI.as_view(), name='api-taskschedule-detail-legacy'),
 
-    path('api/taskrecurrences/', TaskRecurrenceListCreateAPI.as_view(), name='api-taskrecurrence-list-create-legacy'),
+    path('api/taskrecurrences/', TaskRecurrenceListCreateAPI.as_view(), LEGACY, name='api-taskrecurrence-list-create-legacy'),
     path('api/taskrecurrences/<int:pk>/', TaskRecurrenceDetailAPI.as_view(), name='api-taskrecurrence-detail-legacy'),
 
-    path('api/taskdependences/', TaskDependenceListCreateAPI.as_view(), name='api-taskdependence-list-create-legacy'),
+    path('api/taskdependences/', TaskDependenceListCreateAPI.as_view(), LEGACY, name='api-taskdependence-list-create-legacy'),
     path('api/taskdependences/<int:pk>/', TaskDependenceDetailAPI.as_view(), name='api-taskdependence-detail-legacy'),
 
-    path('api/histories/', HistoryListCreateAPI.as_view(), name='api-history-list-create-legacy'),
+    path('api/histories/', HistoryListCreateAPI.as_view(), LEGACY, name='api-history-list-create-legacy'),
     path('api/histories/<int:pk>/', HistoryDetailAPI.as_view(), name='api-history-detail-legacy'),
 
-    path('api/taskreports/', TaskReportListCreateAPI.as_view(), name='api-taskreport-list-create-legacy'),
+    path('api/taskreports/', TaskReportListCreateAPI.as_view(), LEGACY, name='api-taskreport-list-create-legacy'),
     path('api/taskreports/<int:pk>/', TaskReportDetailAPI.as_view(), name='api-taskreport-detail-legacy'),
 
-    path('api/userteams/', UserTeamsListCreateAPI.as_view(), name='api-userteams-list-create-legacy'),
+    path('api/userteams/', UserTeamsListCreateAPI.as_view(), LEGACY, name='api-userteams-list-create-legacy'),
     path('api/userteams/<int:pk>/', UserTeamsDetailAPI.as_view(), name='api-userteams-detail-legacy'),
 
     # JWT Token endpoints
@@ -1,6 +1,11 @@
 from .models import Log
+from .log_buffer import get_log_buffer
+from .access_log import create_api_access_aggregator, get_api_access_log_config
 from django.contrib.auth.models import User
+from django.db import transaction
+from datetime import datetime, timezone as dt_timezone
 import logging
+import threading
 
 logger = logging.getLogger(__name__)
 
@@ -8,17 +13,39 @@ class LogManager:
     """Logging işlemleri için merkezi yönetici sınıf"""
     
     @staticmethod
-    def log_security_event(level, action, details, user=None, ip_address=None):
+    def _save(level, log_type, action, details, user=None, ip_address=None, event_code='', payload=None, timestamp=None):
+        """Log kaydını tampon etkinse kuyruğa ekle, değilse doğrudan yaz"""
+        entry = Log(
+            level=level,
+            log_type=log_type,
+            user=user,
+            ip_address=ip_address,
+            action=action,
+            details=details,
+            event_code=event_code,
+            payload=payload or {}
+        )
+        if timestamp is not None:
+            entry.timestamp = timestamp
+        log_buffer = get_log_buffer()
+        if log_buffer is None:
+            entry.save()
+        elif transaction.get_connection().in_atomic_block:
+            # Açık bir işlem içindeyse kayıt yalnızca işlem başarıyla biterse kuyruğa girer
+            transaction.on_commit(lambda: LogManager._enqueue(log_buffer, entry))
+        else:
+            LogManager._enqueue(log_buffer, entry)
+
+    @staticmethod
+    def _enqueue(log_buffer, entry):
+        if not log_buffer.put(entry):
+            logger.warning(f"Log tamponu dolu, kayıt atlandı: {entry.action}")
+    
+    @staticmethod
+    def log_security_event(level, action, details, user=None, ip_address=None, event_code='', payload=None):
         """Güvenlik olaylarını kaydet"""
         try:
-            Log.objects.create(
-                level=level,
-                log_type='SECURITY',
-                user=user,
-                ip_address=ip_address,
-                action=action,
-                details=details
-            )
+            LogManager._save(level, 'SECURITY', action, details, user, ip_address, event_code, payload)
             # Django logger'a da yaz
             if level == 'ERROR':
                 logger.error(f"SECURITY ERROR: {action} - {details}")
@@ -30,17 +57,10 @@ class LogManager:
             logger.error(f"Log kayıt hatası: {e}")
     
     @staticmethod
-    def log_operation_event(level, action, details, user=None, ip_address=None):
+    def log_operation_event(level, action, details, user=None, ip_address=None, event_code='', payload=None):
         """İşlem olaylarını kaydet"""
         try:
-            Log.objects.create(
-                level=level,
-                log_type='OPERATION',
-                user=user,
-                ip_address=ip_address,
-                action=action,
-                details=details
-            )
+            LogManager._save(level, 'OPERATION', action, details, user, ip_address, event_code, payload)
             # Django logger'a da yaz
             if level == 'ERROR':
                 logger.error(f"OPERATION ERROR: {action} - {details}")
@@ -52,22 +72,76 @@ class LogManager:
             logger.error(f"Log kayıt hatası: {e}")
     
     @staticmethod
-    def log_error_event(level, action, details, user=None, ip_address=None):
+    def log_error_event(level, action, details, user=None, ip_address=None, event_code='', payload=None):
         """Hata olaylarını kaydet"""
         try:
-            Log.objects.create(
-                level=level,
-                log_type='ERROR',
-                user=user,
-                ip_address=ip_address,
-                action=action,
-                details=details
-            )
+            LogManager._save(level, 'ERROR', action, details, user, ip_address, event_code, payload)
             # Django logger'a da yaz
             logger.error(f"SYSTEM ERROR: {action} - {details}")
         except Exception as e:
             logger.error(f"Log kayıt hatası: {e}")
 
+class EventCode:
+    """Log.event_code değerleri"""
+    LOGIN_SUCCESS = 'login_success'
+    LOGIN_FAILURE = 'login_failure'
+    LOGOUT = 'logout'
+    UNAUTHORIZED_ACCESS = 'unauthorized_access'
+    TASK_CREATED = 'task_created'
+    TASK_UPDATED = 'task_updated'
+    TASK_DELETED = 'task_deleted'
+    TASK_BATCH = 'task_batch'
+    API_ACCESS = 'api_access'
+    API_ACCESS_AGGREGATE = 'api_access_aggregate'
+    VALIDATION_ERROR = 'validation_error'
+    DATABASE_ERROR = 'database_error'
+    SYSTEM_ERROR = 'system_error'
+
+def format_changes(changes):
+    """{alan: (eski, yeni)} sözlüğünü okunabilir metne çevir"""
+    if not changes:
+        return "Değişiklik yok"
+    return ", ".join(f"{key}: '{old}' → '{new}'" for key, (old, new) in changes.items())
+
+def _write_api_access_aggregate(user, endpoint, method, ip_address, window_start, window_seconds, count):
+    """Bir zaman penceresindeki API erişimlerini tek Log kaydı olarak yaz"""
+    try:
+        started_at = datetime.fromtimestamp(window_start, tz=dt_timezone.utc)
+        LogManager._save(
+            'INFO',
+            'OPERATION',
+            'API Erişimi (Toplu)',
+            f"Kullanıcı '{user.username if user else 'Anonim'}' {method} {endpoint} endpoint'ine "
+            f"{started_at:%Y-%m-%d %H:%M:%S} itibarıyla {window_seconds} saniyede {count} kez erişti",
+            user,
+            ip_address,
+            EventCode.API_ACCESS_AGGREGATE,
+            {
+                'endpoint': endpoint,
+                'method': method,
+                'window_start': started_at.isoformat(),
+                'window_seconds': window_seconds,
+                'count': count,
+            },
+            timestamp=started_at
+        )
+    except Exception as e:
+        logger.error(f"Log kayıt hatası: {e}")
+
+_api_access_aggregator = None
+_api_access_aggregator_lock = threading.Lock()
+
+def get_api_access_aggregator():
+    """API_ACCESS_LOG 'aggregate' modundaysa süreç genelindeki toplayıcıyı döndür"""
+    global _api_access_aggregator
+    if get_api_access_log_config()['MODE'] != 'aggregate':
+        return None
+    if _api_access_aggregator is None:
+        with _api_access_aggregator_lock:
+            if _api_access_aggregator is None:
+                _api_access_aggregator = create_api_access_aggregator(_write_api_access_aggregate)
+    return _api_access_aggregator
+
 class SecurityLogger:
     """Güvenlik olayları için özel logger"""
     
@@ -79,7 +153,9 @@ class SecurityLogger:
             'Başarılı Giriş',
             f"Kullanıcı '{user.username}' başarıyla giriş yaptı",
             user,
-            ip_address
+            ip_address,
+            EventCode.LOGIN_SUCCESS,
+            {'username': user.username}
         )
     
     @staticmethod
@@ -90,7 +166,9 @@ class SecurityLogger:
             'Başarısız Giriş Denemesi',
             f"Kullanıcı '{username}' giriş yapamadı. Sebep: {reason}",
             None,
-            ip_address
+            ip_address,
+            EventCode.LOGIN_FAILURE,
+            {'username': username, 'reason': reason}
         )
     
     @staticmethod
@@ -101,7 +179,9 @@ class SecurityLogger:
             'Çıkış',
             f"Kullanıcı '{user.username}' çıkış yaptı",
             user,
-            ip_address
+            ip_address,
+            EventCode.LOGOUT,
+            {'username': user.username}
         )
     
     @staticmethod
@@ -112,54 +192,96 @@ class SecurityLogger:
             'Yetkisiz Erişim Denemesi',
             f"Kullanıcı '{user.username if user else 'Anonim'}' {resource} kaynağına erişmeye çalıştı",
             user,
-            ip_address
+            ip_address,
+            EventCode.UNAUTHORIZED_ACCESS,
+            {'resource': resource}
         )
 
 class OperationLogger:
     """İşlem olayları için özel logger"""
     
     @staticmethod
-    def log_task_created(user, task_title, ip_address):
+    def log_task_created(user, task_title, ip_address, task_id=None):
         """Görev oluşturma kaydı"""
         LogManager.log_operation_event(
             'INFO',
             'Görev Oluşturuldu',
             f"Kullanıcı '{user.username}' '{task_title}' görevini oluşturdu",
             user,
-            ip_address
+            ip_address,
+            EventCode.TASK_CREATED,
+            {'task_id': task_id, 'title': task_title}
         )
     
     @staticmethod
-    def log_task_updated(user, task_title, changes, ip_address):
-        """Görev güncelleme kaydı"""
+    def log_task_updated(user, task_title, changes, ip_address, task_id=None):
+        """Görev güncelleme kaydı; changes: {alan: (eski, yeni)}"""
         LogManager.log_operation_event(
             'INFO',
             'Görev Güncellendi',
-            f"Kullanıcı '{user.username}' '{task_title}' görevini güncelledi. Değişiklikler: {changes}",
+            f"Kullanıcı '{user.username}' '{task_title}' görevini güncelledi. Değişiklikler: {format_changes(changes)}",
             user,
-            ip_address
+            ip_address,
+            EventCode.TASK_UPDATED,
+            {
+                'task_id': task_id,
+                'title': task_title,
+                'changed_fields': list(changes),
+                'changes': {key: {'old': old, 'new': new} for key, (old, new) in changes.items()},
+            }
         )
     
     @staticmethod
-    def log_task_deleted(user, task_title, ip_address):
+    def log_task_deleted(user, task_title, ip_address, task_id=None):
         """Görev silme kaydı"""
         LogManager.log_operation_event(
             'WARNING',
             'Görev Silindi',
             f"Kullanıcı '{user.username}' '{task_title}' görevini sildi",
             user,
-            ip_address
+            ip_address,
+            EventCode.TASK_DELETED,
+            {'task_id': task_id, 'title': task_title}
+        )
+    
+    @staticmethod
+    def log_task_batch(user, summary, changes, ip_address):
+        """Toplu görev işlemi için tek kayıt; summary: {işlem: [görev id]}"""
+        counts = ", ".join(f"{op}: {len(ids)}" for op, ids in summary.items() if ids)
+        LogManager.log_operation_event(
+            'INFO',
+            'Toplu Görev İşlemi',
+            f"Kullanıcı '{user.username}' toplu görev işlemi yaptı ({counts or 'işlem yok'})",
+            user,
+            ip_address,
+            EventCode.TASK_BATCH,
+            {
+                **summary,
+                'changes': {
+                    str(task_id): {key: {'old': old, 'new': new} for key, (old, new) in task_changes.items()}
+                    for task_id, task_changes in changes.items()
+                },
+            }
         )
     
     @staticmethod
     def log_api_access(user, endpoint, method, ip_address):
-        """API erişim kaydı"""
+        """API erişim kaydı; 'aggregate' modunda sayılır, ham kayıt yalnızca örneklenirse yazılır"""
+        payload = {'endpoint': endpoint, 'method': method}
+        aggregator = get_api_access_aggregator()
+        if aggregator is not None:
+            if not aggregator.record(user, endpoint, method, ip_address):
+                return
+            payload['sampled'] = True
+            payload['sample_rate'] = aggregator.sample_rate
         LogManager.log_operation_event(
             'INFO',
             'API Erişimi',
             f"Kullanıcı '{user.username if user else 'Anonim'}' {method} {endpoint} endpoint'ine erişti",
             user,
-            ip_address
+            ip_address,
+            EventCode.API_ACCESS,
+            payload
         )
 
 class ErrorLogger:
@@ -173,7 +295,9 @@ class ErrorLogger:
             'Veri Doğrulama Hatası',
             f"Kullanıcı '{user.username if user else 'Anonim'}' {field} alanında hata: {error_message}",
             user,
-            ip_address
+            ip_address,
+            EventCode.VALIDATION_ERROR,
+            {'field': field, 'error': error_message}
         )
     
     @staticmethod
@@ -184,7 +308,9 @@ class ErrorLogger:
             'Veritabanı Hatası',
             f"Kullanıcı '{user.username if user else 'Anonim'}' {operation} işleminde veritabanı hatası: {error_message}",
             user,
-            ip_address
+            ip_address,
+            EventCode.DATABASE_ERROR,
+            {'operation': operation, 'error': error_message}
         )
     
     @staticmethod
@@ -195,5 +321,7 @@ class ErrorLogger:
             'Sistem Hatası',
             f"Sistem hatası: {error_message}",
             None,
-            ip_address
-        ) 
\ No newline at end of file
+            ip_address,
+            EventCode.SYSTEM_ERROR,
+            {'error': error_message}
+        )
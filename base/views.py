@@ -1,23 +1,48 @@
+from datetime import datetime, time, timedelta
+from itertools import islice
+
 from django.shortcuts import render, redirect
 from django.views import View
 from django.shortcuts import redirect
 from django.db import transaction
+from django.db.models import Count, FloatField, Q, Value
+from django.db.models.functions import TruncDate
 from django.http import JsonResponse, HttpResponse
 from django.views.decorators.csrf import csrf_exempt
+from django.utils import timezone
+from django.utils.dateparse import parse_date, parse_datetime
 from django.utils.decorators import method_decorator
 
 from rest_framework import generics, permissions
 from .serializers import (
-    TaskSerializer, UserProfileSerializer, TeamSerializer, TaskCommentSerializer, TaskAttachmentSerializer, TaskPrioritySerializer, TaskScheduleSerializer, TaskRecurrenceSerializer, TaskDependenceSerializer, HistorySerializer, TaskReportSerializer, UserTeamsSerializer, RegisterSerializer
+    TaskSerializer, TaskListSerializer, UserProfileSerializer, TeamSerializer, TaskCommentSerializer, TaskScopedCommentSerializer, TaskAttachmentSerializer, TaskScopedAttachmentSerializer, TaskPrioritySerializer, TaskScheduleSerializer, TaskRecurrenceSerializer, TaskDependenceSerializer, HistorySerializer, TaskReportSerializer, UserTeamsSerializer, RegisterSerializer
 )
 from .models import (
-    Task, UserProfile, Team, TaskComment, TaskAttachment, TaskPriority, TaskSchedule, TaskRecurrence, TaskDependence, History, TaskReport, UserTeams
+    Task, UserProfile, Team, TaskComment, TaskAttachment, TaskPriority, TaskSchedule, TaskRecurrence, TaskDependence, History, TaskReport, UserTeams, Log, TaskChange
 )
 
 # Logging imports
-from .utils import SecurityLogger, OperationLogger, ErrorLogger
+from .utils import SecurityLogger, OperationLogger, ErrorLogger, EventCode
+from .pagination import TaskChildPagination, TaskPagination
+from .filters import TaskFilterBackend
+from .conditional import ConditionalGetMixin, detail_etag
+from .fieldsets import SparseFieldsMixin
+from .fast_serializers import FastListMixin
+from .task_cache import get_task_list_cache
+from .task_changes import collect_changes
+from .task_stats import get_task_stats
+from .task_closure import annotate_blocking, closure_state
+from .task_graph import critical_path, load_graph, reachable_tasks, save_dependence, topological_order
+from .fulltext import search_tasks
+from .attachments import StreamingUploadMixin, attachment_response
+from .thumbnails import get_thumbnail_config, is_image, thumbnail_response
+from .recurrence import get_recurrence_config, occurrence_dates, recurrence_anchor
+from .task_calendar import build_calendar, get_calendar_config
+from .task_updates import apply_task_batch, apply_task_update, get_task_update_config, toggle_tasks
 from rest_framework.response import Response
 from rest_framework import status
+from rest_framework.views import APIView
+from rest_framework.exceptions import APIException, NotFound, ValidationError
 
 def get_client_ip(request):
     """Client IP adresini al"""
@@ -28,10 +53,75 @@ def get_client_ip(request):
         ip = request.META.get('REMOTE_ADDR')
     return ip
 
+def visible_tasks(user):
+    """Kullanıcının görebildiği görevler: admin tümünü, diğerleri yalnızca kendininkileri"""
+    if user.is_staff or user.is_superuser:
+        return Task.objects.all()
+    return Task.objects.filter(user=user)
+
+def get_date_param(request, name, default):
+    """YYYY-MM-DD sorgu parametresi; verilmemişse varsayılan, geçersizse 400"""
+    value = request.query_params.get(name)
+    if not value:
+        return default
+    parsed = parse_date(value)
+    if parsed is None:
+        raise ValidationError({name: "Geçersiz tarih (YYYY-MM-DD)."})
+    return parsed
+
+class VisibleTaskChildMixin:
+    """Düz yorum/ek uç noktaları: yalnızca kullanıcının görebildiği görevlere ait satırlar"""
+
+    def get_queryset(self):
+        queryset = super().get_queryset()
+        user = self.request.user
+        if user.is_staff or user.is_superuser:
+            return queryset
+        # Alt sorgu yerine JOIN'deki sahip kolonu
+        return queryset.filter(task__user=user)
+
+    def check_task(self, serializer):
+        task = serializer.validated_data.get('task')
+        if task is not None and not visible_tasks(self.request.user).filter(pk=task.pk).exists():
+            raise NotFound("Görev bulunamadı.")
+
+    def perform_create(self, serializer):
+        self.check_task(serializer)
+        serializer.save()
+
+    def perform_update(self, serializer):
+        self.check_task(serializer)
+        serializer.save()
+
+class TaskChildMixin:
+    """/tasks/<task_pk>/... alt kaynakları.
+
+    Üst görevin erişimi istek başında bir kez denetlenir; satırlar yalnızca
+    task_id ile (task, created_at, id) indeksinden okunur, satır başına
+    sahiplik denetimi yapılmaz.
+    """
+    pagination_class = TaskChildPagination
+    # Listede JOIN ile birlikte okunacak ilişkiler
+    related_fields = ()
+
+    def initial(self, request, *args, **kwargs):
+        super().initial(request, *args, **kwargs)
+        self.task = visible_tasks(request.user).filter(pk=kwargs['task_pk']).only('pk').first()
+        if self.task is None:
+            raise NotFound("Görev bulunamadı.")
+
+    def get_queryset(self):
+        return self.queryset.model.objects.filter(task_id=self.task.pk).select_related(*self.related_fields)
+
+    def perform_create(self, serializer):
+        serializer.save(task=self.task)
+
 # API Views
-class TaskListCreateAPI(generics.ListCreateAPIView):
+class TaskListCreateAPI(ConditionalGetMixin, SparseFieldsMixin, FastListMixin, generics.ListCreateAPIView):
     serializer_class = TaskSerializer
     permission_classes = [permissions.IsAuthenticated]
+    pagination_class = TaskPagination
+    filter_backends = [TaskFilterBackend]
 
     def get_queryset(self):
         # Admin kullanıcıları tüm görevleri görebilir
@@ -40,19 +130,49 @@ class TaskListCreateAPI(generics.ListCreateAPIView):
         # Normal kullanıcılar sadece kendi görevlerini görebilir
         return Task.objects.filter(user=self.request.user)
 
+    def get_serializer_class(self):
+        if self.request.method == 'GET':
+            return TaskListSerializer
+        return TaskSerializer
+
+    def annotate_list(self, queryset):
+        return annotate_blocking(queryset)
+
+    def get_list_state(self, queryset):
+        # Kapanış değişiklikleri görevlerin updated_at'ini değiştirmez
+        return closure_state(queryset)
+
     def perform_create(self, serializer):
         serializer.save(user=self.request.user)
         # Log görev oluşturma
         OperationLogger.log_task_created(
                 self.request.user, 
             serializer.instance.title, 
-                get_client_ip(self.request)
+                get_client_ip(self.request),
+            task_id=serializer.instance.pk
             )
 
+    def cached_list(self, request, *args, **kwargs):
+        """Kullanıcının liste önbelleğinden (varsa) veya veritabanından yanıt üret"""
+        task_cache = get_task_list_cache()
+        if task_cache is not None:
+            key, entry = task_cache.lookup(request.user, request.get_full_path())
+            if entry is not None:
+                response = self.conditional_response(request, entry['etag']) or Response(entry['data'])
+                return self.set_validators(response, entry['etag'], entry['last_modified'])
+
+        etag, last_modified = self.get_list_validators(request)
+        response = self.conditional_response(request, etag)
+        if response is None:
+            response = super().list(request, *args, **kwargs)
+            if task_cache is not None:
+                task_cache.set(key, {'data': response.data, 'etag': etag, 'last_modified': last_modified})
+        return self.set_validators(response, etag, last_modified)
+
     def list(self, request, *args, **kwargs):
-        """Liste görüntüleme"""
+        """Liste görüntüleme; değişiklik yoksa 304"""
         try:
-            response = super().list(request, *args, **kwargs)
+            response = self.cached_list(request, *args, **kwargs)
             # Log API erişimi
             OperationLogger.log_api_access(
                     request.user, 
@@ -61,55 +181,56 @@ class TaskListCreateAPI(generics.ListCreateAPIView):
                     get_client_ip(request)
                 )
             return response
+        except APIException:
+            # Geçersiz sorgu parametreleri (imleç, sayfa boyutu) istemci hatasıdır
+            raise
         except Exception as e:
             ErrorLogger.log_system_error(str(e), get_client_ip(request))
             raise
 
-class TaskDetailAPI(generics.RetrieveUpdateDestroyAPIView):
+class TaskDetailAPI(ConditionalGetMixin, SparseFieldsMixin, generics.RetrieveUpdateDestroyAPIView):
     serializer_class = TaskSerializer
     permission_classes = [permissions.IsAuthenticated]
 
-    def get_queryset(self):
+    def base_queryset(self):
         # Admin kullanıcıları tüm görevleri görebilir
         if self.request.user.is_staff or self.request.user.is_superuser:
             return Task.objects.all()
         # Normal kullanıcılar sadece kendi görevlerini görebilir
         return Task.objects.filter(user=self.request.user)
 
+    def get_queryset(self):
+        queryset = self.base_queryset()
+        # Güncelleme sırasında satırı kilitle (ayarlarda açıksa)
+        if self.request.method in ('PUT', 'PATCH') and get_task_update_config()['SELECT_FOR_UPDATE']:
+            queryset = queryset.select_for_update()
+        return queryset
+
+    def retrieve(self, request, *args, **kwargs):
+        """Görev detayı; değişiklik yoksa 304 (yalnızca ETag ile, Last-Modified saniye çözünürlüklüdür)"""
+        etag, last_modified = self.get_detail_validators(request)
+        response = self.conditional_response(request, etag)
+        if response is None:
+            response = super().retrieve(request, *args, **kwargs)
+        return self.set_validators(response, etag, last_modified)
+
     def update(self, request, *args, **kwargs):
-        """Görev güncelleme"""
+        """Görev güncelleme: satır bir kez okunur, yalnızca değişen alanlar yazılır.
+
+        If-Match gönderilirse okunan satırın ETag'iyle eşleşmelidir, aksi halde 412.
+        """
+        partial = kwargs.pop('partial', False)
         try:
-            old_task = self.get_object()
-            old_data = {
-                'title': old_task.title,
-                'description': old_task.description,
-                'status': old_task.status,
-                'priority': old_task.priority,
-                'due_date': str(old_task.due_date) if old_task.due_date else None
-            }
-            response = super().update(request, *args, **kwargs)
-            new_task = self.get_object()
-            new_data = {
-                'title': new_task.title,
-                'description': new_task.description,
-                'status': new_task.status,
-                'priority': new_task.priority,
-                'due_date': str(new_task.due_date) if new_task.due_date else None
-            }
-            # Değişen alanları bul
-            changes = []
-            for key in old_data:
-                if old_data[key] != new_data[key]:
-                    changes.append(f"{key}: '{old_data[key]}' → '{new_data[key]}'")
-            changes_str = ", ".join(changes) if changes else "Değişiklik yok"
-            # Log görev güncelleme
-            OperationLogger.log_task_updated(
-                    request.user, 
-                new_task.title, 
-                changes_str, 
-                    get_client_ip(request)
-                )
-            return response
+            with transaction.atomic():
+                task = self.get_object()
+                self.check_if_match(request, task)
+                serializer = self.get_serializer(task, data=request.data, partial=partial)
+                serializer.is_valid(raise_exception=True)
+                apply_task_update(task, serializer.validated_data, request.user, get_client_ip(request))
+            etag = detail_etag(task.pk, task.version, task.updated_at)
+            return self.set_validators(Response(serializer.data), etag, task.updated_at)
+        except APIException:
+            raise
         except Exception as e:
             ErrorLogger.log_system_error(str(e), get_client_ip(request))
             raise
@@ -119,156 +240,519 @@ class TaskDetailAPI(generics.RetrieveUpdateDestroyAPIView):
         try:
             task = self.get_object()
             task_title = task.title
+            task_id = task.pk
             response = super().destroy(request, *args, **kwargs)
             # Log görev silme
             OperationLogger.log_task_deleted(
                     request.user, 
                     task_title, 
-                    get_client_ip(request)
+                    get_client_ip(request),
+                    task_id=task_id
                 )
             return response
         except Exception as e:
             ErrorLogger.log_system_error(str(e), get_client_ip(request))
             raise
 
+class TaskBatchAPI(APIView):
+    """Toplu görev işlemleri: create, update, delete ve toggle tek istekte ve tek işlemde.
+
+    Gövde: {"operations": [{"op": "update", "id": 5, "data": {...}}, ...]}
+    """
+    permission_classes = [permissions.IsAuthenticated]
+
+    def get_queryset(self):
+        # Admin kullanıcıları tüm görevleri görebilir
+        if self.request.user.is_staff or self.request.user.is_superuser:
+            return Task.objects.all()
+        # Normal kullanıcılar sadece kendi görevlerini görebilir
+        return Task.objects.filter(user=self.request.user)
+
+    def post(self, request):
+        operations = request.data.get('operations') if isinstance(request.data, dict) else request.data
+        try:
+            applied, results = apply_task_batch(operations, self.get_queryset(), request.user, get_client_ip(request))
+        except APIException:
+            raise
+        except Exception as e:
+            ErrorLogger.log_system_error(str(e), get_client_ip(request))
+            raise
+        return Response({'results': results}, status=status.HTTP_200_OK if applied else status.HTTP_400_BAD_REQUEST)
+
+class TaskChangesAPI(APIView):
+    """Delta senkronizasyon: imleçten sonra oluşturulan/güncellenen görevler ve silinenlerin id'leri.
+
+    `?since=` verilmezse değişiklik döndürülmez, yalnızca başlangıç imleci verilir.
+    """
+    permission_classes = [permissions.IsAuthenticated]
+
+    def get(self, request):
+        user = request.user
+        if user.is_staff or user.is_superuser:
+            journal, tasks = TaskChange.objects.all(), Task.objects.all()
+        else:
+            journal, tasks = TaskChange.objects.filter(user=user), Task.objects.filter(user=user)
+        changed, deleted, cursor, has_more = collect_changes(
+            journal, tasks, request.query_params.get('since'), request.query_params.get('limit'),
+        )
+        return Response({
+            'changes': TaskSerializer(changed, many=True, context={'request': request}).data,
+            'deleted': deleted,
+            'cursor': cursor,
+            'has_more': has_more,
+        })
+
+class TaskStatsAPI(APIView):
+    """Görev panosu: durum, öncelik ve gecikme sayıları.
+
+    Sayaçlar açıksa (TASK_STATS['COUNTERS']) görev sayısından bağımsız olarak
+    kullanıcının sayaç satırlarından, değilse tek bir toplama sorgusundan üretilir.
+    """
+    permission_classes = [permissions.IsAuthenticated]
+
+    def get(self, request):
+        stats, source = get_task_stats(request.user)
+        return Response({**stats, 'source': source})
+
+class TaskSearchAPI(SparseFieldsMixin, generics.ListAPIView):
+    """Görev başlığı, açıklaması ve yorumlarında sıralı tam metin arama: `?q=`.
+
+    Sonuçlar eşleşme skoruna göre sıralanır ve `?limit=` (varsayılan 20, en fazla 100)
+    kadar döndürülür.
+    """
+    serializer_class = TaskSerializer
+    permission_classes = [permissions.IsAuthenticated]
+    pagination_class = None
+    default_limit = 20
+    max_limit = 100
+
+    def get_queryset(self):
+        # Görev listesiyle aynı görünürlük kuralları
+        if self.request.user.is_staff or self.request.user.is_superuser:
+            return Task.objects.all()
+        return Task.objects.filter(user=self.request.user)
+
+    def get_limit(self):
+        value = self.request.query_params.get('limit')
+        if value is None:
+            return self.default_limit
+        try:
+            limit = int(value)
+        except ValueError:
+            raise ValidationError({'limit': "Geçersiz sayı."})
+        if limit < 1:
+            raise ValidationError({'limit': "En az 1 olmalıdır."})
+        return min(limit, self.max_limit)
+
+    def list(self, request, *args, **kwargs):
+        term = request.query_params.get('q', '').strip()
+        if not term:
+            raise ValidationError({'q': "Arama ifadesi gereklidir."})
+        limit = self.get_limit()
+        queryset = self.filter_queryset(self.get_queryset())
+        results = search_tasks(queryset, term)
+        if results is None:
+            # Tam metin desteği yoksa LIKE taramasına düş
+            matches = queryset.filter(
+                Q(title__icontains=term) | Q(description__icontains=term) | Q(taskcomment__comment__icontains=term)
+            ).values('pk').distinct()
+            results = queryset.filter(pk__in=matches).annotate(search_rank=Value(0.0, output_field=FloatField())).order_by('-updated_at', '-pk')
+        tasks = list(results[:limit])
+        data = self.get_serializer(tasks, many=True).data
+        for item, task in zip(data, tasks):
+            item['rank'] = task.search_rank
+        return Response({'query': term, 'results': data})
+
 class TaskToggleCompleteView(View):
     def post(self, request, pk):
         try:
-            task = Task.objects.get(pk=pk)
-            # Sadece görev sahibi veya admin değiştirebilir
-            if task.user == request.user or request.user.is_staff or request.user.is_superuser:
-                task.status = 'pending' if task.status == 'completed' else 'completed'
-                task.save()
-                return JsonResponse({'status': 'success', 'new_status': task.status})
-            else:
+            if not request.user.is_authenticated:
                 return JsonResponse({'status': 'error', 'message': 'Yetkisiz erişim'}, status=403)
-        except Task.DoesNotExist:
-            return JsonResponse({'status': 'error', 'message': 'Görev bulunamadı'}, status=404)
+            # Sahiplik denetimi ve durum çevirme tek koşullu UPDATE'tir
+            toggled = toggle_tasks([pk], visible_tasks(request.user), request.user)
+            if pk not in toggled:
+                return JsonResponse({'status': 'error', 'message': 'Görev bulunamadı'}, status=404)
+            return JsonResponse({'status': 'success', 'new_status': toggled[pk][1]})
         except Exception as e:
             ErrorLogger.log_system_error(str(e), get_client_ip(request))
             return JsonResponse({'status': 'error', 'message': 'Sistem hatası'}, status=500)
 
+class TaskBulkToggleAPI(APIView):
+    """Birden çok görevin durumunu tek sorguda çevir: {"ids": [1, 2, 3]}"""
+    permission_classes = [permissions.IsAuthenticated]
+
+    def post(self, request):
+        ids = request.data.get('ids') if isinstance(request.data, dict) else None
+        max_ids = get_task_update_config()['BATCH_MAX_OPERATIONS']
+        if not isinstance(ids, list) or not ids:
+            raise ValidationError({'ids': "Boş olmayan bir liste olmalıdır."})
+        if len(ids) > max_ids:
+            raise ValidationError({'ids': f"Tek istekte en fazla {max_ids} görev gönderilebilir."})
+        try:
+            ids = [int(task_id) for task_id in ids]
+        except (TypeError, ValueError):
+            raise ValidationError({'ids': "Geçerli görev id'leri gerekli."})
+        try:
+            toggled = toggle_tasks(ids, visible_tasks(request.user), request.user)
+            if toggled:
+                OperationLogger.log_task_batch(
+                    request.user, {'toggle': sorted(toggled)},
+                    {task_id: {'status': statuses} for task_id, statuses in toggled.items()},
+                    get_client_ip(request),
+                )
+        except Exception as e:
+            ErrorLogger.log_system_error(str(e), get_client_ip(request))
+            raise
+        return Response({
+            'results': [{'id': task_id, 'status': toggled[task_id][1]} for task_id in sorted(toggled)],
+            'not_found': sorted(set(ids) - set(toggled)),
+        })
+
+class TaskListCacheStatsAPI(APIView):
+    """Görev listesi önbelleği isabet/ıska sayaçları (yalnızca admin, süreç bazında)"""
+    permission_classes = [permissions.IsAdminUser]
+
+    def get(self, request):
+        task_cache = get_task_list_cache()
+        if task_cache is None:
+            return Response({'enabled': False})
+        return Response({'enabled': True, **task_cache.stats()})
+
 # UserProfile API Views
-class UserProfileListCreateAPI(generics.ListCreateAPIView):
+class UserProfileListCreateAPI(SparseFieldsMixin, FastListMixin, generics.ListCreateAPIView):
     queryset = UserProfile.objects.all()
     serializer_class = UserProfileSerializer
     permission_classes = [permissions.IsAuthenticated]
 
-class UserProfileDetailAPI(generics.RetrieveUpdateDestroyAPIView):
+class UserProfileDetailAPI(SparseFieldsMixin, generics.RetrieveUpdateDestroyAPIView):
     queryset = UserProfile.objects.all()
     serializer_class = UserProfileSerializer
     permission_classes = [permissions.IsAuthenticated]
 
 # Team API Views
-class TeamListCreateAPI(generics.ListCreateAPIView):
+class TeamListCreateAPI(SparseFieldsMixin, FastListMixin, generics.ListCreateAPIView):
     queryset = Team.objects.all()
     serializer_class = TeamSerializer
     permission_classes = [permissions.IsAuthenticated]
 
-class TeamDetailAPI(generics.RetrieveUpdateDestroyAPIView):
+class TeamDetailAPI(SparseFieldsMixin, generics.RetrieveUpdateDestroyAPIView):
     queryset = Team.objects.all()
     serializer_class = TeamSerializer
     permission_classes = [permissions.IsAuthenticated]
 
 # TaskComment API Views
-class TaskCommentListCreateAPI(generics.ListCreateAPIView):
+class TaskCommentListCreateAPI(VisibleTaskChildMixin, SparseFieldsMixin, FastListMixin, generics.ListCreateAPIView):
     queryset = TaskComment.objects.all()
     serializer_class = TaskCommentSerializer
     permission_classes = [permissions.IsAuthenticated]
 
-class TaskCommentDetailAPI(generics.RetrieveUpdateDestroyAPIView):
+    def perform_create(self, serializer):
+        self.check_task(serializer)
+        serializer.save(user=self.request.user)
+
+class TaskCommentDetailAPI(VisibleTaskChildMixin, SparseFieldsMixin, generics.RetrieveUpdateDestroyAPIView):
     queryset = TaskComment.objects.all()
     serializer_class = TaskCommentSerializer
     permission_classes = [permissions.IsAuthenticated]
 
+class TaskCommentsAPI(TaskChildMixin, SparseFieldsMixin, FastListMixin, generics.ListCreateAPIView):
+    """Görevin yorumları: (created_at, id) keyset sayfalı, yazar adıyla"""
+    queryset = TaskComment.objects.all()
+    serializer_class = TaskScopedCommentSerializer
+    permission_classes = [permissions.IsAuthenticated]
+    related_fields = ('user',)
+
+    def perform_create(self, serializer):
+        serializer.save(task=self.task, user=self.request.user)
+
 # TaskAttachment API Views
-class TaskAttachmentListCreateAPI(generics.ListCreateAPIView):
+class TaskAttachmentListCreateAPI(StreamingUploadMixin, VisibleTaskChildMixin, SparseFieldsMixin, FastListMixin, generics.ListCreateAPIView):
     queryset = TaskAttachment.objects.all()
     serializer_class = TaskAttachmentSerializer
     permission_classes = [permissions.IsAuthenticated]
 
-class TaskAttachmentDetailAPI(generics.RetrieveUpdateDestroyAPIView):
+class TaskAttachmentDetailAPI(StreamingUploadMixin, VisibleTaskChildMixin, SparseFieldsMixin, generics.RetrieveUpdateDestroyAPIView):
     queryset = TaskAttachment.objects.all()
     serializer_class = TaskAttachmentSerializer
     permission_classes = [permissions.IsAuthenticated]
 
+class TaskAttachmentsAPI(StreamingUploadMixin, TaskChildMixin, SparseFieldsMixin, FastListMixin, generics.ListCreateAPIView):
+    """Görevin ekleri: (created_at, id) keyset sayfalı; yükleme multipart ile"""
+    queryset = TaskAttachment.objects.all()
+    serializer_class = TaskScopedAttachmentSerializer
+    permission_classes = [permissions.IsAuthenticated]
+
+class TaskAttachmentDownloadAPI(APIView):
+    """Ek içeriğini indir: Range/If-Range, ETag (içerik özeti) ve isteğe bağlı X-Sendfile/X-Accel-Redirect"""
+    permission_classes = [permissions.IsAuthenticated]
+
+    def get(self, request, pk):
+        attachment = TaskAttachment.objects.filter(task__in=visible_tasks(request.user), pk=pk).first()
+        response = attachment_response(request, attachment) if attachment is not None else None
+        if response is None:
+            raise NotFound("Ek bulunamadı.")
+        return response
+
+class TaskAttachmentThumbnailAPI(APIView):
+    """Görüntü ekinin küçük resmi (JPEG); içerik özetiyle sürümlenir, uzun süre önbelleğe alınabilir"""
+    permission_classes = [permissions.IsAuthenticated]
+
+    def get(self, request, pk, size):
+        attachment = (
+            TaskAttachment.objects.filter(task__in=visible_tasks(request.user), pk=pk)
+            .only('pk', 'file_name', 'file_path', 'content_hash', 'content_type').first()
+        )
+        if attachment is None or size not in get_thumbnail_config()['SIZES'] or not is_image(attachment):
+            raise NotFound("Küçük resim bulunamadı.")
+        response = thumbnail_response(request, attachment, size)
+        if response is None:
+            raise NotFound("Küçük resim üretilemedi.")
+        return response
+
 # TaskPriority API Views
-class TaskPriorityListCreateAPI(generics.ListCreateAPIView):
+class TaskPriorityListCreateAPI(SparseFieldsMixin, FastListMixin, generics.ListCreateAPIView):
     queryset = TaskPriority.objects.all()
     serializer_class = TaskPrioritySerializer
     permission_classes = [permissions.IsAuthenticated]
 
-class TaskPriorityDetailAPI(generics.RetrieveUpdateDestroyAPIView):
+class TaskPriorityDetailAPI(SparseFieldsMixin, generics.RetrieveUpdateDestroyAPIView):
     queryset = TaskPriority.objects.all()
     serializer_class = TaskPrioritySerializer
     permission_classes = [permissions.IsAuthenticated]
 
 # TaskSchedule API Views
-class TaskScheduleListCreateAPI(generics.ListCreateAPIView):
+class TaskScheduleListCreateAPI(SparseFieldsMixin, FastListMixin, generics.ListCreateAPIView):
     queryset = TaskSchedule.objects.all()
     serializer_class = TaskScheduleSerializer
     permission_classes = [permissions.IsAuthenticated]
 
-class TaskScheduleDetailAPI(generics.RetrieveUpdateDestroyAPIView):
+class TaskScheduleDetailAPI(SparseFieldsMixin, generics.RetrieveUpdateDestroyAPIView):
     queryset = TaskSchedule.objects.all()
     serializer_class = TaskScheduleSerializer
     permission_classes = [permissions.IsAuthenticated]
 
 # TaskRecurrence API Views
-class TaskRecurrenceListCreateAPI(generics.ListCreateAPIView):
+class TaskRecurrenceListCreateAPI(SparseFieldsMixin, FastListMixin, generics.ListCreateAPIView):
     queryset = TaskRecurrence.objects.all()
     serializer_class = TaskRecurrenceSerializer
     permission_classes = [permissions.IsAuthenticated]
 
-class TaskRecurrenceDetailAPI(generics.RetrieveUpdateDestroyAPIView):
+class TaskRecurrenceDetailAPI(SparseFieldsMixin, generics.RetrieveUpdateDestroyAPIView):
     queryset = TaskRecurrence.objects.all()
     serializer_class = TaskRecurrenceSerializer
     permission_classes = [permissions.IsAuthenticated]
 
+class CalendarAPI(APIView):
+    """Takvim: bitiş tarihi, plan tarihi veya tekrarı aralığa düşen görevler, güne göre gruplu"""
+    permission_classes = [permissions.IsAuthenticated]
+
+    def get(self, request):
+        config = get_calendar_config()
+        start = get_date_param(request, 'start', timezone.localdate())
+        end = get_date_param(request, 'end', start + timedelta(days=config['DEFAULT_DAYS'] - 1))
+        if end < start:
+            raise ValidationError({'end': "Bitiş başlangıçtan önce olamaz."})
+        if (end - start).days >= config['MAX_DAYS']:
+            raise ValidationError({'end': f"Aralık en fazla {config['MAX_DAYS']} gün olabilir."})
+        return Response({
+            'start': start,
+            'end': end,
+            'days': build_calendar(request.user, start, end),
+        })
+
+class TaskRecurrenceOccurrencesAPI(APIView):
+    """Tekrarın verilen aralıktaki örnek tarihleri (görev oluşturmadan, üreteçten okunur)"""
+    permission_classes = [permissions.IsAuthenticated]
+
+    def get(self, request, pk):
+        recurrence = (
+            TaskRecurrence.objects.filter(task__in=visible_tasks(request.user))
+            .select_related('task').filter(pk=pk).first()
+        )
+        if recurrence is None:
+            raise NotFound("Tekrar bulunamadı.")
+        config = get_recurrence_config()
+        start = get_date_param(request, 'start', timezone.localdate())
+        end = get_date_param(request, 'end', start + timedelta(days=config['HORIZON_DAYS']))
+        if end < start:
+            raise ValidationError({'end': "Bitiş başlangıçtan önce olamaz."})
+
+        limit = config['PREVIEW_LIMIT']
+        dates = list(islice(
+            occurrence_dates(recurrence_anchor(recurrence, recurrence.task), recurrence.recurrence_type, start, end),
+            limit + 1,
+        ))
+        return Response({
+            'recurrence': recurrence.pk,
+            'start': start,
+            'end': end,
+            'occurrences': dates[:limit],
+            'truncated': len(dates) > limit,
+        })
+
 # TaskDependence API Views
-class TaskDependenceListCreateAPI(generics.ListCreateAPIView):
+class TaskDependenceListCreateAPI(SparseFieldsMixin, FastListMixin, generics.ListCreateAPIView):
     queryset = TaskDependence.objects.all()
     serializer_class = TaskDependenceSerializer
     permission_classes = [permissions.IsAuthenticated]
 
-class TaskDependenceDetailAPI(generics.RetrieveUpdateDestroyAPIView):
+    def perform_create(self, serializer):
+        # Döngü oluşturan bağımlılıklar reddedilir
+        save_dependence(serializer)
+
+class TaskDependenceDetailAPI(SparseFieldsMixin, generics.RetrieveUpdateDestroyAPIView):
     queryset = TaskDependence.objects.all()
     serializer_class = TaskDependenceSerializer
     permission_classes = [permissions.IsAuthenticated]
 
+    def perform_update(self, serializer):
+        save_dependence(serializer)
+
+# Task dependency graph API Views
+class TaskGraphOrderAPI(APIView):
+    """Görünür görevlerin bağımlılıklara göre topolojik sırası.
+
+    Hazır görevler arasında bitiş tarihi yakın olan önce gelir; döngüdeki görevler
+    (döngü denetiminden önce kaydedilmişse) `cycles` altında döner.
+    """
+    permission_classes = [permissions.IsAuthenticated]
+
+    def get(self, request):
+        nodes, edges = load_graph(visible_tasks(request.user))
+        order, cyclic = topological_order(nodes, edges)
+        return Response({
+            'results': [nodes[node_id] for node_id in order],
+            'cycles': cyclic,
+        })
+
+class TaskCriticalPathAPI(APIView):
+    """Açık görevler arasında bitiş tarihine göre en az boşluklu (en riskli) bağımlılık zinciri"""
+    permission_classes = [permissions.IsAuthenticated]
+
+    def get(self, request):
+        nodes, edges = load_graph(visible_tasks(request.user))
+        path, slack = critical_path(nodes, edges)
+        return Response({
+            'path': [nodes[node_id] for node_id in path],
+            'length': len(path),
+            'slack_days': slack,
+        })
+
+class TaskDependencyTreeAPI(APIView):
+    """Görevi geçişli olarak engelleyen (blocked-by) veya onun engellediği (blocks) görevler"""
+    permission_classes = [permissions.IsAuthenticated]
+    downstream = False
+
+    def get(self, request, pk):
+        tasks = visible_tasks(request.user)
+        if not tasks.filter(pk=pk).exists():
+            raise NotFound("Görev bulunamadı.")
+        depths = reachable_tasks(pk, downstream=self.downstream)
+        rows = tasks.filter(pk__in=depths).values('id', 'title', 'status', 'due_date') if depths else []
+        results = sorted(({**row, 'depth': depths[row['id']]} for row in rows), key=lambda row: (row['depth'], row['id']))
+        return Response({'task': pk, 'results': results})
+
 # History API Views
-class HistoryListCreateAPI(generics.ListCreateAPIView):
+class HistoryListCreateAPI(SparseFieldsMixin, FastListMixin, generics.ListCreateAPIView):
     queryset = History.objects.all()
     serializer_class = HistorySerializer
     permission_classes = [permissions.IsAuthenticated]
 
-class HistoryDetailAPI(generics.RetrieveUpdateDestroyAPIView):
+class HistoryDetailAPI(SparseFieldsMixin, generics.RetrieveUpdateDestroyAPIView):
     queryset = History.objects.all()
     serializer_class = HistorySerializer
     permission_classes = [permissions.IsAuthenticated]
 
 # TaskReport API Views
-class TaskReportListCreateAPI(generics.ListCreateAPIView):
+class TaskReportListCreateAPI(SparseFieldsMixin, FastListMixin, generics.ListCreateAPIView):
     queryset = TaskReport.objects.all()
     serializer_class = TaskReportSerializer
     permission_classes = [permissions.IsAuthenticated]
 
-class TaskReportDetailAPI(generics.RetrieveUpdateDestroyAPIView):
+class TaskReportDetailAPI(SparseFieldsMixin, generics.RetrieveUpdateDestroyAPIView):
     queryset = TaskReport.objects.all()
     serializer_class = TaskReportSerializer
     permission_classes = [permissions.IsAuthenticated]
 
 # UserTeams API Views
-class UserTeamsListCreateAPI(generics.ListCreateAPIView):
+class UserTeamsListCreateAPI(SparseFieldsMixin, FastListMixin, generics.ListCreateAPIView):
     queryset = UserTeams.objects.all()
     serializer_class = UserTeamsSerializer
     permission_classes = [permissions.IsAuthenticated]
 
-class UserTeamsDetailAPI(generics.RetrieveUpdateDestroyAPIView):
+class UserTeamsDetailAPI(SparseFieldsMixin, generics.RetrieveUpdateDestroyAPIView):
     queryset = UserTeams.objects.all()
     serializer_class = UserTeamsSerializer
     permission_classes = [permissions.IsAuthenticated]
 
+# Log istatistik API Views
+TRACKED_TASK_FIELDS = ['title', 'description', 'status', 'priority', 'due_date']
+
+def parse_time_param(value, end_of_day=False):
+    """Tarih veya tarih-saat sorgu parametresini timezone-aware datetime'a çevir"""
+    parsed = parse_datetime(value)
+    if parsed is None:
+        day = parse_date(value)
+        if day is None:
+            raise ValueError(value)
+        parsed = datetime.combine(day, time.max if end_of_day else time.min)
+    if timezone.is_naive(parsed):
+        parsed = timezone.make_aware(parsed)
+    return parsed
+
+class LogStatsMixin:
+    permission_classes = [permissions.IsAdminUser]
+
+    def get_log_queryset(self, request):
+        """since/until aralığındaki loglar; superuser olmayan adminler sadece kendi loglarını görür"""
+        until = request.query_params.get('until')
+        since = request.query_params.get('since')
+        until = parse_time_param(until, end_of_day=True) if until else timezone.now()
+        since = parse_time_param(since) if since else until - timedelta(days=7)
+        queryset = Log.objects.filter(timestamp__gte=since, timestamp__lte=until)
+        if not request.user.is_superuser:
+            queryset = queryset.filter(user=request.user)
+        return queryset, since, until
+
+class LogEventStatsAPI(LogStatsMixin, APIView):
+    """Olay koduna (ve istenirse güne) göre log sayıları"""
+
+    def get(self, request):
+        try:
+            queryset, since, until = self.get_log_queryset(request)
+        except ValueError as e:
+            return Response({'detail': f"Geçersiz tarih: {e}"}, status=status.HTTP_400_BAD_REQUEST)
+        event_code = request.query_params.get('event_code')
+        if event_code:
+            queryset = queryset.filter(event_code=event_code)
+        group_fields = ['event_code']
+        if request.query_params.get('interval') == 'day':
+            queryset = queryset.annotate(day=TruncDate('timestamp'))
+            group_fields.insert(0, 'day')
+        results = queryset.order_by().values(*group_fields).annotate(count=Count('id')).order_by(*group_fields)
+        return Response({'since': since, 'until': until, 'results': list(results)})
+
+class LogFieldChangeStatsAPI(LogStatsMixin, APIView):
+    """Görev güncellemelerinde hangi alanın kaç kez değiştiği (tek sorgu)"""
+
+    def get(self, request):
+        try:
+            queryset, since, until = self.get_log_queryset(request)
+        except ValueError as e:
+            return Response({'detail': f"Geçersiz tarih: {e}"}, status=status.HTTP_400_BAD_REQUEST)
+        queryset = queryset.filter(event_code=EventCode.TASK_UPDATED)
+        task_id = request.query_params.get('task')
+        if task_id:
+            if not task_id.isdigit():
+                return Response({'detail': "Geçersiz görev id."}, status=status.HTTP_400_BAD_REQUEST)
+            queryset = queryset.filter(payload__task_id=int(task_id))
+        aggregates = {'total_updates': Count('id')}
+        for field in TRACKED_TASK_FIELDS:
+            aggregates[field] = Count('id', filter=Q(payload__changes__has_key=field))
+        counts = queryset.aggregate(**aggregates)
+        total = counts.pop('total_updates')
+        return Response({'since': since, 'until': until, 'total_updates': total, 'fields': counts})
+
 class RegisterAPIView(generics.CreateAPIView):
     serializer_class = RegisterSerializer
     permission_classes = [permissions.AllowAny]
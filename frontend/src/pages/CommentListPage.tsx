@@ -1,35 +1,33 @@
 import React, { useState, useEffect } from 'react';
 import { taskCommentAPI } from '../services/api';
+import { TaskComment } from '../types';
 import './CommentListPage.css';
 
-interface TaskComment {
-  id: number;
-  task: number;
-  user: number;
-  content: string;
-  created: string;
-}
-
 const CommentListPage: React.FC = () => {
+  const [taskId, setTaskId] = useState(1); // Varsayılan task ID
   const [comments, setComments] = useState<TaskComment[]>([]);
+  const [nextCursor, setNextCursor] = useState<string | null>(null);
   const [loading, setLoading] = useState(true);
   const [error, setError] = useState('');
   const [showCreateForm, setShowCreateForm] = useState(false);
-  const [newComment, setNewComment] = useState({
-    task: 1, // Varsayılan task ID
-    content: '',
-  });
+  const [newComment, setNewComment] = useState('');
 
   useEffect(() => {
     fetchComments();
-  }, []);
+    // eslint-disable-next-line react-hooks/exhaustive-deps
+  }, [taskId]);
 
-  const fetchComments = async () => {
+  // Yalnızca seçili görevin yorumları, sayfa sayfa (sunucu tarafında görev indeksinden)
+  const fetchComments = async (cursor?: string | null) => {
     try {
-      const response = await taskCommentAPI.getAll();
-      const data = response.data as TaskComment[];
-      setComments(data);
+      const response = await taskCommentAPI.getPage(taskId, cursor);
+      const page = response.data;
+      setComments(cursor ? [...comments, ...page.results] : page.results);
+      setNextCursor(page.next);
+      setError('');
     } catch (err: any) {
+      setComments([]);
+      setNextCursor(null);
       setError('Yorumlar yüklenirken bir hata oluştu');
     } finally {
       setLoading(false);
@@ -39,8 +37,8 @@ const CommentListPage: React.FC = () => {
   const handleCreateComment = async (e: React.FormEvent) => {
     e.preventDefault();
     try {
-      await taskCommentAPI.create(newComment);
-      setNewComment({ task: 1, content: '' });
+      await taskCommentAPI.createForTask(taskId, newComment);
+      setNewComment('');
       setShowCreateForm(false);
       fetchComments();
     } catch (err: any) {
@@ -70,26 +68,27 @@ const CommentListPage: React.FC = () => {
         </button>
       </header>
 
+      <div className="form-group">
+        <label>Görev ID</label>
+        <input
+          type="number"
+          value={taskId}
+          onChange={(e) => setTaskId(parseInt(e.target.value) || 1)}
+          min={1}
+        />
+      </div>
+
       {error && <div className="error-message">{error}</div>}
 
       {showCreateForm && (
         <div className="create-comment-form">
           <h3>Yeni Yorum Ekle</h3>
           <form onSubmit={handleCreateComment}>
-            <div className="form-group">
-              <label>Görev ID</label>
-              <input
-                type="number"
-                value={newComment.task}
-                onChange={(e) => setNewComment({ ...newComment, task: parseInt(e.target.value) })}
-                required
-              />
-            </div>
             <div className="form-group">
               <label>Yorum</label>
               <textarea
-                value={newComment.content}
-                onChange={(e) => setNewComment({ ...newComment, content: e.target.value })}
+                value={newComment}
+                onChange={(e) => setNewComment(e.target.value)}
                 required
                 rows={3}
               />
@@ -119,16 +118,22 @@ const CommentListPage: React.FC = () => {
               </div>
             </div>
             
-            <p className="comment-content">{comment.content}</p>
+            <p className="comment-content">{comment.comment}</p>
             
             <div className="comment-meta">
-              <span>Kullanıcı: {comment.user}</span>
-              <span>Tarih: {new Date(comment.created).toLocaleDateString('tr-TR')}</span>
+              <span>Kullanıcı: {comment.username ?? comment.user ?? '-'}</span>
+              <span>Tarih: {new Date(comment.created_at).toLocaleDateString('tr-TR')}</span>
             </div>
           </div>
         ))}
       </div>
 
+      {nextCursor && (
+        <button onClick={() => fetchComments(nextCursor)} className="btn-secondary">
+          Daha fazla yükle
+        </button>
+      )}
+
       {comments.length === 0 && !loading && (
         <div className="no-comments">
           <p>Henüz yorum bulunmuyor.</p>
@@ -18,7 +18,17 @@ import {
   RegisterData,
   TokenResponse,
   ApiResponse,
-  PaginatedResponse
+  PaginatedResponse,
+  CursorPaginatedResponse,
+  TaskChangesResponse,
+  TaskSearchResponse,
+  TaskStats,
+  TaskBulkToggleResponse,
+  TaskDependencyTree,
+  TaskGraphOrder,
+  TaskCriticalPath,
+  TaskRecurrenceOccurrences,
+  CalendarResponse
 } from '../types';
 
 const API_BASE_URL = 'http://localhost:8000';
@@ -71,6 +81,17 @@ const handleApiError = (error: any): string => {
   return error.message || 'Bir hata oluştu';
 };
 
+// Sayfalı liste endpoint'lerinin tüm sayfalarını `next` imleçlerini izleyerek topla
+const getAllPages = async <T = any>(url: string): Promise<ApiResponse<T[]>> => {
+  let response = await api.get(url);
+  const results: T[] = [...(response.data as CursorPaginatedResponse<T>).results];
+  while ((response.data as CursorPaginatedResponse<T>).next) {
+    response = await api.get((response.data as CursorPaginatedResponse<T>).next as string);
+    results.push(...(response.data as CursorPaginatedResponse<T>).results);
+  }
+  return { ...response, data: results } as ApiResponse<T[]>;
+};
+
 // Auth API
 export const authAPI = {
   login: async (credentials: LoginCredentials): Promise<ApiResponse<TokenResponse>> => {
@@ -129,8 +150,7 @@ export const authAPI = {
 export const taskAPI = {
   getAll: async (): Promise<ApiResponse<Task[]>> => {
     try {
-      const response = await api.get(`/api/${API_VERSION}/tasks/`);
-      return response as ApiResponse<Task[]>;
+      return await getAllPages<Task>(`/api/${API_VERSION}/tasks/`);
     } catch (error) {
       throw new Error(handleApiError(error));
     }
@@ -151,9 +171,10 @@ export const taskAPI = {
       throw new Error(handleApiError(error));
     }
   },
-  update: async (id: number, taskData: UpdateTaskData): Promise<ApiResponse<Task>> => {
+  // etag verilirse (GET yanıtındaki ETag) görev arada değiştiyse 412 döner
+  update: async (id: number, taskData: UpdateTaskData, etag?: string): Promise<ApiResponse<Task>> => {
     try {
-      const response = await api.put(`/api/${API_VERSION}/tasks/${id}/`, taskData);
+      const response = await api.put(`/api/${API_VERSION}/tasks/${id}/`, taskData, etag ? { headers: { 'If-Match': etag } } : {});
       return response as ApiResponse<Task>;
     } catch (error) {
       throw new Error(handleApiError(error));
@@ -175,13 +196,78 @@ export const taskAPI = {
       throw new Error(handleApiError(error));
     }
   },
+  bulkToggle: async (ids: number[]): Promise<ApiResponse<TaskBulkToggleResponse>> => {
+    try {
+      const response = await api.post(`/api/${API_VERSION}/tasks/toggle/`, { ids });
+      return response as ApiResponse<TaskBulkToggleResponse>;
+    } catch (error) {
+      throw new Error(handleApiError(error));
+    }
+  },
+  // since verilmezse yalnızca başlangıç imleci döner; süresi dolmuş imleçte liste yeniden yüklenmelidir
+  getChanges: async (since?: string): Promise<ApiResponse<TaskChangesResponse>> => {
+    try {
+      const response = await api.get(`/api/${API_VERSION}/tasks/changes/`, { params: since ? { since } : {} });
+      return response as ApiResponse<TaskChangesResponse>;
+    } catch (error) {
+      throw new Error(handleApiError(error));
+    }
+  },
+  getBlockedBy: async (id: number): Promise<ApiResponse<TaskDependencyTree>> => {
+    try {
+      const response = await api.get(`/api/${API_VERSION}/tasks/${id}/blocked-by/`);
+      return response as ApiResponse<TaskDependencyTree>;
+    } catch (error) {
+      throw new Error(handleApiError(error));
+    }
+  },
+  getBlocks: async (id: number): Promise<ApiResponse<TaskDependencyTree>> => {
+    try {
+      const response = await api.get(`/api/${API_VERSION}/tasks/${id}/blocks/`);
+      return response as ApiResponse<TaskDependencyTree>;
+    } catch (error) {
+      throw new Error(handleApiError(error));
+    }
+  },
+  getDependencyOrder: async (): Promise<ApiResponse<TaskGraphOrder>> => {
+    try {
+      const response = await api.get(`/api/${API_VERSION}/tasks/graph/order/`);
+      return response as ApiResponse<TaskGraphOrder>;
+    } catch (error) {
+      throw new Error(handleApiError(error));
+    }
+  },
+  getCriticalPath: async (): Promise<ApiResponse<TaskCriticalPath>> => {
+    try {
+      const response = await api.get(`/api/${API_VERSION}/tasks/graph/critical-path/`);
+      return response as ApiResponse<TaskCriticalPath>;
+    } catch (error) {
+      throw new Error(handleApiError(error));
+    }
+  },
+  getStats: async (): Promise<ApiResponse<TaskStats>> => {
+    try {
+      const response = await api.get(`/api/${API_VERSION}/tasks/stats/`);
+      return response as ApiResponse<TaskStats>;
+    } catch (error) {
+      throw new Error(handleApiError(error));
+    }
+  },
+  search: async (q: string, limit?: number): Promise<ApiResponse<TaskSearchResponse>> => {
+    try {
+      const response = await api.get(`/api/${API_VERSION}/tasks/search/`, { params: limit ? { q, limit } : { q } });
+      return response as ApiResponse<TaskSearchResponse>;
+    } catch (error) {
+      throw new Error(handleApiError(error));
+    }
+  },
 };
 
 // UserProfile API
 export const userProfileAPI = {
   getAll: async () => {
     try {
-      const response = await api.get(`/api/${API_VERSION}/userprofiles/`);
+      const response = await getAllPages(`/api/${API_VERSION}/userprofiles/`);
       return response;
     } catch (error) {
       throw new Error(handleApiError(error));
@@ -225,7 +311,7 @@ export const userProfileAPI = {
 export const teamAPI = {
   getAll: async () => {
     try {
-      const response = await api.get(`/api/${API_VERSION}/teams/`);
+      const response = await getAllPages(`/api/${API_VERSION}/teams/`);
       return response;
     } catch (error) {
       throw new Error(handleApiError(error));
@@ -269,7 +355,7 @@ export const teamAPI = {
 export const taskCommentAPI = {
   getAll: async () => {
     try {
-      const response = await api.get(`/api/${API_VERSION}/taskcomments/`);
+      const response = await getAllPages(`/api/${API_VERSION}/taskcomments/`);
       return response;
     } catch (error) {
       throw new Error(handleApiError(error));
@@ -307,10 +393,26 @@ export const taskCommentAPI = {
       throw new Error(handleApiError(error));
     }
   },
-  getByTask: async (taskId: number) => {
+  getByTask: async (taskId: number): Promise<ApiResponse<TaskComment[]>> => {
     try {
-      const response = await api.get(`/api/${API_VERSION}/taskcomments/?task=${taskId}`);
-      return response;
+      return await getAllPages<TaskComment>(`/api/${API_VERSION}/tasks/${taskId}/comments/`);
+    } catch (error) {
+      throw new Error(handleApiError(error));
+    }
+  },
+  // Tek sayfa; sonraki sayfa için yanıttaki next adresi cursor olarak verilir
+  getPage: async (taskId: number, cursor?: string | null): Promise<ApiResponse<CursorPaginatedResponse<TaskComment>>> => {
+    try {
+      const response = await api.get(cursor || `/api/${API_VERSION}/tasks/${taskId}/comments/`);
+      return response as ApiResponse<CursorPaginatedResponse<TaskComment>>;
+    } catch (error) {
+      throw new Error(handleApiError(error));
+    }
+  },
+  createForTask: async (taskId: number, comment: string): Promise<ApiResponse<TaskComment>> => {
+    try {
+      const response = await api.post(`/api/${API_VERSION}/tasks/${taskId}/comments/`, { comment });
+      return response as ApiResponse<TaskComment>;
     } catch (error) {
       throw new Error(handleApiError(error));
     }
@@ -321,7 +423,7 @@ export const taskCommentAPI = {
 export const taskAttachmentAPI = {
   getAll: async () => {
     try {
-      const response = await api.get(`/api/${API_VERSION}/taskattachments/`);
+      const response = await getAllPages(`/api/${API_VERSION}/taskattachments/`);
       return response;
     } catch (error) {
       throw new Error(handleApiError(error));
@@ -359,9 +461,45 @@ export const taskAttachmentAPI = {
       throw new Error(handleApiError(error));
     }
   },
-  getByTask: async (taskId: number) => {
+  getByTask: async (taskId: number): Promise<ApiResponse<TaskAttachment[]>> => {
+    try {
+      return await getAllPages<TaskAttachment>(`/api/${API_VERSION}/tasks/${taskId}/attachments/`);
+    } catch (error) {
+      throw new Error(handleApiError(error));
+    }
+  },
+  // Dosya multipart olarak yüklenir; sunucu içeriği diske akıtıp özetler
+  upload: async (taskId: number, file: File, fileName?: string): Promise<ApiResponse<TaskAttachment>> => {
     try {
-      const response = await api.get(`/api/${API_VERSION}/taskattachments/?task=${taskId}`);
+      const formData = new FormData();
+      formData.append('file', file);
+      if (fileName) {
+        formData.append('file_name', fileName);
+      }
+      const response = await api.post(`/api/${API_VERSION}/tasks/${taskId}/attachments/`, formData, {
+        headers: { 'Content-Type': 'multipart/form-data' },
+      });
+      return response as ApiResponse<TaskAttachment>;
+    } catch (error) {
+      throw new Error(handleApiError(error));
+    }
+  },
+  // previews içindeki adreslerden biri; yanıt uzun süre önbelleğe alınabilir
+  getThumbnail: async (previewUrl: string) => {
+    try {
+      const response = await api.get(previewUrl, { responseType: 'blob' });
+      return response;
+    } catch (error) {
+      throw new Error(handleApiError(error));
+    }
+  },
+  // range verilirse (ör. 'bytes=0-1048575') yalnızca o parça döner (206)
+  download: async (id: number, range?: string) => {
+    try {
+      const response = await api.get(`/api/${API_VERSION}/taskattachments/${id}/download/`, {
+        responseType: 'blob',
+        headers: range ? { Range: range } : {},
+      });
       return response;
     } catch (error) {
       throw new Error(handleApiError(error));
@@ -373,7 +511,7 @@ export const taskAttachmentAPI = {
 export const taskPriorityAPI = {
   getAll: async () => {
     try {
-      const response = await api.get(`/api/${API_VERSION}/taskpriorities/`);
+      const response = await getAllPages(`/api/${API_VERSION}/taskpriorities/`);
       return response;
     } catch (error) {
       throw new Error(handleApiError(error));
@@ -417,7 +555,7 @@ export const taskPriorityAPI = {
 export const taskScheduleAPI = {
   getAll: async () => {
     try {
-      const response = await api.get(`/api/${API_VERSION}/taskschedules/`);
+      const response = await getAllPages(`/api/${API_VERSION}/taskschedules/`);
       return response;
     } catch (error) {
       throw new Error(handleApiError(error));
@@ -461,7 +599,7 @@ export const taskScheduleAPI = {
 export const taskRecurrenceAPI = {
   getAll: async () => {
     try {
-      const response = await api.get(`/api/${API_VERSION}/taskrecurrences/`);
+      const response = await getAllPages(`/api/${API_VERSION}/taskrecurrences/`);
       return response;
     } catch (error) {
       throw new Error(handleApiError(error));
@@ -499,13 +637,33 @@ export const taskRecurrenceAPI = {
       throw new Error(handleApiError(error));
     }
   },
+  getOccurrences: async (id: number, start?: string, end?: string): Promise<ApiResponse<TaskRecurrenceOccurrences>> => {
+    try {
+      const response = await api.get(`/api/${API_VERSION}/taskrecurrences/${id}/occurrences/`, { params: { start, end } });
+      return response as ApiResponse<TaskRecurrenceOccurrences>;
+    } catch (error) {
+      throw new Error(handleApiError(error));
+    }
+  },
+};
+
+// Calendar API
+export const calendarAPI = {
+  get: async (start?: string, end?: string): Promise<ApiResponse<CalendarResponse>> => {
+    try {
+      const response = await api.get(`/api/${API_VERSION}/calendar/`, { params: { start, end } });
+      return response as ApiResponse<CalendarResponse>;
+    } catch (error) {
+      throw new Error(handleApiError(error));
+    }
+  },
 };
 
 // TaskDependence API
 export const taskDependenceAPI = {
   getAll: async () => {
     try {
-      const response = await api.get(`/api/${API_VERSION}/taskdependences/`);
+      const response = await getAllPages(`/api/${API_VERSION}/taskdependences/`);
       return response;
     } catch (error) {
       throw new Error(handleApiError(error));
@@ -549,7 +707,7 @@ export const taskDependenceAPI = {
 export const historyAPI = {
   getAll: async () => {
     try {
-      const response = await api.get(`/api/${API_VERSION}/histories/`);
+      const response = await getAllPages(`/api/${API_VERSION}/histories/`);
       return response;
     } catch (error) {
       throw new Error(handleApiError(error));
@@ -593,7 +751,7 @@ export const historyAPI = {
 export const taskReportAPI = {
   getAll: async () => {
     try {
-      const response = await api.get(`/api/${API_VERSION}/taskreports/`);
+      const response = await getAllPages(`/api/${API_VERSION}/taskreports/`);
       return response;
     } catch (error) {
       throw new Error(handleApiError(error));
@@ -637,7 +795,7 @@ export const taskReportAPI = {
 export const userTeamsAPI = {
   getAll: async () => {
     try {
-      const response = await api.get(`/api/${API_VERSION}/userteams/`);
+      const response = await getAllPages(`/api/${API_VERSION}/userteams/`);
       return response;
     } catch (error) {
       throw new Error(handleApiError(error));
@@ -32,7 +32,14 @@ export interface Task {
   due_date: string | null;
   created_at: string;
   updated_at: string;
+  version: number;
   user: number;
+  // Tekrardan üretilen örneklerde kaynak tekrar ve örnek tarihi
+  recurrence: number | null;
+  occurrence_date: string | null;
+  // Yalnızca liste yanıtlarında
+  is_blocked?: boolean;
+  blocking_count?: number;
 }
 
 export interface CreateTaskData {
@@ -69,6 +76,7 @@ export interface TaskComment {
   id: number;
   task: number;
   user?: number;
+  username?: string | null;  // Yalnızca /tasks/{id}/comments/ yanıtında
   comment: string;
   created_at: string;
   updated_at: string;
@@ -80,6 +88,10 @@ export interface TaskAttachment {
   task: number;
   file_name: string;
   file_path: string;
+  content_hash: string;  // İçeriğin SHA-256 özeti; indirmede ETag olarak kullanılır
+  size: number | null;
+  content_type: string;
+  previews: Record<string, string> | null;  // Görüntüler için {boyut: küçük resim adresi}
   created_at: string;
   updated_at: string;
 }
@@ -99,6 +111,8 @@ export interface TaskSchedule {
   task: number;
   schedule_date?: string;
   reminder_date?: string;
+  reminder_sent: boolean;
+  reminder_sent_at: string | null;
   created_at: string;
   updated_at: string;
 }
@@ -108,10 +122,41 @@ export interface TaskRecurrence {
   id: number;
   task: number;
   recurrence_type: 'daily' | 'weekly' | 'monthly' | 'yearly';
+  generated_until: string | null;
   created_at: string;
   updated_at: string;
 }
 
+// Calendar Types
+export interface CalendarTask {
+  id: number;
+  title: string;
+  status: Task['status'];
+  priority: Task['priority'];
+  due_date: string | null;
+}
+
+export interface CalendarItem {
+  type: 'due' | 'schedule' | 'recurrence';
+  task: CalendarTask;
+  schedule?: number;
+  recurrence?: number;
+}
+
+export interface CalendarResponse {
+  start: string;
+  end: string;
+  days: { date: string; items: CalendarItem[] }[];
+}
+
+export interface TaskRecurrenceOccurrences {
+  recurrence: number;
+  start: string;
+  end: string;
+  occurrences: string[];
+  truncated: boolean;
+}
+
 // Task Dependence Types
 export interface TaskDependence {
   id: number;
@@ -163,6 +208,62 @@ export interface PaginatedResponse<T> {
   results: T[];
 }
 
+// Cursor (keyset) pagination: liste endpoint'leri toplam sayı döndürmez
+export interface CursorPaginatedResponse<T> {
+  next: string | null;
+  previous: string | null;
+  results: T[];
+}
+
+// Delta senkronizasyon: /tasks/changes/?since=<cursor>
+export interface TaskChangesResponse {
+  changes: Task[];
+  deleted: number[];
+  cursor: string;
+  has_more: boolean;
+}
+
+export interface TaskBulkToggleResponse {
+  results: { id: number; status: Task['status'] }[];
+  not_found: number[];
+}
+
+export interface TaskGraphNode {
+  id: number;
+  title: string;
+  status: Task['status'];
+  due_date: string | null;
+}
+
+export interface TaskDependencyTree {
+  task: number;
+  results: (TaskGraphNode & { depth: number })[];
+}
+
+export interface TaskGraphOrder {
+  results: TaskGraphNode[];
+  cycles: number[];
+}
+
+export interface TaskCriticalPath {
+  path: TaskGraphNode[];
+  length: number;
+  slack_days: number | null;
+}
+
+export interface TaskStats {
+  total: number;
+  by_status: Record<Task['status'], number>;
+  by_priority: Record<Task['priority'], number>;
+  overdue: number;
+  source: 'counters' | 'aggregate';
+}
+
+export interface TaskSearchResponse {
+  query: string;
+  results: (Task & { rank: number })[];
+}
+
 // Filter Types
 export interface TaskFilters {
   status?: string;
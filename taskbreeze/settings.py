@@ -143,6 +143,9 @@ REST_FRAMEWORK = {
     'DEFAULT_PERMISSION_CLASSES': (
         'rest_framework.permissions.IsAuthenticated',
     ),
+    # Tüm liste endpoint'leri keyset (imleç) sayfalama kullanır; page_size en fazla 200
+    'DEFAULT_PAGINATION_CLASS': 'base.pagination.KeysetPagination',
+    'PAGE_SIZE': 50,
 }
 
 # JWT Ayarları
@@ -201,6 +204,15 @@ CORS_ALLOW_HEADERS = [
     'user-agent',
     'x-csrftoken',
     'x-requested-with',
+    'if-none-match',
+    'if-match',
+    'if-modified-since',
+]
+
+# Koşullu GET (304) için istemcinin okuyabileceği doğrulayıcı başlıkları
+CORS_EXPOSE_HEADERS = [
+    'etag',
+    'last-modified',
 ]
 
 # Security Settings
@@ -261,6 +273,155 @@ logs_dir = os.path.join(BASE_DIR, 'logs')
 if not os.path.exists(logs_dir):
     os.makedirs(logs_dir)
 
+# Log tamponu: Log kayıtları istek içinde tek tek yazılmak yerine
+# sınırlı bir kuyrukta toplanır ve arka planda bulk_create ile yazılır.
+# OVERFLOW_POLICY: 'drop' (kuyruk doluysa kaydı at ve say) veya
+# 'block' (BLOCK_TIMEOUT saniye bekle, sonra at ve say)
+LOG_BUFFER = {
+    'ENABLED': True,
+    'MAX_SIZE': 10000,
+    'BATCH_SIZE': 500,
+    'FLUSH_INTERVAL': 2.0,
+    'OVERFLOW_POLICY': 'drop',
+    'BLOCK_TIMEOUT': 1.0,
+}
+
+# Log saklama: MAX_AGE_DAYS gününden eski Log kayıtları
+# `python manage.py archive_logs` ile ARCHIVE_DIR altına aylık
+# gzip'li JSONL dosyalarına taşınır ve partiler halinde silinir.
+# POSTGRES_PARTITIONING açıksa (ve tablo `archive_logs --convert-to-partitions`
+# ile dönüştürüldüyse) eski aylar DETACH + DROP ile kaldırılır.
+LOG_RETENTION = {
+    'MAX_AGE_DAYS': 90,
+    'ARCHIVE_DIR': os.path.join(BASE_DIR, 'logs', 'archive'),
+    'CHUNK_SIZE': 5000,
+    'DELETE_BATCH_SIZE': 1000,
+    'POSTGRES_PARTITIONING': False,
+    'PARTITIONS_AHEAD': 3,
+    'INTERVAL': 3600,
+}
+
+# API erişim logları: 'raw' (varsayılan) her istek için bir Log kaydı yazar.
+# 'aggregate' modu isteğe bağlıdır: erişimler (kullanıcı, endpoint, metod, pencere)
+# bazında bellekte sayılır ve her WINDOW_SECONDS penceresi için tek bir toplu kayıt
+# yazılır; ham kayıt yalnızca SAMPLE_RATE oranında örneklenir. Sayılar kesindir.
+API_ACCESS_LOG = {
+    'MODE': 'raw',
+    'WINDOW_SECONDS': 60,
+    'SAMPLE_RATE': 0.01,
+}
+
+# Görev güncelleme: SELECT_FOR_UPDATE açıksa TaskDetailAPI güncellenecek
+# satırı işlem boyunca kilitler (eşzamanlı güncellemeler sıraya girer).
+# BATCH_MAX_OPERATIONS: /api/v1/tasks/batch/ isteğindeki en fazla işlem sayısı.
+TASK_UPDATE = {
+    'SELECT_FOR_UPDATE': True,
+    'BATCH_MAX_OPERATIONS': 500,
+}
+
+# Önbellek: görev listesi önbelleğinin arka ucu TASK_CACHE_BACKEND ortam
+# değişkeniyle seçilir (locmem | file | redis). 'redis' django-redis ile Redis
+# protokolünü konuşan herhangi bir sunucuyla (ör. yerel bir Redis/Valkey) çalışır;
+# Django 3.2'de yerleşik Redis arka ucu yoktur.
+TASK_CACHE_BACKENDS = {
+    'locmem': {
+        'BACKEND': 'django.core.cache.backends.locmem.LocMemCache',
+        'LOCATION': 'taskbreeze-task-list',
+    },
+    'file': {
+        'BACKEND': 'django.core.cache.backends.filebased.FileBasedCache',
+        'LOCATION': os.path.join(BASE_DIR, 'cache', 'task_list'),
+    },
+    'redis': {
+        'BACKEND': 'django_redis.cache.RedisCache',
+        'LOCATION': os.environ.get('TASK_CACHE_URL', 'redis://127.0.0.1:6379/1'),
+        'OPTIONS': {
+            'CLIENT_CLASS': 'django_redis.client.DefaultClient',
+        },
+    },
+}
+
+CACHES = {
+    'default': {
+        'BACKEND': 'django.core.cache.backends.locmem.LocMemCache',
+    },
+    'task_list': TASK_CACHE_BACKENDS[os.environ.get('TASK_CACHE_BACKEND', 'locmem')],
+}
+
+# Görev listesi yanıt önbelleği: kullanıcı bazında sürümlü anahtarlar,
+# Task post_save/post_delete sinyalleriyle geçersiz kılınır.
+TASK_LIST_CACHE = {
+    'ENABLED': True,
+    'ALIAS': 'task_list',
+    'TIMEOUT': 300,
+    'KEY_PREFIX': 'task_list',
+}
+
+# Delta senkronizasyon (/api/v1/tasks/changes/): TaskChange günlüğü
+# RETENTION_DAYS gün tutulur (`python manage.py prune_task_changes`); daha eski
+# imleçler 410 döndürür. SETTLE_SECONDS'tan yeni kayıtlar bir sonraki yoklamaya kalır.
+TASK_CHANGES = {
+    'RETENTION_DAYS': 30,
+    'SETTLE_SECONDS': 2,
+    'PAGE_SIZE': 500,
+    'MAX_PAGE_SIZE': 1000,
+}
+
+# Görev panosu (/api/v1/tasks/stats/): kullanıcı sayaçları tablosu
+# Kapalıyken açılırsa önce `python manage.py rebuild_task_counters` çalıştırılmalı
+TASK_STATS = {
+    'COUNTERS': True,
+}
+
+# Tekrarlanan görevler: örnekler HORIZON_DAYS gün ilerisine kadar görev olarak
+# üretilir (`python manage.py materialize_recurrences`, zamanlayıcıdan veya --interval ile)
+TASK_RECURRENCE = {
+    'HORIZON_DAYS': 30,
+    'BATCH_SIZE': 1000,
+    'PREVIEW_LIMIT': 366,
+}
+
+# Takvim (/api/v1/calendar/): en uzun aralık ve varsayılan gün sayısı
+TASK_CALENDAR = {
+    'MAX_DAYS': 366,
+    'DEFAULT_DAYS': 31,
+}
+
+# Hatırlatmalar: `python manage.py dispatch_reminders` (cron veya --interval ile işçi)
+# NOTIFIER send(reminders) metodu olan bir sınıftır: base.reminders.LogNotifier,
+# FileNotifier (NOTIFIER_OPTIONS={'path': ...}) veya MemoryNotifier
+TASK_REMINDERS = {
+    'NOTIFIER': 'base.reminders.LogNotifier',
+    'NOTIFIER_OPTIONS': {},
+    'BATCH_SIZE': 500,
+}
+
+# Ek dosyaları: içerik adresli (sha256) blob deposu. SENDFILE 'x-sendfile' (Apache)
+# veya 'x-accel-redirect' (nginx, ROOT'u ACCEL_PREFIX altında internal sunmalı)
+# olursa indirme gövdesi proxy'ye bırakılır. Sahipsiz blob'lar:
+# `python manage.py prune_attachments`
+ATTACHMENT_STORAGE = {
+    'ROOT': os.environ.get('ATTACHMENT_ROOT', os.path.join(BASE_DIR, 'attachments')),
+    'MAX_SIZE': 50 * 1024 * 1024,
+    'CHUNK_SIZE': 64 * 1024,
+    'SENDFILE': os.environ.get('ATTACHMENT_SENDFILE') or None,
+    'ACCEL_PREFIX': '/protected-attachments/',
+    'ORPHAN_GRACE_SECONDS': 3600,
+}
+
+# Görüntü eklerinin küçük resimleri: ek kaydedilince WORKERS süreçli havuzda
+# arka planda üretilir ve ROOT/thumbnails altında içerik özetiyle saklanır.
+# Mevcut ekler için: `python manage.py generate_thumbnails`
+ATTACHMENT_THUMBNAILS = {
+    'SIZES': (128, 512),
+    'WORKERS': 2,
+    'QUEUE_SIZE': 64,
+    'MAX_PIXELS': 50_000_000,
+    'QUALITY': 85,
+    'RENDER_TIMEOUT': 10,
+    'CACHE_SECONDS': 365 * 24 * 3600,
+}
+
 # Admin Panel Logging Settings
 ADMIN_LOG_ENTRIES = True
 ADMIN_LOG_ENTRIES_LIMIT = 50